@@ -0,0 +1,46 @@
+# backend/alembic/env.py
+
+from logging.config import fileConfig
+
+from alembic import context
+
+from app.db.database import engine
+from app.db import models
+
+config = context.config
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+# Used by `alembic revision --autogenerate` to diff the models against the DB
+target_metadata = models.Base.metadata
+
+
+def run_migrations_offline():
+    """Writes the migration SQL to stdout (`alembic upgrade head --sql`)."""
+    context.configure(
+        url=str(engine.url),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        render_as_batch=engine.dialect.name == "sqlite",
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    """Runs the migrations against DATABASE_URL."""
+    with engine.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            # SQLite cannot ALTER most things in place; batch mode copies the table
+            render_as_batch=connection.dialect.name == "sqlite",
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
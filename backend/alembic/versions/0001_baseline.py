@@ -0,0 +1,106 @@
+"""baseline schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+
+The schema as it was when tables were still made by create_all() at startup.
+Databases from that time already have some or all of these tables, so this
+revision only creates what is missing. It also adds the password reset
+columns, which create_all() never added to an existing users table.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    tables = set(inspector.get_table_names())
+
+    if "users" not in tables:
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("full_name", sa.String()),
+            sa.Column("email", sa.String(), nullable=False),
+            sa.Column("hashed_password", sa.String(), nullable=False),
+            sa.Column("is_active", sa.Boolean()),
+            sa.Column("dob", sa.Date()),
+            sa.Column("address", sa.String()),
+            sa.Column("reset_password_token", sa.String(), nullable=True),
+            sa.Column("reset_token_expires_at", sa.DateTime(), nullable=True),
+            sa.UniqueConstraint("reset_password_token"),
+        )
+        op.create_index("ix_users_id", "users", ["id"])
+        op.create_index("ix_users_full_name", "users", ["full_name"])
+        op.create_index("ix_users_email", "users", ["email"], unique=True)
+    else:
+        columns = {column["name"] for column in inspector.get_columns("users")}
+        with op.batch_alter_table("users") as batch_op:
+            if "reset_password_token" not in columns:
+                batch_op.add_column(sa.Column("reset_password_token", sa.String(), nullable=True))
+                batch_op.create_unique_constraint("uq_users_reset_password_token", ["reset_password_token"])
+            if "reset_token_expires_at" not in columns:
+                batch_op.add_column(sa.Column("reset_token_expires_at", sa.DateTime(), nullable=True))
+
+    if "medications" not in tables:
+        op.create_table(
+            "medications",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("name", sa.String(), nullable=False),
+            sa.Column("dosage", sa.String(), nullable=False),
+            sa.Column("timing_type", sa.String()),
+            sa.Column("meal_timing", sa.String(), nullable=True),
+            sa.Column("specific_time", sa.Time(), nullable=True),
+            sa.Column("frequency", sa.String()),
+            sa.Column("last_taken_at", sa.DateTime(), nullable=True),
+            sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id")),
+        )
+        op.create_index("ix_medications_id", "medications", ["id"])
+
+    if "appointments" not in tables:
+        op.create_table(
+            "appointments",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("doctor_name", sa.String(), nullable=False),
+            sa.Column("appointment_datetime", sa.DateTime(), nullable=False),
+            sa.Column("location", sa.String()),
+            sa.Column("purpose", sa.String()),
+            sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id")),
+        )
+        op.create_index("ix_appointments_id", "appointments", ["id"])
+
+    if "emergency_contacts" not in tables:
+        op.create_table(
+            "emergency_contacts",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("contact_name", sa.String(), nullable=False),
+            sa.Column("phone_number", sa.String(), nullable=False),
+            sa.Column("relationship_type", sa.String()),
+            sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id")),
+        )
+        op.create_index("ix_emergency_contacts_id", "emergency_contacts", ["id"])
+
+    if "health_tips" not in tables:
+        op.create_table(
+            "health_tips",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("tip_text", sa.Text(), nullable=False),
+            sa.Column("category", sa.String()),
+        )
+        op.create_index("ix_health_tips_id", "health_tips", ["id"])
+
+
+def downgrade():
+    op.drop_table("health_tips")
+    op.drop_table("emergency_contacts")
+    op.drop_table("appointments")
+    op.drop_table("medications")
+    op.drop_table("users")
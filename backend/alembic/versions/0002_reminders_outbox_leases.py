@@ -0,0 +1,76 @@
+"""reminder preferences, email outbox and scheduler leases
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+
+Existing users have no timezone or reminder time yet, so they all get the
+slot of DEFAULT_TIMEZONE / DEFAULT_REMINDER_TIME, computed the same way the
+app does; the hourly refresh_reminder_slots job (app/utils/scheduler.py)
+keeps it up to date from then on.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.reminder_slots import compute_reminder_slot
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.add_column(sa.Column("timezone", sa.String(), nullable=True))
+        batch_op.add_column(sa.Column("reminder_time", sa.Time(), nullable=True))
+        batch_op.add_column(sa.Column("reminder_slot", sa.Integer(), nullable=True))
+        batch_op.create_index("ix_users_reminder_slot", ["reminder_slot"])
+    # Without a slot users would get no reminder until the next refresh
+    users = sa.table("users", sa.column("reminder_slot", sa.Integer()))
+    op.execute(users.update().values(reminder_slot=compute_reminder_slot(None, None)))
+
+    with op.batch_alter_table("medications") as batch_op:
+        batch_op.add_column(sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True))
+        batch_op.create_index("ix_medications_updated_at", ["updated_at"])
+
+    op.create_table(
+        "email_outbox",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("idempotency_key", sa.String(), nullable=True),
+        sa.Column("recipient_email", sa.String(), nullable=False),
+        sa.Column("subject", sa.String(), nullable=False),
+        sa.Column("html_content", sa.Text(), nullable=False),
+        sa.Column("text_content", sa.Text(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.UniqueConstraint("idempotency_key"),
+    )
+    op.create_index("ix_email_outbox_id", "email_outbox", ["id"])
+    op.create_index("ix_email_outbox_status_next_attempt", "email_outbox", ["status", "next_attempt_at"])
+
+    op.create_table(
+        "scheduler_leases",
+        sa.Column("name", sa.String(), primary_key=True),
+        sa.Column("holder", sa.String(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table("scheduler_leases")
+    op.drop_table("email_outbox")
+    with op.batch_alter_table("medications") as batch_op:
+        batch_op.drop_index("ix_medications_updated_at")
+        batch_op.drop_column("updated_at")
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_index("ix_users_reminder_slot")
+        batch_op.drop_column("reminder_slot")
+        batch_op.drop_column("reminder_time")
+        batch_op.drop_column("timezone")
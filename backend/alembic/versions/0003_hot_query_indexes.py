@@ -0,0 +1,53 @@
+"""composite and partial indexes for the hot queries
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+
+owner_id was not indexed anywhere, so every per-user lookup scanned the
+whole table. Checked by `python -m benchmarks.explain_hot_queries`.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+DOSE_SCHEDULE_WHERE = "timing_type = 'Specific-Time' AND frequency = 'Daily' AND specific_time IS NOT NULL"
+PENDING_WHERE = "status = 'pending'"
+
+
+def upgrade():
+    op.create_index(
+        "ix_medications_owner_frequency_last_taken", "medications", ["owner_id", "frequency", "last_taken_at"]
+    )
+    op.create_index(
+        "ix_medications_dose_schedule", "medications", ["owner_id", "specific_time"],
+        postgresql_where=sa.text(DOSE_SCHEDULE_WHERE), sqlite_where=sa.text(DOSE_SCHEDULE_WHERE),
+    )
+    op.create_index("ix_appointments_owner_datetime", "appointments", ["owner_id", "appointment_datetime"])
+    op.create_index("ix_emergency_contacts_owner_id", "emergency_contacts", ["owner_id"])
+
+    op.create_index("ix_users_reminder_slot_id", "users", ["reminder_slot", "id"])
+    op.drop_index("ix_users_reminder_slot", table_name="users")
+
+    op.create_index(
+        "ix_email_outbox_pending_due", "email_outbox", ["next_attempt_at"],
+        postgresql_where=sa.text(PENDING_WHERE), sqlite_where=sa.text(PENDING_WHERE),
+    )
+    op.drop_index("ix_email_outbox_status_next_attempt", table_name="email_outbox")
+
+
+def downgrade():
+    op.create_index("ix_email_outbox_status_next_attempt", "email_outbox", ["status", "next_attempt_at"])
+    op.drop_index("ix_email_outbox_pending_due", table_name="email_outbox")
+    op.create_index("ix_users_reminder_slot", "users", ["reminder_slot"])
+    op.drop_index("ix_users_reminder_slot_id", table_name="users")
+    op.drop_index("ix_emergency_contacts_owner_id", table_name="emergency_contacts")
+    op.drop_index("ix_appointments_owner_datetime", table_name="appointments")
+    op.drop_index("ix_medications_dose_schedule", table_name="medications")
+    op.drop_index("ix_medications_owner_frequency_last_taken", table_name="medications")
@@ -0,0 +1,44 @@
+"""seed health tips
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+
+A starter set of tips so the dashboard has something to rotate through.
+Only inserted into an empty health_tips table.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+TIPS = [
+    ("Stay hydrated by drinking plenty of water throughout the day.", "General"),
+    ("Take your medicines at the same time every day; linking them to a meal helps you remember.", "Medication"),
+    ("Keep an up-to-date list of your medicines and show it at every doctor's visit.", "Medication"),
+    ("A 20-minute walk most days keeps joints flexible and the heart strong.", "Exercise"),
+    ("Gentle stretching in the morning eases stiffness and helps balance.", "Exercise"),
+    ("Fill half your plate with vegetables and fruit at lunch and dinner.", "Diet"),
+    ("Cut down on added salt; herbs and lemon add flavour without raising blood pressure.", "Diet"),
+    ("Keep a night light on the way to the bathroom to prevent falls.", "Safety"),
+    ("Aim for 7 to 8 hours of sleep and keep a regular bedtime.", "Sleep"),
+    ("Call a friend or family member today; staying connected is good for your mood.", "Wellbeing"),
+]
+
+
+def upgrade():
+    health_tips = sa.table("health_tips", sa.column("tip_text", sa.Text), sa.column("category", sa.String))
+    connection = op.get_bind()
+    if connection.execute(sa.select(sa.func.count()).select_from(health_tips)).scalar():
+        return
+    op.bulk_insert(health_tips, [{"tip_text": text, "category": category} for text, category in TIPS])
+
+
+def downgrade():
+    health_tips = sa.table("health_tips", sa.column("tip_text", sa.Text))
+    op.execute(health_tips.delete().where(health_tips.c.tip_text.in_([text for text, _ in TIPS])))
@@ -0,0 +1,65 @@
+"""dose event log and daily/weekly adherence rollups
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+
+Marking a medication as taken used to only overwrite medications.last_taken_at.
+Every dose now goes into dose_events, and the rollup tables are updated in
+the same transaction. Existing last_taken_at values are not backfilled: one
+timestamp per medication is not a history.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "dose_events",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("medication_id", sa.Integer(), sa.ForeignKey("medications.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("taken_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("local_date", sa.Date(), nullable=False),
+        sa.Column("taken_month", sa.Date(), nullable=False),
+    )
+    op.create_index("ix_dose_events_id", "dose_events", ["id"])
+    op.create_index("ix_dose_events_medication_month", "dose_events", ["medication_id", "taken_month", "id"])
+    op.create_index("ix_dose_events_owner_month", "dose_events", ["owner_id", "taken_month"])
+
+    op.create_table(
+        "dose_rollups_daily",
+        sa.Column("medication_id", sa.Integer(), sa.ForeignKey("medications.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("doses_taken", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_dose_rollups_daily_owner_day", "dose_rollups_daily", ["owner_id", "day"])
+
+    op.create_table(
+        "dose_rollups_weekly",
+        sa.Column("medication_id", sa.Integer(), sa.ForeignKey("medications.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("week_start", sa.Date(), primary_key=True),
+        sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("doses_taken", sa.Integer(), nullable=False),
+        sa.Column("days_taken", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_dose_rollups_weekly_owner_week", "dose_rollups_weekly", ["owner_id", "week_start"])
+
+
+def downgrade():
+    op.drop_index("ix_dose_rollups_weekly_owner_week", table_name="dose_rollups_weekly")
+    op.drop_table("dose_rollups_weekly")
+    op.drop_index("ix_dose_rollups_daily_owner_day", table_name="dose_rollups_daily")
+    op.drop_table("dose_rollups_daily")
+    op.drop_index("ix_dose_events_owner_month", table_name="dose_events")
+    op.drop_index("ix_dose_events_medication_month", table_name="dose_events")
+    op.drop_index("ix_dose_events_id", table_name="dose_events")
+    op.drop_table("dose_events")
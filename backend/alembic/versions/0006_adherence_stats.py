@@ -0,0 +1,55 @@
+"""precomputed adherence stats
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+
+adherence_stats holds the figures served by the analytics API, refreshed in
+the background from dose_rollups_daily. medications.created_at tells from
+which day a dose is expected; it stays NULL for existing medications, whose
+first logged dose is used instead.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("medications") as batch_op:
+        batch_op.add_column(sa.Column("created_at", sa.DateTime(timezone=True), nullable=True))
+
+    op.create_table(
+        "adherence_stats",
+        sa.Column("medication_id", sa.Integer(), sa.ForeignKey("medications.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("window_days", sa.Integer(), primary_key=True),
+        sa.Column("owner_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False),
+        sa.Column("computed_for", sa.Date(), nullable=False),
+        sa.Column("expected_days", sa.Integer(), nullable=False),
+        sa.Column("days_taken", sa.Integer(), nullable=False),
+        sa.Column("doses_taken", sa.Integer(), nullable=False),
+        sa.Column("adherence_pct", sa.Float(), nullable=True),
+        sa.Column("current_streak", sa.Integer(), nullable=False),
+        sa.Column("longest_streak", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_adherence_stats_owner_window", "adherence_stats", ["owner_id", "window_days"])
+
+    op.create_table(
+        "aggregate_refresh_state",
+        sa.Column("name", sa.String(), primary_key=True),
+        sa.Column("last_event_id", sa.Integer(), nullable=False),
+        sa.Column("last_run_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_table("aggregate_refresh_state")
+    op.drop_index("ix_adherence_stats_owner_window", table_name="adherence_stats")
+    op.drop_table("adherence_stats")
+    with op.batch_alter_table("medications") as batch_op:
+        batch_op.drop_column("created_at")
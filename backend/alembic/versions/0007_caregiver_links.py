@@ -0,0 +1,37 @@
+"""caregiver links
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+
+Lets one user (a caregiver or clinic nurse) see the dashboards of the
+patients who linked them.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "caregiver_links",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("caregiver_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("patient_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint("caregiver_id", "patient_id", name="uq_caregiver_links_caregiver_patient"),
+    )
+    op.create_index("ix_caregiver_links_id", "caregiver_links", ["id"])
+    op.create_index("ix_caregiver_links_patient_id", "caregiver_links", ["patient_id"])
+
+
+def downgrade():
+    op.drop_index("ix_caregiver_links_patient_id", table_name="caregiver_links")
+    op.drop_index("ix_caregiver_links_id", table_name="caregiver_links")
+    op.drop_table("caregiver_links")
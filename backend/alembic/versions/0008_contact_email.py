@@ -0,0 +1,26 @@
+"""emergency contact email
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+
+Optional email address of an emergency contact, used by the SOS fan-out.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("emergency_contacts", sa.Column("email", sa.String(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("emergency_contacts") as batch_op:
+        batch_op.drop_column("email")
@@ -0,0 +1,96 @@
+"""notification outbox
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-18
+
+Replaces the email-only outbox with one that carries a channel (email,
+webhook, sms, in_app) per row. Queued emails are moved over as they are.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0009"
+down_revision = "0008"
+branch_labels = None
+depends_on = None
+
+PENDING_WHERE = "status = 'pending'"
+STATE_COLUMNS = "subject, html_content, text_content, status, attempts, next_attempt_at, last_error, created_at, sent_at"
+
+
+def upgrade():
+    op.create_table(
+        "notification_outbox",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("channel", sa.String(), nullable=False),
+        sa.Column("kind", sa.String(), nullable=False),
+        sa.Column("idempotency_key", sa.String(), nullable=True),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=True),
+        sa.Column("recipient", sa.String(), nullable=False),
+        sa.Column("subject", sa.String(), nullable=False),
+        sa.Column("html_content", sa.Text(), nullable=True),
+        sa.Column("text_content", sa.Text(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("read_at", sa.DateTime(timezone=True), nullable=True),
+        sa.UniqueConstraint("channel", "idempotency_key", name="uq_notification_outbox_channel_key"),
+    )
+    op.create_index("ix_notification_outbox_id", "notification_outbox", ["id"])
+    op.create_index(
+        "ix_notification_outbox_pending_due", "notification_outbox", ["channel", "next_attempt_at"],
+        postgresql_where=sa.text(PENDING_WHERE), sqlite_where=sa.text(PENDING_WHERE),
+    )
+    op.create_index("ix_notification_outbox_user_channel_id", "notification_outbox", ["user_id", "channel", "id"])
+
+    # The old rows do not record what kind of email they were
+    op.execute(
+        f"INSERT INTO notification_outbox (channel, kind, idempotency_key, user_id, recipient, {STATE_COLUMNS}) "
+        f"SELECT 'email', 'email', idempotency_key, "
+        f"(SELECT users.id FROM users WHERE users.email = email_outbox.recipient_email), "
+        f"recipient_email, {STATE_COLUMNS} FROM email_outbox"
+    )
+    op.drop_index("ix_email_outbox_pending_due", table_name="email_outbox")
+    op.drop_index("ix_email_outbox_id", table_name="email_outbox")
+    op.drop_table("email_outbox")
+
+
+def downgrade():
+    op.create_table(
+        "email_outbox",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("idempotency_key", sa.String(), nullable=True),
+        sa.Column("recipient_email", sa.String(), nullable=False),
+        sa.Column("subject", sa.String(), nullable=False),
+        sa.Column("html_content", sa.Text(), nullable=False),
+        sa.Column("text_content", sa.Text(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("sent_at", sa.DateTime(timezone=True), nullable=True),
+        sa.UniqueConstraint("idempotency_key"),
+    )
+    op.create_index("ix_email_outbox_id", "email_outbox", ["id"])
+    op.create_index(
+        "ix_email_outbox_pending_due", "email_outbox", ["next_attempt_at"],
+        postgresql_where=sa.text(PENDING_WHERE), sqlite_where=sa.text(PENDING_WHERE),
+    )
+    # Only emails can go back; other channels have no place in the old table
+    op.execute(
+        f"INSERT INTO email_outbox (idempotency_key, recipient_email, {STATE_COLUMNS}) "
+        f"SELECT idempotency_key, recipient, subject, COALESCE(html_content, text_content), "
+        f"text_content, status, attempts, next_attempt_at, last_error, created_at, sent_at "
+        f"FROM notification_outbox WHERE channel = 'email'"
+    )
+    op.drop_index("ix_notification_outbox_user_channel_id", table_name="notification_outbox")
+    op.drop_index("ix_notification_outbox_pending_due", table_name="notification_outbox")
+    op.drop_index("ix_notification_outbox_id", table_name="notification_outbox")
+    op.drop_table("notification_outbox")
@@ -0,0 +1,39 @@
+"""caregiver invites
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-18
+
+Pending caregiver invites, addressed by email. A caregiver link is only
+created once the invitee accepts.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0010"
+down_revision = "0009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "caregiver_invites",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("patient_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.UniqueConstraint("patient_id", "email", name="uq_caregiver_invites_patient_email"),
+        # Ids must not be reused after a delete (see CaregiverInvite)
+        sqlite_autoincrement=True,
+    )
+    op.create_index("ix_caregiver_invites_id", "caregiver_invites", ["id"])
+    op.create_index("ix_caregiver_invites_email", "caregiver_invites", ["email"])
+
+
+def downgrade():
+    op.drop_index("ix_caregiver_invites_email", table_name="caregiver_invites")
+    op.drop_index("ix_caregiver_invites_id", table_name="caregiver_invites")
+    op.drop_table("caregiver_invites")
@@ -0,0 +1,30 @@
+"""reminder runs
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-18
+
+The last reminder slot each daily reminder job chunk finished, so slots
+missed during a scheduler leadership change are caught up on.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0011"
+down_revision = "0010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "reminder_runs",
+        sa.Column("job", sa.String(), primary_key=True),
+        sa.Column("slot_start", sa.DateTime(timezone=True), nullable=False),
+    )
+
+
+def downgrade():
+    op.drop_table("reminder_runs")
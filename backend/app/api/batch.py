@@ -0,0 +1,37 @@
+# backend/app/api/batch.py
+#
+# Checks shared by the batch create/update/delete endpoints. A batch is all
+# or nothing: any problem with any item rejects the whole request before
+# anything is written.
+
+from typing import Dict, Sequence
+
+from fastapi import HTTPException
+
+from app.core.config import settings
+from app.schemas import user as user_schema
+
+
+def check_batch_size(count: int) -> None:
+    """Rejects empty batches and batches above BATCH_MAX_ITEMS."""
+    if count == 0:
+        raise HTTPException(status_code=400, detail="A batch needs at least one item")
+    if count > settings.BATCH_MAX_ITEMS:
+        raise HTTPException(status_code=400, detail=f"A batch can hold at most {settings.BATCH_MAX_ITEMS} items")
+
+
+def check_unique_ids(ids: Sequence[int]) -> None:
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=400, detail="Each id may appear only once in a batch")
+
+
+def verify_batch_owner(owners: Dict[int, int], ids: Sequence[int], current_user: user_schema.User, not_found: str) -> None:
+    """
+    The batch version of the get_*_and_verify_owner helpers. `owners` maps
+    id -> owner_id as loaded by one set query (crud_batch.get_owners).
+    """
+    missing = [item_id for item_id in ids if item_id not in owners]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"{not_found}: ids {missing}")
+    if any(owners[item_id] != current_user.id for item_id in ids):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
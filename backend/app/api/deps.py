@@ -6,48 +6,92 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import ValidationError
 
 from app.core.config import settings
 from app.core import security
-from app.db.database import get_db
+from app.db.database import get_db, get_async_db
 from app.db import models
 from app.crud import crud_user
-from app.schemas import token as token_schema
+from app.schemas import token as token_schema, user as user_schema
+from app.core.cache import user_cache
 
 # This scheme tells FastAPI where to look for the token (in the Authorization header)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"/api/v1/auth/login/access-token")
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> models.User:
-    """
-    Dependency to get the current user from a JWT token.
-    1. Decodes the token.
-    2. Validates the token data.
-    3. Fetches the user from the database.
-    """
+def _decode_token_subject(token: str) -> str:
+    """Decodes the JWT and returns the email in its 'sub' (subject) field, or raises 401."""
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
-        # Decode the JWT to get the payload
-       
-        # Extract the email from the payload's 'sub' (subject) field
-        token_data = token_schema.TokenData(email=payload.get("sub"))
+        return token_schema.TokenData(email=payload.get("sub")).email
     except (JWTError, ValidationError):
-        # If the token is invalid or expired, raise an error
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+
+
+def get_current_user(
+    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
+) -> user_schema.User:
+    """
+    Dependency to get the current user from a JWT token.
+    1. Decodes the token.
+    2. Validates the token data.
+    3. Returns the cached user snapshot, or fetches the user from the database.
+    The result is a read-only snapshot; load the ORM object with
+    crud_user.get_user() when the user row itself must be changed.
+    """
+    email = _decode_token_subject(token)
     
+    cached_user = user_cache.get(email)
+    if cached_user is not None:
+        return cached_user
+
     # Fetch the user from the database using the email from the token
-    user = crud_user.get_user_by_email(db, email=token_data.email)
+    user = crud_user.get_user_by_email(db, email=email)
     
     if not user:
         # If a user with that email doesn't exist (e.g., account was deleted)
         raise HTTPException(status_code=404, detail="User not found")
         
-    return user
\ No newline at end of file
+    snapshot = user_schema.User.model_validate(user)
+    user_cache.set(email, snapshot)
+    return snapshot
+
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(oauth2_scheme)
+) -> user_schema.User:
+    """
+    Async version of get_current_user, for the async endpoint stack.
+    Shares the same user cache.
+    """
+    email = _decode_token_subject(token)
+    cached_user = user_cache.get(email)
+    if cached_user is not None:
+        return cached_user
+
+    user = await crud_user.get_user_by_email_async(db, email=email)
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    snapshot = user_schema.User.model_validate(user)
+    user_cache.set(email, snapshot)
+    return snapshot
+
+
+def get_current_admin(
+    current_user: user_schema.User = Depends(get_current_user),
+) -> user_schema.User:
+    """
+    Dependency for admin-only endpoints: the current user must be listed in
+    ADMIN_EMAILS, otherwise 403.
+    """
+    if current_user.email.lower() not in settings.admin_emails:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return current_user
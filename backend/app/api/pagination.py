@@ -0,0 +1,66 @@
+# backend/app/api/pagination.py
+#
+# Keyset (cursor) pagination for the list endpoints. The response body stays
+# a plain JSON list; the cursor for the next page is sent in the
+# X-Next-Cursor header and is absent on the last page.
+
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence
+
+from fastapi import HTTPException, Query, Response
+
+from app.core.config import settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class PageParams:
+    limit: int
+    cursor: Optional[str]
+
+
+def page_params(
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = Query(None, description=f"Value of the {NEXT_CURSOR_HEADER} header of the previous page"),
+) -> PageParams:
+    """Dependency for the `limit` and `cursor` query parameters."""
+    return PageParams(limit=limit, cursor=cursor)
+
+
+def encode_cursor(*values: Any) -> str:
+    """Packs the sort key of the last row into an opaque, URL-safe cursor."""
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], *types: Callable) -> Optional[tuple]:
+    """
+    Unpacks a cursor made by encode_cursor, converting each value with the
+    matching type (e.g. int, datetime). Raises 400 for a malformed cursor.
+    """
+    if cursor is None:
+        return None
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if len(values) != len(types):
+            raise ValueError("wrong number of values")
+        return tuple(
+            datetime.fromisoformat(v) if t is datetime else t(v) for t, v in zip(types, values)
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def paginate(response: Response, rows: Sequence, limit: int, sort_key: Callable[[Any], tuple]) -> List:
+    """
+    Trims rows (fetched with limit + 1) to one page and, if there are more,
+    sets the cursor for the next page from the sort key of the last row.
+    """
+    page = list(rows[:limit])
+    if len(rows) > limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(*sort_key(page[-1]))
+    return page
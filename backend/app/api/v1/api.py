@@ -2,15 +2,33 @@
 
 from fastapi import APIRouter
 
+from app.core.config import settings
+
 from app.api.v1.endpoints import (
     users, 
     auth, 
     dashboard, 
     medications,
     appointments,  # <-- IMPORT appointments
-    contacts
+    contacts,
+    metrics,
+    tips,
+    export,
+    imports,
+    analytics,
+    caregivers,
+    notifications
 )
 
+if settings.DB_MODE == "async":
+    # Same URLs, served by async def endpoints on the async engine
+    from app.api.v1.endpoints_async import (
+        users,
+        medications,
+        appointments,
+        contacts,
+    )
+
 # Create the main router for API version 1
 api_router = APIRouter()
 
@@ -18,6 +36,13 @@ api_router = APIRouter()
 api_router.include_router(auth.router, prefix="/auth", tags=["Auth"])
 api_router.include_router(users.router, prefix="/users", tags=["Users"])
 api_router.include_router(dashboard.router, prefix="/dashboard", tags=["Dashboard"])
+api_router.include_router(caregivers.router, prefix="/caregivers", tags=["Caregivers"])
 api_router.include_router(medications.router, prefix="/medications", tags=["Medications"])
 api_router.include_router(appointments.router, prefix="/appointments", tags=["Appointments"]) # <-- ADD this line
-api_router.include_router(contacts.router, prefix="/contacts", tags=["Contacts"]) # <-- ADD this line
\ No newline at end of file
+api_router.include_router(contacts.router, prefix="/contacts", tags=["Contacts"]) # <-- ADD this line
+api_router.include_router(tips.router, prefix="/tips", tags=["Tips"])
+api_router.include_router(export.router, prefix="/export", tags=["Export"])
+api_router.include_router(imports.router, prefix="/import", tags=["Import"])
+api_router.include_router(analytics.router, prefix="/analytics", tags=["Analytics"])
+api_router.include_router(notifications.router, prefix="/notifications", tags=["Notifications"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["Metrics"])
\ No newline at end of file
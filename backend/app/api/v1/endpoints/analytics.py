@@ -0,0 +1,58 @@
+# backend/app/api/v1/endpoints/analytics.py
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import List
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from app.api import deps
+from app.core.config import settings
+from app.crud import crud_analytics, crud_medication
+from app.schemas import analytics as analytics_schema, user as user_schema
+from app.utils.adherence import ADHERENCE_WINDOWS
+
+router = APIRouter()
+
+@router.get("/adherence", response_model=List[analytics_schema.MedicationAdherence])
+def read_adherence(
+    *,
+    db: Session = Depends(deps.get_db),
+    window: int = Query(30, description="Days: 30, 90 or 365"),
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Adherence percentage, missed days and streaks of each of the current
+    user's medications over the last `window` completed days.
+    The figures are precomputed in the background and refreshed every
+    ADHERENCE_REFRESH_SECONDS, so a dose just taken may take a few minutes
+    to show up here.
+    """
+    if window not in ADHERENCE_WINDOWS:
+        raise HTTPException(status_code=400, detail=f"window must be one of {', '.join(map(str, ADHERENCE_WINDOWS))}")
+    return crud_analytics.get_adherence(db, owner_id=current_user.id, window_days=window)
+
+
+@router.get("/adherence/{med_id}/trend", response_model=analytics_schema.AdherenceTrend)
+def read_adherence_trend(
+    *,
+    db: Session = Depends(deps.get_db),
+    med_id: int,
+    weeks: int = Query(12, ge=1, le=53),
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Week by week doses and missed days of one medication, oldest week first.
+    """
+    db_medication = crud_medication.get_medication_by_id(db, medication_id=med_id)
+    if not db_medication:
+        raise HTTPException(status_code=404, detail="Medication not found")
+    if db_medication.owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+
+    tz_name = current_user.timezone or settings.DEFAULT_TIMEZONE
+    today = datetime.now(ZoneInfo(tz_name)).date()
+    return {
+        "medication_id": med_id,
+        "weeks": crud_analytics.get_weekly_trend(db, db_medication, weeks, today, tz_name),
+    }
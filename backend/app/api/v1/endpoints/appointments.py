@@ -1,18 +1,23 @@
 # backend/app/api/v1/endpoints/appointments.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import datetime, timezone
 
 from app.api import deps
+from app.api.batch import check_batch_size, check_unique_ids, verify_batch_owner
+from app.api.fast_json import list_response
+from app.api.pagination import PageParams, decode_cursor, page_params, paginate
 from app.db import models
-from app.crud import crud_appointment, crud_user # We need crud_appointment for a helper
-from app.schemas import appointment as appointment_schema
+from app.crud import crud_appointment, crud_batch, crud_user # We need crud_appointment for a helper
+from app.schemas import appointment as appointment_schema, user as user_schema
+from app.schemas.batch import BatchDelete
 
 router = APIRouter()
 
 # Helper function to get and verify an appointment
-def get_appointment_and_verify_owner(db: Session, appt_id: int, current_user: models.User) -> models.Appointment:
+def get_appointment_and_verify_owner(db: Session, appt_id: int, current_user: user_schema.User) -> models.Appointment:
     appointment = db.query(models.Appointment).filter(models.Appointment.id == appt_id).first()
     if not appointment:
         raise HTTPException(status_code=404, detail="Appointment not found")
@@ -22,34 +27,106 @@ def get_appointment_and_verify_owner(db: Session, appt_id: int, current_user: mo
 
 @router.get("/", response_model=List[appointment_schema.Appointment])
 def read_appointments(
+    response: Response,
     db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_user)
+    current_user: user_schema.User = Depends(deps.get_current_user),
+    page: PageParams = Depends(page_params),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    upcoming: bool = False,
 ):
-    """Retrieve all appointments for the current logged-in user."""
-    return crud_appointment.get_appointments_by_user(db, owner_id=current_user.id)
+    """
+    Retrieve the current user's appointments, one page at a time.
+    Most recent first; with `upcoming=true` soonest first, from now on
+    (or from `start`). `start`/`end` limit the date range. Pass the X-Next-Cursor header of a
+    page as `cursor` (with the same filters) to get the next one.
+    """
+    if upcoming and start is None:
+        start = datetime.now(timezone.utc)
+    after = decode_cursor(page.cursor, datetime, int)
+    appointments = crud_appointment.get_appointments_by_user(
+        db, owner_id=current_user.id, limit=page.limit + 1, after=after,
+        start=start, end=end, ascending=upcoming,
+    )
+    page_rows = paginate(response, appointments, page.limit, lambda appt: (appt.appointment_datetime, appt.id))
+    return list_response(response, page_rows, appointment_schema.Appointment)
 
 @router.post("/", response_model=appointment_schema.Appointment, status_code=status.HTTP_201_CREATED)
 def create_appointment(
     *,
     db: Session = Depends(deps.get_db),
     appointment_in: appointment_schema.AppointmentCreate,
-    current_user: models.User = Depends(deps.get_current_user)
+    current_user: user_schema.User = Depends(deps.get_current_user)
 ):
     """Create a new appointment for the current logged-in user."""
     return crud_appointment.create_user_appointment(
         db=db, appointment=appointment_in, owner_id=current_user.id
     )
 
+@router.post("/batch", response_model=List[appointment_schema.Appointment], status_code=status.HTTP_201_CREATED)
+def create_appointments_batch(
+    *,
+    db: Session = Depends(deps.get_db),
+    appointments_in: List[appointment_schema.AppointmentCreate],
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Create several appointments for the current user at once.
+    They are saved together in one transaction, or not at all.
+    """
+    check_batch_size(len(appointments_in))
+    return crud_batch.create_many(
+        db, models.Appointment, current_user.id, [item.model_dump() for item in appointments_in]
+    )
+
+
+@router.patch("/batch", response_model=List[appointment_schema.Appointment])
+def update_appointments_batch(
+    *,
+    db: Session = Depends(deps.get_db),
+    appointments_in: List[appointment_schema.AppointmentBatchUpdate],
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Update several appointments of the current user at once. Each item holds
+    the id and only the fields to change. Ownership of all of them is checked
+    with one query, and the changes are saved in one transaction.
+    """
+    check_batch_size(len(appointments_in))
+    ids = [item.id for item in appointments_in]
+    check_unique_ids(ids)
+    owners = crud_batch.get_owners(db, models.Appointment, ids)
+    verify_batch_owner(owners, ids, current_user, not_found="Appointment not found")
+    return crud_batch.update_many(
+        db, models.Appointment, current_user.id, [item.model_dump(exclude_unset=True) for item in appointments_in]
+    )
+
+
+@router.post("/batch/delete", response_model=List[appointment_schema.Appointment])
+def delete_appointments_batch(
+    *,
+    db: Session = Depends(deps.get_db),
+    batch_in: BatchDelete,
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Delete several appointments of the current user at once, in one transaction.
+    Returns the deleted items.
+    """
+    check_batch_size(len(batch_in.ids))
+    check_unique_ids(batch_in.ids)
+    owners = crud_batch.get_owners(db, models.Appointment, batch_in.ids)
+    verify_batch_owner(owners, batch_in.ids, current_user, not_found="Appointment not found")
+    return crud_batch.delete_many(db, models.Appointment, current_user.id, batch_in.ids)
+
+
 @router.delete("/{appt_id}", response_model=appointment_schema.Appointment)
 def delete_appointment(
     *,
     db: Session = Depends(deps.get_db),
     appt_id: int,
-    current_user: models.User = Depends(deps.get_current_user)
+    current_user: user_schema.User = Depends(deps.get_current_user)
 ):
     """Delete an appointment for the current user."""
     appointment = get_appointment_and_verify_owner(db, appt_id, current_user)
-    
-    db.delete(appointment)
-    db.commit()
-    return appointment
\ No newline at end of file
+    return crud_appointment.delete_appointment(db, db_appointment=appointment)
\ No newline at end of file
@@ -10,9 +10,10 @@ from datetime import datetime, timedelta, timezone
 from app.api import deps
 from app.core import security
 from app.core.config import settings
-from app.crud import crud_user
+from app.crud import crud_user, crud_outbox
+from app.db import models
 from app.schemas import token as token_schema, user as user_schema
-from app.utils.email_utils import send_password_reset_email
+from app.utils.email_utils import password_reset_email_content
 
 router = APIRouter()
 
@@ -24,6 +25,11 @@ def login_access_token(
 ) -> Any:
     """OAuth2 compatible token login, get an access token for future requests."""
     user = crud_user.get_user_by_email(db, email=form_data.username)
+    # Hand the DB connection back before the slow bcrypt check, so waiting
+    # logins do not exhaust the connection pool
+    if user:
+        db.expunge(user)
+    db.close()
     if not user or not security.verify_password(form_data.password, user.hashed_password):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Incorrect email or password", headers={"WWW-Authenticate": "Bearer"})
     elif not user.is_active:
@@ -51,14 +57,25 @@ def forgot_password(
     token = secrets.token_urlsafe(32)
     expires_at = datetime.now(timezone.utc) + timedelta(hours=1) # Token is valid for 1 hour
     
-    # Store the token in the database
-    crud_user.set_password_reset_token(db, db_user=user, token=token, expires_at=expires_at)
-    
     # Create the full reset link
     reset_link = f"{settings.FRONTEND_URL}/reset-password?token={token}"
     
-    # Send the email
-    send_password_reset_email(recipient_email=email, reset_link=reset_link)
+    # Queue the notification; it is committed together with the token below
+    # and delivered by the outbox worker, so SMTP never blocks this request
+    subject, html, text = password_reset_email_content(reset_link)
+    crud_outbox.enqueue_notification(
+        db,
+        kind="password_reset",
+        user_id=user.id,
+        email=email,
+        subject=subject,
+        html_content=html,
+        text_content=text,
+        idempotency_key=f"password-reset:{token}",
+    )
+    
+    # Store the token in the database
+    crud_user.set_password_reset_token(db, db_user=user, token=token, expires_at=expires_at)
     
     return {"msg": "If an account with this email exists, a password reset link has been sent."}
 
@@ -79,13 +96,7 @@ def reset_password(
     if not user or not user.reset_token_expires_at or user.reset_token_expires_at <= datetime.now(timezone.utc):
         raise HTTPException(status_code=400, detail="Invalid or expired password reset token.")
     
-    # Update the user's password
-    user.hashed_password = security.get_password_hash(new_password)
-    # Invalidate the reset token
-    user.reset_password_token = None
-    user.reset_token_expires_at = None
-    
-    db.add(user)
-    db.commit()
+    # Update the user's password and invalidate the reset token
+    crud_user.reset_password(db, db_user=user, new_password=new_password)
     
     return {"msg": "Password has been reset successfully."}
\ No newline at end of file
@@ -0,0 +1,162 @@
+# backend/app/api/v1/endpoints/caregivers.py
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.orm import Session
+from typing import List
+
+from app.api import deps
+from app.api.pagination import PageParams, decode_cursor, page_params, paginate
+from app.core.config import settings
+from app.crud import crud_caregiver, crud_outbox, crud_user
+from app.schemas import caregiver as caregiver_schema, user as user_schema
+from app.utils.email_utils import caregiver_invite_email_content
+
+router = APIRouter()
+
+INVITE_SENT = "If this person can be invited, they will get an email and become your caregiver once they accept."
+
+@router.post("/", status_code=status.HTTP_202_ACCEPTED)
+def add_caregiver(
+    *,
+    db: Session = Depends(deps.get_db),
+    link_in: caregiver_schema.CaregiverLinkCreate,
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Invite someone to look after the current user. Once they accept (see
+    /caregivers/invites) they see the current user's dashboard on their
+    caregiver dashboard.
+    The answer is the same whether or not the email has an account, so this
+    cannot be used to find out who is registered.
+    """
+    email = link_in.caregiver_email.lower()
+    if email == current_user.email.lower():
+        raise HTTPException(status_code=400, detail="You cannot be your own caregiver.")
+    if crud_caregiver.get_pending_invite(db, patient_id=current_user.id, email=email):
+        return {"msg": INVITE_SENT}
+    caregiver = crud_user.get_user_by_email(db, email=email)
+    if caregiver and crud_caregiver.get_link(db, caregiver_id=caregiver.id, patient_id=current_user.id):
+        return {"msg": INVITE_SENT}
+
+    # The email is queued with the invite and committed together with it. It
+    # is keyed on the invite, so inviting the same person again after this
+    # invite was declined or withdrawn sends a new email.
+    db_invite = crud_caregiver.create_invite(db, patient_id=current_user.id, email=email)
+    subject, html, text = caregiver_invite_email_content(current_user.full_name or current_user.email, settings.FRONTEND_URL)
+    crud_outbox.enqueue_notification(
+        db,
+        kind="caregiver_invite",
+        email=email,
+        subject=subject,
+        html_content=html,
+        text_content=text,
+        idempotency_key=f"caregiver-invite:{db_invite.id}",
+    )
+    db.commit()
+    return {"msg": INVITE_SENT}
+
+
+@router.get("/invites", response_model=List[caregiver_schema.CaregiverInvite])
+def read_invites(
+    db: Session = Depends(deps.get_db),
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    The caregiver invites waiting for the current user to accept.
+    """
+    return crud_caregiver.get_invites_for(db, email=current_user.email)
+
+
+@router.post("/invites/{invite_id}/accept", response_model=caregiver_schema.LinkedUser, status_code=status.HTTP_201_CREATED)
+def accept_invite(
+    *,
+    db: Session = Depends(deps.get_db),
+    invite_id: int,
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Accept an invite: the current user becomes the sender's caregiver.
+    Returns the patient.
+    """
+    db_invite = crud_caregiver.get_invite(db, invite_id)
+    if not db_invite or db_invite.email != current_user.email.lower():
+        raise HTTPException(status_code=404, detail="Invite not found")
+    patient = crud_user.get_user(db, user_id=db_invite.patient_id)
+    db_link = crud_caregiver.accept_invite(db, db_invite, caregiver_id=current_user.id)
+    return {"id": patient.id, "full_name": patient.full_name, "email": patient.email, "linked_at": db_link.created_at}
+
+
+@router.delete("/invites/{invite_id}", status_code=status.HTTP_204_NO_CONTENT)
+def delete_invite(
+    *,
+    db: Session = Depends(deps.get_db),
+    invite_id: int,
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Decline an invite sent to the current user, or withdraw one they sent.
+    """
+    db_invite = crud_caregiver.get_invite(db, invite_id)
+    if not db_invite or current_user.id != db_invite.patient_id and db_invite.email != current_user.email.lower():
+        raise HTTPException(status_code=404, detail="Invite not found")
+    crud_caregiver.delete_invite(db, db_invite)
+
+
+@router.get("/", response_model=List[caregiver_schema.LinkedUser])
+def read_caregivers(
+    db: Session = Depends(deps.get_db),
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    The caregivers who can see the current user's dashboard.
+    """
+    return crud_caregiver.get_caregivers(db, patient_id=current_user.id)
+
+
+@router.delete("/{caregiver_id}", status_code=status.HTTP_204_NO_CONTENT)
+def remove_caregiver(
+    *,
+    db: Session = Depends(deps.get_db),
+    caregiver_id: int,
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Take away a caregiver's access to the current user's dashboard.
+    """
+    db_link = crud_caregiver.get_link(db, caregiver_id=caregiver_id, patient_id=current_user.id)
+    if not db_link:
+        raise HTTPException(status_code=404, detail="Caregiver not found")
+    crud_caregiver.delete_link(db, db_link)
+
+
+@router.get("/patients", response_model=List[caregiver_schema.LinkedUser])
+def read_patients(
+    response: Response,
+    db: Session = Depends(deps.get_db),
+    current_user: user_schema.User = Depends(deps.get_current_user),
+    page: PageParams = Depends(page_params),
+):
+    """
+    The patients the current user looks after, one page at a time in id order.
+    """
+    after = decode_cursor(page.cursor, int)
+    patients = crud_caregiver.get_patients(
+        db, caregiver_id=current_user.id, limit=page.limit + 1, after_id=after[0] if after else None
+    )
+    return paginate(response, patients, page.limit, lambda patient: (patient["id"],))
+
+
+@router.delete("/patients/{patient_id}", status_code=status.HTTP_204_NO_CONTENT)
+def leave_patient(
+    *,
+    db: Session = Depends(deps.get_db),
+    patient_id: int,
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Stop looking after a patient.
+    """
+    db_link = crud_caregiver.get_link(db, caregiver_id=current_user.id, patient_id=patient_id)
+    if not db_link:
+        raise HTTPException(status_code=404, detail="Patient not found")
+    crud_caregiver.delete_link(db, db_link)
@@ -1,17 +1,23 @@
 # backend/app/api/v1/endpoints/contacts.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import anyio
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from typing import List
 
 from app.api import deps
+from app.api.batch import check_batch_size, check_unique_ids, verify_batch_owner
+from app.api.fast_json import list_response
+from app.api.pagination import PageParams, decode_cursor, page_params, paginate
 from app.db import models
-from app.crud import crud_contact
-from app.schemas import contact as contact_schema
+from app.crud import crud_contact, crud_batch
+from app.schemas import contact as contact_schema, sos as sos_schema, user as user_schema
+from app.schemas.batch import BatchDelete
+from app.utils import sos
 
 router = APIRouter()
 
-def get_contact_and_verify_owner(db: Session, contact_id: int, current_user: models.User) -> models.EmergencyContact:
+def get_contact_and_verify_owner(db: Session, contact_id: int, current_user: user_schema.User) -> models.EmergencyContact:
     """Helper function to get a contact and verify its owner."""
     contact = db.query(models.EmergencyContact).filter(models.EmergencyContact.id == contact_id).first()
     if not contact:
@@ -22,14 +28,21 @@ def get_contact_and_verify_owner(db: Session, contact_id: int, current_user: mod
 
 @router.get("/", response_model=List[contact_schema.Contact])
 def read_contacts(
+    response: Response,
     db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_user)
+    current_user: user_schema.User = Depends(deps.get_current_user),
+    page: PageParams = Depends(page_params),
 ):
     """
-    Retrieve all emergency contacts for the current logged-in user.
+    Retrieve the current user's emergency contacts, one page at a time in id order.
+    Pass the X-Next-Cursor header of a page as `cursor` to get the next one.
     """
-    contacts = crud_contact.get_contacts_by_user(db, owner_id=current_user.id)
-    return contacts
+    after = decode_cursor(page.cursor, int)
+    contacts = crud_contact.get_contacts_by_user(
+        db, owner_id=current_user.id, limit=page.limit + 1, after_id=after[0] if after else None
+    )
+    page_rows = paginate(response, contacts, page.limit, lambda contact: (contact.id,))
+    return list_response(response, page_rows, contact_schema.Contact)
 
 
 @router.post("/", response_model=contact_schema.Contact, status_code=status.HTTP_201_CREATED)
@@ -37,7 +50,7 @@ def create_contact(
     *,
     db: Session = Depends(deps.get_db),
     contact_in: contact_schema.ContactCreate,
-    current_user: models.User = Depends(deps.get_current_user)
+    current_user: user_schema.User = Depends(deps.get_current_user)
 ):
     """
     Create a new emergency contact for the current logged-in user.
@@ -53,12 +66,91 @@ def create_contact(
     return contact
 
 
+@router.post("/batch", response_model=List[contact_schema.Contact], status_code=status.HTTP_201_CREATED)
+def create_contacts_batch(
+    *,
+    db: Session = Depends(deps.get_db),
+    contacts_in: List[contact_schema.ContactCreate],
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Create several emergency contacts for the current user at once.
+    They are saved together in one transaction, or not at all.
+    """
+    check_batch_size(len(contacts_in))
+    return crud_batch.create_many(
+        db, models.EmergencyContact, current_user.id, [item.model_dump() for item in contacts_in]
+    )
+
+
+@router.patch("/batch", response_model=List[contact_schema.Contact])
+def update_contacts_batch(
+    *,
+    db: Session = Depends(deps.get_db),
+    contacts_in: List[contact_schema.ContactBatchUpdate],
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Update several emergency contacts of the current user at once. Each item holds
+    the id and only the fields to change. Ownership of all of them is checked
+    with one query, and the changes are saved in one transaction.
+    """
+    check_batch_size(len(contacts_in))
+    ids = [item.id for item in contacts_in]
+    check_unique_ids(ids)
+    owners = crud_batch.get_owners(db, models.EmergencyContact, ids)
+    verify_batch_owner(owners, ids, current_user, not_found="Contact not found")
+    return crud_batch.update_many(
+        db, models.EmergencyContact, current_user.id, [item.model_dump(exclude_unset=True) for item in contacts_in]
+    )
+
+
+@router.post("/batch/delete", response_model=List[contact_schema.Contact])
+def delete_contacts_batch(
+    *,
+    db: Session = Depends(deps.get_db),
+    batch_in: BatchDelete,
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Delete several emergency contacts of the current user at once, in one transaction.
+    Returns the deleted items.
+    """
+    check_batch_size(len(batch_in.ids))
+    check_unique_ids(batch_in.ids)
+    owners = crud_batch.get_owners(db, models.EmergencyContact, batch_in.ids)
+    verify_batch_owner(owners, batch_in.ids, current_user, not_found="Contact not found")
+    return crud_batch.delete_many(db, models.EmergencyContact, current_user.id, batch_in.ids)
+
+
+@router.post("/sos", response_model=sos_schema.SOSResult)
+def send_sos(
+    *,
+    db: Session = Depends(deps.get_db),
+    sos_in: sos_schema.SOSRequest,
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Alert all of the current user's emergency contacts at once, over every
+    notification channel listed in SOS_CHANNELS that can reach them.
+    Responds as soon as the first deliveries are acknowledged, and within
+    SOS_LATENCY_BUDGET_SECONDS at most; deliveries still running are listed
+    as "pending" and finish in the background.
+    """
+    contacts = crud_contact.get_contacts_by_user(db, owner_id=current_user.id)
+    if not contacts:
+        raise HTTPException(status_code=400, detail="No emergency contacts to notify.")
+    subject, text = sos.sos_message(current_user.full_name, current_user.email, sos_in.message)
+    # Run on the event loop, where the unfinished deliveries can outlive this request
+    return anyio.from_thread.run(sos.fan_out, contacts, subject, text, current_user.id)
+
+
 @router.delete("/{contact_id}", response_model=contact_schema.Contact)
 def delete_contact(
     *,
     db: Session = Depends(deps.get_db),
     contact_id: int,
-    current_user: models.User = Depends(deps.get_current_user)
+    current_user: user_schema.User = Depends(deps.get_current_user)
 ):
     """
     Delete an emergency contact for the current user.
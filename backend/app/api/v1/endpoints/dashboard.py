@@ -1,12 +1,19 @@
 # backend/app/api/v1/endpoints/dashboard.py
 
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_
-from datetime import datetime, time, date, timezone
+from typing import Iterator, List
 
 from app.api import deps
-from app.db import models
+from app.api.pagination import PageParams, decode_cursor, page_params, paginate
+from app.core.config import settings
+from app.crud import crud_caregiver, crud_dashboard
+from app.db.database import SessionLocal
+from app.schemas import caregiver as caregiver_schema, user as user_schema
+from app.utils.reminder_slots import local_today
+from app.utils.tip_catalog import tip_catalog
 
 router = APIRouter()
 
@@ -14,50 +21,76 @@ router = APIRouter()
 def get_dashboard_data(
     *,
     db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_user)
+    current_user: user_schema.User = Depends(deps.get_current_user)
 ):
     """
     Retrieve real, personalized dashboard data for the current user.
+    Today's medications and the next appointment come from one query and are
+    cached per user (see crud_dashboard).
     """
-    # 1. Get today's medications
-    # This finds medications that are 'Daily' and were not taken today,
-    # OR medications with a specific time for today.
-    today = date.today()
-    meds_today_query = (
-        db.query(models.Medication)
-        .filter(models.Medication.owner_id == current_user.id)
-        .filter(
-            and_(
-                models.Medication.frequency == "Daily",
-                # Check if last_taken_at is NULL or was before today
-                (models.Medication.last_taken_at == None) | (models.Medication.last_taken_at < datetime.combine(today, time.min))
-            )
-        )
-    )
-    meds_today = meds_today_query.all()
+    data = crud_dashboard.get_dashboard_data(db, owner_id=current_user.id, tz_name=current_user.timezone)
     
-    # Convert to a list of simple dicts for the frontend
-    medications_for_dashboard = [
-        {"name": med.name, "dosage": med.dosage, "timing": med.meal_timing or med.specific_time.strftime('%I:%M %p')}
-        for med in meds_today
-    ]
-
-    # 2. Get the next upcoming appointment
-    next_appointment = (
-        db.query(models.Appointment)
-        .filter(models.Appointment.owner_id == current_user.id)
-        .filter(models.Appointment.appointment_datetime >= datetime.now(timezone.utc))
-        .order_by(models.Appointment.appointment_datetime)
-        .first()
+    # Today's tip for this user, from the in-memory tip catalog (no DB query)
+    health_tip = (
+        tip_catalog.tip_of_the_day(current_user.id, local_today(current_user.timezone))
+        or "Stay hydrated by drinking plenty of water throughout the day."
     )
     
-    # 3. Get a random health tip (for now, it's static)
-    # In a real app, you would have a health_tips table and query a random one.
-    health_tip = "Stay hydrated by drinking plenty of water throughout the day."
-    
     return {
         "user_full_name": current_user.full_name,
-        "medications_today": medications_for_dashboard,
-        "next_appointment": next_appointment, # Will be None if no upcoming appointments
+        "medications_today": data["medications_today"],
+        "next_appointment": data["next_appointment"], # Will be None if no upcoming appointments
         "health_tip": health_tip
-    }
\ No newline at end of file
+    }
+
+
+
+def _panel_items(db: Session, patients: List[dict]) -> List[dict]:
+    panel = crud_dashboard.get_panel_data(db, {patient["id"]: patient["timezone"] for patient in patients})
+    return [
+        {"patient_id": patient["id"], "full_name": patient["full_name"], **panel[patient["id"]]}
+        for patient in patients
+    ]
+
+
+def _panel_lines(caregiver_id: int) -> Iterator[bytes]:
+    # The request's own session is closed before a streamed body is sent
+    db = SessionLocal()
+    try:
+        after_id = None
+        while True:
+            patients = crud_caregiver.get_patients(
+                db, caregiver_id=caregiver_id, limit=settings.CAREGIVER_PANEL_BATCH_SIZE, after_id=after_id
+            )
+            if not patients:
+                return
+            after_id = patients[-1]["id"]
+            yield b"".join(orjson.dumps(item) + b"\n" for item in _panel_items(db, patients))
+    finally:
+        db.close()
+
+
+@router.get("/patients", response_model=List[caregiver_schema.PatientDashboard])
+def get_patients_dashboard(
+    response: Response,
+    db: Session = Depends(deps.get_db),
+    current_user: user_schema.User = Depends(deps.get_current_user),
+    page: PageParams = Depends(page_params),
+    stream: bool = False,
+):
+    """
+    Today's pending medications and the next appointment of every patient
+    the current user looks after (see /caregivers).
+    A page costs three queries however many patients it holds. With
+    `stream=true` the whole panel is streamed as NDJSON, one patient per
+    line, CAREGIVER_PANEL_BATCH_SIZE patients per round of queries.
+    """
+    if stream:
+        return StreamingResponse(_panel_lines(current_user.id), media_type="application/x-ndjson")
+
+    after = decode_cursor(page.cursor, int)
+    patients = crud_caregiver.get_patients(
+        db, caregiver_id=current_user.id, limit=page.limit + 1, after_id=after[0] if after else None
+    )
+    page_rows = paginate(response, patients, page.limit, lambda patient: (patient["id"],))
+    return _panel_items(db, page_rows)
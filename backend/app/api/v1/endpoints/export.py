@@ -0,0 +1,101 @@
+# backend/app/api/v1/endpoints/export.py
+
+import csv
+import io
+from datetime import date, datetime, time
+from typing import Iterator, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from app.api import deps
+from app.core.config import settings
+from app.crud import crud_export
+from app.db.database import SessionLocal
+from app.schemas import user as user_schema
+
+router = APIRouter()
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _ndjson_chunks(owner_id: Optional[int]) -> Iterator[bytes]:
+    # The request's own session is closed before a streamed body is sent,
+    # so the generator opens (and closes) its own
+    db = SessionLocal()
+    try:
+        for record_type, columns, rows in crud_export.iter_export_batches(db, owner_id, settings.EXPORT_BATCH_SIZE):
+            yield b"".join(
+                orjson.dumps({"type": record_type, **dict(zip(columns, row))}) + b"\n" for row in rows
+            )
+    finally:
+        db.close()
+
+
+def _csv_value(value):
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return value
+
+
+def _csv_chunks(owner_id: Optional[int]) -> Iterator[str]:
+    # One table for every record type: the header is the union of all
+    # exported columns and `type` says which ones a row fills in
+    header = crud_export.export_columns()
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["type", *header])
+    yield buffer.getvalue()
+
+    db = SessionLocal()
+    try:
+        for record_type, columns, rows in crud_export.iter_export_batches(db, owner_id, settings.EXPORT_BATCH_SIZE):
+            positions = [header.index(name) for name in columns]
+            buffer.seek(0)
+            buffer.truncate()
+            for row in rows:
+                line = [""] * len(header)
+                for position, value in zip(positions, row):
+                    line[position] = _csv_value(value)
+                writer.writerow([record_type, *line])
+            yield buffer.getvalue()
+    finally:
+        db.close()
+
+
+def _export_response(owner_id: Optional[int], export_format: str, filename: str) -> StreamingResponse:
+    chunks = _ndjson_chunks(owner_id) if export_format == "ndjson" else _csv_chunks(owner_id)
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
+
+
+@router.get("/")
+def export_my_account(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    current_user: user_schema.User = Depends(deps.get_current_user),
+):
+    """
+    Download everything stored for the current user: profile, medications,
+    appointments, emergency contacts and dose history, one record per line
+    (NDJSON) or row (CSV).
+    The file is streamed as it is read, so it starts at once and the server
+    never holds the whole account in memory.
+    """
+    return _export_response(current_user.id, export_format, f"account-{current_user.id}")
+
+
+@router.get("/all")
+def export_all_accounts(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    current_user: user_schema.User = Depends(deps.get_current_admin),
+):
+    """
+    Admin only: stream every account for backup or for moving to another instance.
+    Records are grouped by type (all users, then all medications, ...) and
+    each carries its owner_id.
+    """
+    return _export_response(None, export_format, f"accounts-{date.today().isoformat()}")
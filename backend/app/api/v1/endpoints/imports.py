@@ -0,0 +1,100 @@
+# backend/app/api/v1/endpoints/imports.py
+
+import csv
+import io
+from typing import Iterator, Tuple
+
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.core.config import settings
+from app.crud import crud_import
+from app.schemas import user as user_schema
+from app.schemas.bulk_import import ImportResult
+from app.utils import ical
+
+router = APIRouter()
+
+
+def _text_lines(upload: UploadFile) -> io.TextIOWrapper:
+    # Decodes the spooled upload lazily, line by line; utf-8-sig drops the BOM Excel writes
+    return io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+
+
+def _csv_rows(upload: UploadFile) -> Iterator[Tuple[int, dict]]:
+    """Yields (line number, values) for every data row; empty cells count as not given."""
+    reader = csv.DictReader(_text_lines(upload))
+    for record in reader:
+        yield reader.line_num, {
+            key.strip(): value.strip()
+            for key, value in record.items()
+            if key and isinstance(value, str) and value.strip()
+        }
+
+
+def _ics_rows(upload: UploadFile, tz_name: str) -> Iterator[Tuple[int, dict]]:
+    """Yields (event number, values) for every VEVENT, mapped onto an appointment."""
+    for number, event in enumerate(ical.iter_events(_text_lines(upload)), start=1):
+        values = {}
+        if "SUMMARY" in event:
+            values["doctor_name"] = ical.unescape_text(event["SUMMARY"][1]).strip()
+        if "DTSTART" in event:
+            params, raw = event["DTSTART"]
+            try:
+                values["appointment_datetime"] = ical.parse_datetime(params, raw, tz_name)
+            except ValueError:
+                # Left as text, so validation reports it as an invalid datetime
+                values["appointment_datetime"] = raw
+        if "LOCATION" in event:
+            values["location"] = ical.unescape_text(event["LOCATION"][1]).strip()[:200] or None
+        if "DESCRIPTION" in event:
+            values["purpose"] = ical.unescape_text(event["DESCRIPTION"][1]).strip()[:300] or None
+        yield number, values
+
+
+def _run_import(import_function, db: Session, owner_id: int, rows, atomic: bool) -> ImportResult:
+    try:
+        return import_function(db, owner_id, rows, batch_size=settings.IMPORT_BATCH_SIZE, atomic=atomic)
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise HTTPException(status_code=400, detail=f"Could not read the file: {e}")
+
+
+@router.post("/medications", response_model=ImportResult)
+def import_medications(
+    *,
+    db: Session = Depends(deps.get_db),
+    file: UploadFile = File(...),
+    atomic: bool = False,
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Create many medications from a CSV file with the columns name, dosage,
+    timing_type, meal_timing, specific_time and frequency.
+    Valid rows are saved in one transaction and invalid ones are listed in
+    `errors`; with `atomic=true` a single invalid row saves nothing.
+    """
+    return _run_import(crud_import.import_medications, db, current_user.id, _csv_rows(file), atomic)
+
+
+@router.post("/appointments", response_model=ImportResult)
+def import_appointments(
+    *,
+    db: Session = Depends(deps.get_db),
+    file: UploadFile = File(...),
+    atomic: bool = False,
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Create many appointments from a CSV file (columns doctor_name,
+    appointment_datetime, location, purpose) or an iCalendar (.ics) file,
+    where each event's SUMMARY is the doctor, DTSTART the time, and LOCATION
+    and DESCRIPTION the location and purpose. Event times are converted to
+    the user's timezone.
+    """
+    is_ics = (file.filename or "").lower().endswith(".ics") or file.content_type == "text/calendar"
+    if is_ics:
+        rows = _ics_rows(file, current_user.timezone or settings.DEFAULT_TIMEZONE)
+    else:
+        rows = _csv_rows(file)
+    return _run_import(crud_import.import_appointments, db, current_user.id, rows, atomic)
@@ -1,26 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
-from typing import List
-from datetime import datetime, timezone
+from typing import List, Optional
+from datetime import date, datetime, timezone
 import pytz  # Import pytz for timezone handling
 
 from app.api import deps
+from app.api.batch import check_batch_size, check_unique_ids, verify_batch_owner
+from app.api.fast_json import list_response
+from app.api.pagination import PageParams, decode_cursor, page_params, paginate
 from app.db import models
-from app.crud import crud_medication
-from app.schemas import medication as medication_schema
+from app.crud import crud_medication, crud_batch, crud_dose
+from app.schemas import dose as dose_schema, medication as medication_schema, user as user_schema
+from app.schemas.batch import BatchDelete
 
 router = APIRouter()
 
 @router.get("/", response_model=List[medication_schema.Medication])
 def read_medications(
+    response: Response,
     db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_user)
+    current_user: user_schema.User = Depends(deps.get_current_user),
+    page: PageParams = Depends(page_params),
+    frequency: Optional[str] = None,
+    timing_type: Optional[str] = None,
 ):
     """
-    Retrieve all medications for the current logged-in user.
+    Retrieve the current user's medications, one page at a time in id order.
+    Pass the X-Next-Cursor header of a page as `cursor` to get the next one.
     """
-    medications = crud_medication.get_medications_by_user(db, owner_id=current_user.id)
-    return medications
+    after = decode_cursor(page.cursor, int)
+    medications = crud_medication.get_medications_by_user(
+        db, owner_id=current_user.id, limit=page.limit + 1, after_id=after[0] if after else None,
+        frequency=frequency, timing_type=timing_type,
+    )
+    page_rows = paginate(response, medications, page.limit, lambda med: (med.id,))
+    return list_response(response, page_rows, medication_schema.Medication)
 
 
 @router.post("/", response_model=medication_schema.Medication, status_code=status.HTTP_201_CREATED)
@@ -28,16 +42,14 @@ def create_medication(
     *,
     db: Session = Depends(deps.get_db),
     medication_in: medication_schema.MedicationCreate,
-    current_user: models.User = Depends(deps.get_current_user)
+    current_user: user_schema.User = Depends(deps.get_current_user)
 ):
     """
     Create a new medication for the current logged-in user with the new structure.
     """
-    # Basic validation for timing
-    if medication_in.timing_type == "Specific-Time" and not medication_in.specific_time:
-        raise HTTPException(status_code=400, detail="Specific time is required for this timing type.")
-    if medication_in.timing_type == "Meal-Related" and not medication_in.meal_timing:
-        raise HTTPException(status_code=400, detail="Meal timing is required for this timing type.")
+    error = crud_medication.timing_rule_error(medication_in)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
         
     medication = crud_medication.create_user_medication(
         db=db, medication=medication_in, owner_id=current_user.id
@@ -45,13 +57,74 @@ def create_medication(
     return medication
 
 
+@router.post("/batch", response_model=List[medication_schema.Medication], status_code=status.HTTP_201_CREATED)
+def create_medications_batch(
+    *,
+    db: Session = Depends(deps.get_db),
+    medications_in: List[medication_schema.MedicationCreate],
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Create several medications for the current user at once.
+    They are saved together in one transaction, or not at all.
+    """
+    check_batch_size(len(medications_in))
+    for index, medication_in in enumerate(medications_in):
+        error = crud_medication.timing_rule_error(medication_in)
+        if error:
+            raise HTTPException(status_code=400, detail=f"Item {index}: {error}")
+    return crud_batch.create_many(
+        db, models.Medication, current_user.id, [item.model_dump() for item in medications_in]
+    )
+
+
+@router.patch("/batch", response_model=List[medication_schema.Medication])
+def update_medications_batch(
+    *,
+    db: Session = Depends(deps.get_db),
+    medications_in: List[medication_schema.MedicationBatchUpdate],
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Update several medications of the current user at once. Each item holds
+    the id and only the fields to change. Ownership of all of them is checked
+    with one query, and the changes are saved in one transaction.
+    """
+    check_batch_size(len(medications_in))
+    ids = [item.id for item in medications_in]
+    check_unique_ids(ids)
+    owners = crud_batch.get_owners(db, models.Medication, ids)
+    verify_batch_owner(owners, ids, current_user, not_found="Medication not found")
+    return crud_batch.update_many(
+        db, models.Medication, current_user.id, [item.model_dump(exclude_unset=True) for item in medications_in]
+    )
+
+
+@router.post("/batch/delete", response_model=List[medication_schema.Medication])
+def delete_medications_batch(
+    *,
+    db: Session = Depends(deps.get_db),
+    batch_in: BatchDelete,
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Delete several medications of the current user at once, in one transaction.
+    Returns the deleted items.
+    """
+    check_batch_size(len(batch_in.ids))
+    check_unique_ids(batch_in.ids)
+    owners = crud_batch.get_owners(db, models.Medication, batch_in.ids)
+    verify_batch_owner(owners, batch_in.ids, current_user, not_found="Medication not found")
+    return crud_batch.delete_many(db, models.Medication, current_user.id, batch_in.ids)
+
+
 @router.put("/{med_id}", response_model=medication_schema.Medication)
 def update_medication(
     *,
     db: Session = Depends(deps.get_db),
     med_id: int,
     medication_in: medication_schema.MedicationUpdate,
-    current_user: models.User = Depends(deps.get_current_user)
+    current_user: user_schema.User = Depends(deps.get_current_user)
 ):
     """
     Update a medication for the current user.
@@ -71,7 +144,7 @@ def delete_medication(
     *,
     db: Session = Depends(deps.get_db),
     med_id: int,
-    current_user: models.User = Depends(deps.get_current_user)
+    current_user: user_schema.User = Depends(deps.get_current_user)
 ):
     """
     Delete a medication for the current user.
@@ -91,12 +164,12 @@ def mark_medication_as_taken(
     *,
     db: Session = Depends(deps.get_db),
     med_id: int,
-    current_user: models.User = Depends(deps.get_current_user)
+    current_user: user_schema.User = Depends(deps.get_current_user)
 ):
     """
     Mark a medication as taken for the current user.
-    NOTE: The logic to prevent duplicate 'taken' marks on the same day has been removed
-    to allow for multi-dose medications until a proper logging system is implemented.
+    Every call is one dose in the medication's dose log, so multi-dose
+    medications keep their full history (see GET /{med_id}/doses).
     """
     db_medication = crud_medication.get_medication_by_id(db, medication_id=med_id)
     if not db_medication:
@@ -109,8 +182,36 @@ def mark_medication_as_taken(
     # as taken more than once per day. This has been removed to support
     # medications that need to be taken multiple times a day.
     
-    # Update the last_taken_at field with the current UTC time
-    update_data = medication_schema.MedicationUpdate(last_taken_at=datetime.now(timezone.utc))
-    medication = crud_medication.update_medication(db, db_medication=db_medication, medication_in=update_data)
+    # Log the dose and update the last_taken_at field with the current UTC time
+    medication = crud_medication.mark_medication_taken(
+        db, db_medication=db_medication, taken_at=datetime.now(timezone.utc), tz_name=current_user.timezone
+    )
     return medication
 
+
+@router.get("/{med_id}/doses", response_model=List[dose_schema.DoseEvent])
+def read_medication_doses(
+    response: Response,
+    med_id: int,
+    db: Session = Depends(deps.get_db),
+    current_user: user_schema.User = Depends(deps.get_current_user),
+    page: PageParams = Depends(page_params),
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+):
+    """
+    Retrieve a medication's dose history, newest first, one page at a time.
+    `start` and `end` limit it to those local days (inclusive).
+    """
+    db_medication = crud_medication.get_medication_by_id(db, medication_id=med_id)
+    if not db_medication:
+        raise HTTPException(status_code=404, detail="Medication not found")
+    if db_medication.owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+
+    before = decode_cursor(page.cursor, int)
+    doses = crud_dose.get_doses(
+        db, medication_id=med_id, limit=page.limit + 1, before_id=before[0] if before else None, start=start, end=end,
+    )
+    return paginate(response, doses, page.limit, lambda dose: (dose.id,))
+
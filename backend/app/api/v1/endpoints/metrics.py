@@ -0,0 +1,18 @@
+# backend/app/api/v1/endpoints/metrics.py
+
+from fastapi import APIRouter, Depends
+
+from app.api import deps
+from app.core.cache import caches
+from app.schemas import user as user_schema
+
+router = APIRouter()
+
+@router.get("/caches")
+def read_cache_stats(
+    current_user: user_schema.User = Depends(deps.get_current_admin),
+):
+    """
+    Admin only: size and hit ratio of every in-process cache of this worker.
+    """
+    return {name: cache.stats() for name, cache in caches.items()}
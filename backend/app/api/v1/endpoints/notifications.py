@@ -0,0 +1,55 @@
+# backend/app/api/v1/endpoints/notifications.py
+
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.orm import Session
+from typing import List
+
+from app.api import deps
+from app.api.pagination import PageParams, decode_cursor, page_params, paginate
+from app.crud import crud_notification
+from app.schemas import notification as notification_schema, user as user_schema
+
+router = APIRouter()
+
+@router.get("/", response_model=List[notification_schema.Notification])
+def read_notifications(
+    response: Response,
+    db: Session = Depends(deps.get_db),
+    current_user: user_schema.User = Depends(deps.get_current_user),
+    page: PageParams = Depends(page_params),
+    unread: bool = False,
+):
+    """
+    Retrieve the current user's in-app notifications, newest first, one page
+    at a time. With `unread=true` only those not marked read yet.
+    """
+    before = decode_cursor(page.cursor, int)
+    notifications = crud_notification.get_inbox(
+        db, user_id=current_user.id, limit=page.limit + 1, before_id=before[0] if before else None, unread_only=unread,
+    )
+    return paginate(response, notifications, page.limit, lambda notification: (notification.id,))
+
+
+@router.post("/read", response_model=notification_schema.NotificationsRead)
+def mark_all_notifications_read(
+    db: Session = Depends(deps.get_db),
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Mark all of the current user's in-app notifications read.
+    """
+    return {"updated": crud_notification.mark_read(db, user_id=current_user.id)}
+
+
+@router.post("/{notification_id}/read", response_model=notification_schema.NotificationsRead)
+def mark_notification_read(
+    notification_id: int,
+    db: Session = Depends(deps.get_db),
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Mark one in-app notification read. Marking it again changes nothing.
+    """
+    if not crud_notification.get_notification(db, user_id=current_user.id, notification_id=notification_id):
+        raise HTTPException(status_code=404, detail="Notification not found")
+    return {"updated": crud_notification.mark_read(db, user_id=current_user.id, notification_id=notification_id)}
@@ -0,0 +1,54 @@
+# backend/app/api/v1/endpoints/tips.py
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date
+
+from app.api import deps
+from app.crud import crud_tip
+from app.schemas import tip as tip_schema, user as user_schema
+from app.utils.tip_catalog import tip_catalog
+
+router = APIRouter()
+
+@router.get("/", response_model=List[tip_schema.Tip])
+def read_tips(
+    category: Optional[str] = None,
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Retrieve all health tips, optionally from one category.
+    Served from the in-memory tip catalog.
+    """
+    return [
+        {"id": tip_id, "tip_text": tip_text, "category": tip_category}
+        for tip_id, tip_text, tip_category in tip_catalog.tips(category)
+    ]
+
+
+@router.get("/today")
+def read_tip_of_the_day(
+    category: Optional[str] = None,
+    current_user: user_schema.User = Depends(deps.get_current_user)
+):
+    """
+    Get the current user's health tip for today. It stays the same all day.
+    """
+    tip_text = tip_catalog.tip_of_the_day(current_user.id, date.today(), category)
+    if tip_text is None:
+        raise HTTPException(status_code=404, detail="No health tips available")
+    return {"tip_text": tip_text}
+
+
+@router.post("/", response_model=tip_schema.Tip, status_code=status.HTTP_201_CREATED)
+def create_tip(
+    *,
+    db: Session = Depends(deps.get_db),
+    tip_in: tip_schema.TipCreate,
+    current_user: user_schema.User = Depends(deps.get_current_admin)
+):
+    """
+    Admin only: add a new health tip.
+    """
+    return crud_tip.create_tip(db, tip=tip_in)
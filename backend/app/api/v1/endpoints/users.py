@@ -33,7 +33,7 @@ def create_user(
 # --- NEW ENDPOINT TO GET CURRENT USER'S PROFILE ---
 @router.get("/me", response_model=user_schema.User)
 def read_user_me(
-    current_user: models.User = Depends(deps.get_current_user)
+    current_user: user_schema.User = Depends(deps.get_current_user)
 ):
     """
     Get current user's profile.
@@ -48,10 +48,12 @@ def update_user_me(
     *,
     db: Session = Depends(deps.get_db),
     user_in: user_schema.UserUpdate,
-    current_user: models.User = Depends(deps.get_current_user)
+    current_user: user_schema.User = Depends(deps.get_current_user)
 ):
     """
     Update current user's profile.
     """
-    user = crud_user.update_user(db, db_user=current_user, user_in=user_in)
+    # current_user is a cached snapshot; load the row to change it
+    db_user = crud_user.get_user(db, user_id=current_user.id)
+    user = crud_user.update_user(db, db_user=db_user, user_in=user_in)
     return user
\ No newline at end of file
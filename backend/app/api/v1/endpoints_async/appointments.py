@@ -0,0 +1,133 @@
+# backend/app/api/v1/endpoints_async/appointments.py
+# Async twin of endpoints/appointments.py, served when DB_MODE = "async".
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import datetime, timezone
+
+from app.api import deps
+from app.api.batch import check_batch_size, check_unique_ids, verify_batch_owner
+from app.api.fast_json import list_response
+from app.api.pagination import PageParams, decode_cursor, page_params, paginate
+from app.db import models
+from app.crud import crud_appointment, crud_batch
+from app.schemas import appointment as appointment_schema, user as user_schema
+from app.schemas.batch import BatchDelete
+
+router = APIRouter()
+
+# Helper function to get and verify an appointment
+async def get_appointment_and_verify_owner(db: AsyncSession, appt_id: int, current_user: user_schema.User) -> models.Appointment:
+    appointment = await crud_appointment.get_appointment_by_id_async(db, appointment_id=appt_id)
+    if not appointment:
+        raise HTTPException(status_code=404, detail="Appointment not found")
+    if appointment.owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return appointment
+
+@router.get("/", response_model=List[appointment_schema.Appointment])
+async def read_appointments(
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: user_schema.User = Depends(deps.get_current_user_async),
+    page: PageParams = Depends(page_params),
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    upcoming: bool = False,
+):
+    """
+    Retrieve the current user's appointments, one page at a time.
+    Most recent first; with `upcoming=true` soonest first, from now on
+    (or from `start`). `start`/`end` limit the date range. Pass the X-Next-Cursor header of a
+    page as `cursor` (with the same filters) to get the next one.
+    """
+    if upcoming and start is None:
+        start = datetime.now(timezone.utc)
+    after = decode_cursor(page.cursor, datetime, int)
+    appointments = await crud_appointment.get_appointments_by_user_async(
+        db, owner_id=current_user.id, limit=page.limit + 1, after=after,
+        start=start, end=end, ascending=upcoming,
+    )
+    page_rows = paginate(response, appointments, page.limit, lambda appt: (appt.appointment_datetime, appt.id))
+    return list_response(response, page_rows, appointment_schema.Appointment)
+
+@router.post("/", response_model=appointment_schema.Appointment, status_code=status.HTTP_201_CREATED)
+async def create_appointment(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    appointment_in: appointment_schema.AppointmentCreate,
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """Create a new appointment for the current logged-in user."""
+    return await crud_appointment.create_user_appointment_async(
+        db=db, appointment=appointment_in, owner_id=current_user.id
+    )
+
+@router.post("/batch", response_model=List[appointment_schema.Appointment], status_code=status.HTTP_201_CREATED)
+async def create_appointments_batch(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    appointments_in: List[appointment_schema.AppointmentCreate],
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Create several appointments for the current user at once.
+    They are saved together in one transaction, or not at all.
+    """
+    check_batch_size(len(appointments_in))
+    return await crud_batch.create_many_async(
+        db, models.Appointment, current_user.id, [item.model_dump() for item in appointments_in]
+    )
+
+
+@router.patch("/batch", response_model=List[appointment_schema.Appointment])
+async def update_appointments_batch(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    appointments_in: List[appointment_schema.AppointmentBatchUpdate],
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Update several appointments of the current user at once. Each item holds
+    the id and only the fields to change. Ownership of all of them is checked
+    with one query, and the changes are saved in one transaction.
+    """
+    check_batch_size(len(appointments_in))
+    ids = [item.id for item in appointments_in]
+    check_unique_ids(ids)
+    owners = await crud_batch.get_owners_async(db, models.Appointment, ids)
+    verify_batch_owner(owners, ids, current_user, not_found="Appointment not found")
+    return await crud_batch.update_many_async(
+        db, models.Appointment, current_user.id, [item.model_dump(exclude_unset=True) for item in appointments_in]
+    )
+
+
+@router.post("/batch/delete", response_model=List[appointment_schema.Appointment])
+async def delete_appointments_batch(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    batch_in: BatchDelete,
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Delete several appointments of the current user at once, in one transaction.
+    Returns the deleted items.
+    """
+    check_batch_size(len(batch_in.ids))
+    check_unique_ids(batch_in.ids)
+    owners = await crud_batch.get_owners_async(db, models.Appointment, batch_in.ids)
+    verify_batch_owner(owners, batch_in.ids, current_user, not_found="Appointment not found")
+    return await crud_batch.delete_many_async(db, models.Appointment, current_user.id, batch_in.ids)
+
+
+@router.delete("/{appt_id}", response_model=appointment_schema.Appointment)
+async def delete_appointment(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    appt_id: int,
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """Delete an appointment for the current user."""
+    appointment = await get_appointment_and_verify_owner(db, appt_id, current_user)
+    return await crud_appointment.delete_appointment_async(db, db_appointment=appointment)
@@ -0,0 +1,152 @@
+# backend/app/api/v1/endpoints_async/contacts.py
+# Async twin of endpoints/contacts.py, served when DB_MODE = "async".
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from app.api import deps
+from app.api.batch import check_batch_size, check_unique_ids, verify_batch_owner
+from app.api.fast_json import list_response
+from app.api.pagination import PageParams, decode_cursor, page_params, paginate
+from app.db import models
+from app.crud import crud_contact, crud_batch
+from app.schemas import contact as contact_schema, sos as sos_schema, user as user_schema
+from app.schemas.batch import BatchDelete
+from app.utils import sos
+
+router = APIRouter()
+
+async def get_contact_and_verify_owner(db: AsyncSession, contact_id: int, current_user: user_schema.User) -> models.EmergencyContact:
+    """Helper function to get a contact and verify its owner."""
+    contact = await crud_contact.get_contact_by_id_async(db, contact_id=contact_id)
+    if not contact:
+        raise HTTPException(status_code=404, detail="Contact not found")
+    if contact.owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return contact
+
+@router.get("/", response_model=List[contact_schema.Contact])
+async def read_contacts(
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: user_schema.User = Depends(deps.get_current_user_async),
+    page: PageParams = Depends(page_params),
+):
+    """
+    Retrieve the current user's emergency contacts, one page at a time in id order.
+    Pass the X-Next-Cursor header of a page as `cursor` to get the next one.
+    """
+    after = decode_cursor(page.cursor, int)
+    contacts = await crud_contact.get_contacts_by_user_async(
+        db, owner_id=current_user.id, limit=page.limit + 1, after_id=after[0] if after else None
+    )
+    page_rows = paginate(response, contacts, page.limit, lambda contact: (contact.id,))
+    return list_response(response, page_rows, contact_schema.Contact)
+
+
+@router.post("/", response_model=contact_schema.Contact, status_code=status.HTTP_201_CREATED)
+async def create_contact(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    contact_in: contact_schema.ContactCreate,
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Create a new emergency contact for the current logged-in user.
+    """
+    return await crud_contact.create_user_contact_async(
+        db=db, contact=contact_in, owner_id=current_user.id
+    )
+
+
+@router.post("/batch", response_model=List[contact_schema.Contact], status_code=status.HTTP_201_CREATED)
+async def create_contacts_batch(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    contacts_in: List[contact_schema.ContactCreate],
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Create several emergency contacts for the current user at once.
+    They are saved together in one transaction, or not at all.
+    """
+    check_batch_size(len(contacts_in))
+    return await crud_batch.create_many_async(
+        db, models.EmergencyContact, current_user.id, [item.model_dump() for item in contacts_in]
+    )
+
+
+@router.patch("/batch", response_model=List[contact_schema.Contact])
+async def update_contacts_batch(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    contacts_in: List[contact_schema.ContactBatchUpdate],
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Update several emergency contacts of the current user at once. Each item holds
+    the id and only the fields to change. Ownership of all of them is checked
+    with one query, and the changes are saved in one transaction.
+    """
+    check_batch_size(len(contacts_in))
+    ids = [item.id for item in contacts_in]
+    check_unique_ids(ids)
+    owners = await crud_batch.get_owners_async(db, models.EmergencyContact, ids)
+    verify_batch_owner(owners, ids, current_user, not_found="Contact not found")
+    return await crud_batch.update_many_async(
+        db, models.EmergencyContact, current_user.id, [item.model_dump(exclude_unset=True) for item in contacts_in]
+    )
+
+
+@router.post("/batch/delete", response_model=List[contact_schema.Contact])
+async def delete_contacts_batch(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    batch_in: BatchDelete,
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Delete several emergency contacts of the current user at once, in one transaction.
+    Returns the deleted items.
+    """
+    check_batch_size(len(batch_in.ids))
+    check_unique_ids(batch_in.ids)
+    owners = await crud_batch.get_owners_async(db, models.EmergencyContact, batch_in.ids)
+    verify_batch_owner(owners, batch_in.ids, current_user, not_found="Contact not found")
+    return await crud_batch.delete_many_async(db, models.EmergencyContact, current_user.id, batch_in.ids)
+
+
+@router.post("/sos", response_model=sos_schema.SOSResult)
+async def send_sos(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    sos_in: sos_schema.SOSRequest,
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Alert all of the current user's emergency contacts at once, over every
+    notification channel listed in SOS_CHANNELS that can reach them.
+    Responds as soon as the first deliveries are acknowledged, and within
+    SOS_LATENCY_BUDGET_SECONDS at most; deliveries still running are listed
+    as "pending" and finish in the background.
+    """
+    contacts = await crud_contact.get_contacts_by_user_async(db, owner_id=current_user.id)
+    if not contacts:
+        raise HTTPException(status_code=400, detail="No emergency contacts to notify.")
+    subject, text = sos.sos_message(current_user.full_name, current_user.email, sos_in.message)
+    return await sos.fan_out(contacts, subject, text, current_user.id)
+
+
+@router.delete("/{contact_id}", response_model=contact_schema.Contact)
+async def delete_contact(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    contact_id: int,
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Delete an emergency contact for the current user.
+    """
+    contact = await get_contact_and_verify_owner(db, contact_id, current_user)
+    return await crud_contact.delete_contact_async(db, db_contact=contact)
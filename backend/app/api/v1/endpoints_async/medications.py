@@ -0,0 +1,196 @@
+# backend/app/api/v1/endpoints_async/medications.py
+# Async twin of endpoints/medications.py, served when DB_MODE = "async".
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date, datetime, timezone
+
+from app.api import deps
+from app.api.batch import check_batch_size, check_unique_ids, verify_batch_owner
+from app.api.fast_json import list_response
+from app.api.pagination import PageParams, decode_cursor, page_params, paginate
+from app.db import models
+from app.crud import crud_medication, crud_batch, crud_dose
+from app.schemas import dose as dose_schema, medication as medication_schema, user as user_schema
+from app.schemas.batch import BatchDelete
+
+router = APIRouter()
+
+async def get_medication_and_verify_owner(db: AsyncSession, med_id: int, current_user: user_schema.User) -> models.Medication:
+    """Helper function to get a medication and verify its owner."""
+    db_medication = await crud_medication.get_medication_by_id_async(db, medication_id=med_id)
+    if not db_medication:
+        raise HTTPException(status_code=404, detail="Medication not found")
+    if db_medication.owner_id != current_user.id:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    return db_medication
+
+@router.get("/", response_model=List[medication_schema.Medication])
+async def read_medications(
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: user_schema.User = Depends(deps.get_current_user_async),
+    page: PageParams = Depends(page_params),
+    frequency: Optional[str] = None,
+    timing_type: Optional[str] = None,
+):
+    """
+    Retrieve the current user's medications, one page at a time in id order.
+    Pass the X-Next-Cursor header of a page as `cursor` to get the next one.
+    """
+    after = decode_cursor(page.cursor, int)
+    medications = await crud_medication.get_medications_by_user_async(
+        db, owner_id=current_user.id, limit=page.limit + 1, after_id=after[0] if after else None,
+        frequency=frequency, timing_type=timing_type,
+    )
+    page_rows = paginate(response, medications, page.limit, lambda med: (med.id,))
+    return list_response(response, page_rows, medication_schema.Medication)
+
+
+@router.post("/", response_model=medication_schema.Medication, status_code=status.HTTP_201_CREATED)
+async def create_medication(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    medication_in: medication_schema.MedicationCreate,
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Create a new medication for the current logged-in user.
+    """
+    error = crud_medication.timing_rule_error(medication_in)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
+
+    return await crud_medication.create_user_medication_async(
+        db=db, medication=medication_in, owner_id=current_user.id
+    )
+
+
+@router.post("/batch", response_model=List[medication_schema.Medication], status_code=status.HTTP_201_CREATED)
+async def create_medications_batch(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    medications_in: List[medication_schema.MedicationCreate],
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Create several medications for the current user at once.
+    They are saved together in one transaction, or not at all.
+    """
+    check_batch_size(len(medications_in))
+    for index, medication_in in enumerate(medications_in):
+        error = crud_medication.timing_rule_error(medication_in)
+        if error:
+            raise HTTPException(status_code=400, detail=f"Item {index}: {error}")
+    return await crud_batch.create_many_async(
+        db, models.Medication, current_user.id, [item.model_dump() for item in medications_in]
+    )
+
+
+@router.patch("/batch", response_model=List[medication_schema.Medication])
+async def update_medications_batch(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    medications_in: List[medication_schema.MedicationBatchUpdate],
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Update several medications of the current user at once. Each item holds
+    the id and only the fields to change. Ownership of all of them is checked
+    with one query, and the changes are saved in one transaction.
+    """
+    check_batch_size(len(medications_in))
+    ids = [item.id for item in medications_in]
+    check_unique_ids(ids)
+    owners = await crud_batch.get_owners_async(db, models.Medication, ids)
+    verify_batch_owner(owners, ids, current_user, not_found="Medication not found")
+    return await crud_batch.update_many_async(
+        db, models.Medication, current_user.id, [item.model_dump(exclude_unset=True) for item in medications_in]
+    )
+
+
+@router.post("/batch/delete", response_model=List[medication_schema.Medication])
+async def delete_medications_batch(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    batch_in: BatchDelete,
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Delete several medications of the current user at once, in one transaction.
+    Returns the deleted items.
+    """
+    check_batch_size(len(batch_in.ids))
+    check_unique_ids(batch_in.ids)
+    owners = await crud_batch.get_owners_async(db, models.Medication, batch_in.ids)
+    verify_batch_owner(owners, batch_in.ids, current_user, not_found="Medication not found")
+    return await crud_batch.delete_many_async(db, models.Medication, current_user.id, batch_in.ids)
+
+
+@router.put("/{med_id}", response_model=medication_schema.Medication)
+async def update_medication(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    med_id: int,
+    medication_in: medication_schema.MedicationUpdate,
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Update a medication for the current user.
+    """
+    db_medication = await get_medication_and_verify_owner(db, med_id, current_user)
+    return await crud_medication.update_medication_async(db, db_medication=db_medication, medication_in=medication_in)
+
+
+@router.delete("/{med_id}", response_model=medication_schema.Medication)
+async def delete_medication(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    med_id: int,
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Delete a medication for the current user.
+    """
+    db_medication = await get_medication_and_verify_owner(db, med_id, current_user)
+    return await crud_medication.delete_medication_async(db, db_medication=db_medication)
+
+
+@router.post("/{med_id}/taken", response_model=medication_schema.Medication)
+async def mark_medication_as_taken(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    med_id: int,
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Mark a medication as taken for the current user.
+    Every call is one dose in the medication's dose log.
+    """
+    db_medication = await get_medication_and_verify_owner(db, med_id, current_user)
+    return await crud_medication.mark_medication_taken_async(
+        db, db_medication=db_medication, taken_at=datetime.now(timezone.utc), tz_name=current_user.timezone
+    )
+
+
+@router.get("/{med_id}/doses", response_model=List[dose_schema.DoseEvent])
+async def read_medication_doses(
+    response: Response,
+    med_id: int,
+    db: AsyncSession = Depends(deps.get_async_db),
+    current_user: user_schema.User = Depends(deps.get_current_user_async),
+    page: PageParams = Depends(page_params),
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+):
+    """
+    Retrieve a medication's dose history, newest first, one page at a time.
+    `start` and `end` limit it to those local days (inclusive).
+    """
+    await get_medication_and_verify_owner(db, med_id, current_user)
+    before = decode_cursor(page.cursor, int)
+    doses = await crud_dose.get_doses_async(
+        db, medication_id=med_id, limit=page.limit + 1, before_id=before[0] if before else None, start=start, end=end,
+    )
+    return paginate(response, doses, page.limit, lambda dose: (dose.id,))
@@ -0,0 +1,52 @@
+# backend/app/api/v1/endpoints_async/users.py
+# Async twin of endpoints/users.py, served when DB_MODE = "async".
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import deps
+from app.crud import crud_user
+from app.schemas import user as user_schema
+
+router = APIRouter()
+
+@router.post("/", response_model=user_schema.User, status_code=status.HTTP_201_CREATED)
+async def create_user(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    user_in: user_schema.UserCreate
+):
+    """
+    Create a new user.
+    """
+    user = await crud_user.get_user_by_email_async(db, email=user_in.email)
+    if user:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="The user with this email already exists in the system.",
+        )
+    return await crud_user.create_user_async(db=db, user=user_in)
+
+
+@router.get("/me", response_model=user_schema.User)
+async def read_user_me(
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Get current user's profile.
+    """
+    return current_user
+
+
+@router.put("/me", response_model=user_schema.User)
+async def update_user_me(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    user_in: user_schema.UserUpdate,
+    current_user: user_schema.User = Depends(deps.get_current_user_async)
+):
+    """
+    Update current user's profile.
+    """
+    db_user = await crud_user.get_user_async(db, user_id=current_user.id)
+    return await crud_user.update_user_async(db, db_user=db_user, user_in=user_in)
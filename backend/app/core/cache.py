@@ -0,0 +1,84 @@
+# backend/app/core/cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from app.core.config import settings
+
+# Every cache registers itself here so its stats can be exposed (see /metrics/caches)
+caches: Dict[str, "TTLCache"] = {}
+
+
+class TTLCache:
+    """
+    A small thread-safe in-process cache with a size bound and per-entry TTL.
+
+    When full, the least recently used entry is evicted. The cache is per
+    process: an invalidation only reaches this worker, so the TTL bounds how
+    long other workers can serve a stale entry.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl_seconds: float):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        caches[name] = self
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Returns the cached value, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+            }
+
+
+# Token subject (email) -> user_schema.User snapshot used by deps.get_current_user.
+# Invalidated by crud_user whenever the profile, password or active flag changes.
+user_cache = TTLCache("current_user", maxsize=settings.USER_CACHE_SIZE, ttl_seconds=settings.USER_CACHE_TTL_SECONDS)
+
+
+# User id -> (date, dashboard payload) used by crud_dashboard.get_dashboard_data.
+# Invalidated by crud_medication and crud_appointment on every write.
+dashboard_cache = TTLCache("dashboard", maxsize=settings.DASHBOARD_CACHE_SIZE, ttl_seconds=settings.DASHBOARD_CACHE_TTL_SECONDS)
\ No newline at end of file
@@ -0,0 +1,222 @@
+# backend/app/core/compression.py
+#
+# gzip / brotli compression of API responses. Only responses whose media type
+# is on the allowlist and whose body is at least COMPRESSION_MINIMUM_SIZE bytes
+# are compressed; small bodies gain little and cost CPU. Streamed responses
+# (no Content-Length, e.g. exports) are compressed chunk by chunk and flushed
+# after every chunk, so each line still reaches the client as it is produced.
+#
+# Documents that never change while the process runs, like the OpenAPI schema,
+# are compressed once per encoding and served from memory afterwards.
+
+import gzip
+import threading
+import zlib
+from typing import Dict, Iterable, Optional, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; without it only gzip is offered
+    brotli = None
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Picks "br" or "gzip" from an Accept-Encoding header, or None.
+    Brotli wins when both are accepted and the brotli package is installed.
+    Codings with q=0 are refused.
+    """
+    accepted = set()
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip())
+    if brotli is not None and ("br" in accepted or "*" in accepted):
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+class _Compressor:
+    """Incremental compressor for one response body."""
+
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=brotli_quality)
+        else:
+            # wbits=31 writes the gzip header and trailer
+            self._gz = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        # Flushed every time so a streamed line is not held back in the buffer
+        if self.encoding == "br":
+            return self._br.process(chunk) + self._br.flush()
+        return self._gz.compress(chunk) + self._gz.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._br.finish()
+        return self._gz.flush(zlib.Z_FINISH)
+
+
+def compress_body(body: bytes, encoding: str, gzip_level: int, brotli_quality: int) -> bytes:
+    """Compresses a complete body in one go."""
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware that compresses eligible responses with gzip or brotli.
+
+    `content_types` is the allowlist of media types (parameters like
+    "; charset=utf-8" are ignored). Responses that already carry a
+    Content-Encoding, or that are smaller than `minimum_size`, are sent as is.
+    GET responses for `static_paths` are compressed once per encoding and
+    replayed from memory; use it only for documents that never change while
+    the process runs.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        content_types: Iterable[str] = ("application/json",),
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        static_paths: Iterable[str] = (),
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = {t.strip().lower() for t in content_types if t.strip()}
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.static_paths = set(static_paths)
+        # (path, encoding) -> (status, headers, compressed body)
+        self._static: Dict[Tuple[str, str], Tuple[int, list, bytes]] = {}
+        self._static_lock = threading.Lock()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        static_key = None
+        if scope["method"] in ("GET", "HEAD") and scope["path"] in self.static_paths:
+            static_key = (scope["path"], encoding)
+            cached = self._static.get(static_key)
+            if cached is not None:
+                await self._send_static(scope, send, *cached)
+                return
+
+        responder = _CompressingResponder(self, send, encoding, static_key)
+        await self.app(scope, receive, responder.send)
+
+    async def _send_static(self, scope: Scope, send: Send, status: int, headers: list, body: bytes) -> None:
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body})
+
+    def is_compressible(self, headers: Headers) -> bool:
+        if "content-encoding" in headers:
+            return False
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return media_type in self.content_types
+
+    def remember_static(self, key: Tuple[str, str], status: int, headers: list, body: bytes) -> None:
+        with self._static_lock:
+            self._static[key] = (status, headers, body)
+
+
+class _CompressingResponder:
+    """Wraps `send` for a single response and decides how to encode it."""
+
+    def __init__(self, middleware: CompressionMiddleware, send: Send, encoding: str, static_key):
+        self.middleware = middleware
+        self._send = send
+        self.encoding = encoding
+        self.static_key = static_key
+        self.start_message: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Held back until the first body chunk shows how big the response is
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        if self.passthrough:
+            await self._send(message)
+            return
+        if self.compressor is not None:
+            await self._send_compressed_chunk(message)
+            return
+
+        # First body chunk: decide
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        status = self.start_message["status"]
+        if not self.middleware.is_compressible(headers) or status in (204, 304):
+            self.passthrough = True
+            await self._send(self.start_message)
+            await self._send(message)
+            return
+
+        headers.add_vary_header("Accept-Encoding")
+        if not more_body:
+            if len(body) < self.middleware.minimum_size:
+                self.passthrough = True
+                await self._send(self.start_message)
+                await self._send(message)
+                return
+            body = compress_body(body, self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality)
+            headers["Content-Encoding"] = self.encoding
+            headers["Content-Length"] = str(len(body))
+            if self.static_key is not None and status == 200:
+                self.middleware.remember_static(self.static_key, status, list(self.start_message["headers"]), body)
+            await self._send(self.start_message)
+            await self._send({"type": "http.response.body", "body": body})
+            return
+
+        # A declared Content-Length below the threshold is not worth a compressor
+        declared_length = headers.get("content-length")
+        if declared_length is not None and int(declared_length) < self.middleware.minimum_size:
+            self.passthrough = True
+            await self._send(self.start_message)
+            await self._send(message)
+            return
+
+        # Streamed body: compress chunk by chunk, length unknown up front
+        self.compressor = _Compressor(self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality)
+        headers["Content-Encoding"] = self.encoding
+        if "content-length" in headers:
+            del headers["Content-Length"]
+        await self._send(self.start_message)
+        await self._send_compressed_chunk(message)
+
+    async def _send_compressed_chunk(self, message: Message) -> None:
+        more_body = message.get("more_body", False)
+        data = self.compressor.compress(message.get("body", b""))
+        if not more_body:
+            data += self.compressor.finish()
+        await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
@@ -1,6 +1,8 @@
 # backend/app/core/config.py
 
 import os
+from datetime import time
+from typing import Optional
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 
@@ -16,22 +18,208 @@ class Settings(BaseSettings):
     
     # --- DATABASE SETTINGS ---
     DATABASE_URL: str
+    # "sync" serves the API with the threadpool stack (create_engine + def
+    # endpoints); "async" switches the main CRUD endpoints to an async engine
+    # (asyncpg / aiosqlite) and async def endpoints. Both serve the same URLs.
+    DB_MODE: str = "sync"
+    # Defaults to DATABASE_URL with its driver swapped for the async one
+    ASYNC_DATABASE_URL: Optional[str] = None
+    ASYNC_DB_POOL_SIZE: int = 20
+    # Refuse to start if the schema is behind the code. Migrations are applied
+    # once per deploy with `alembic upgrade head`, never by the workers.
+    SCHEMA_VERSION_CHECK: bool = True
 
     # --- JWT AUTHENTICATION SETTINGS ---
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
 
+    # --- PASSWORD HASHING SETTINGS ---
+    # Threads that run bcrypt, and how many hashes may be running or waiting
+    # before login/registration/reset answer 503. Keep the limit well below the
+    # request threadpool size (40 by default) so other endpoints stay responsive.
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 16
+
     # --- EMAIL SETTINGS FOR PASSWORD RESET ---
     MAIL_USERNAME: str
     MAIL_PASSWORD: str
     MAIL_FROM: str
     MAIL_PORT: int = 587
     MAIL_SERVER: str
+    # Set to False to talk to a plain local SMTP sink in development
+    MAIL_STARTTLS: bool = True
+    MAIL_TIMEOUT_SECONDS: int = 30
+    # Pooled SMTP sessions, shared by all senders in this process
+    MAIL_POOL_SIZE: int = 4
+    # Separate sessions used only by SOS alerts, so bulk mail cannot hold them up
+    MAIL_PRIORITY_POOL_SIZE: int = 2
+    # Many providers cap messages per session; a session is reopened after this many
+    MAIL_MAX_MESSAGES_PER_CONNECTION: int = 100
+    # Idle sessions older than this are discarded instead of reused
+    MAIL_POOL_IDLE_SECONDS: int = 60
+
+    # --- NOTIFICATION OUTBOX SETTINGS ---
+    # Run the outbox delivery worker inside the API process. Set to False when
+    # running it separately with `python -m app.utils.outbox_worker`.
+    OUTBOX_WORKER_IN_PROCESS: bool = True
+    OUTBOX_POLL_SECONDS: int = 15
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    # Delay before the first retry; doubled after each further failure
+    OUTBOX_RETRY_BASE_SECONDS: int = 30
+    # Claimed notifications are leased for this long while being sent. Must
+    # outlast a whole batch; a worker that dies mid-batch releases them when
+    # it expires (and they may be sent twice).
+    OUTBOX_LEASE_SECONDS: int = 300
+
+    # --- NOTIFICATION CHANNEL SETTINGS ---
+    # Channels each kind of notification goes out on, as
+    # "kind=channel,channel;kind=channel". Kinds not listed use the default.
+    # Accounts have no phone number, so sms only reaches recipients given
+    # one explicitly (emergency contacts).
+    NOTIFICATION_ROUTES: str = "password_reset=email;daily_reminder=email,in_app,webhook;dose_reminder=email,in_app,webhook"
+    NOTIFICATION_DEFAULT_CHANNELS: str = "email"
+    # Per channel: rows claimed per worker round (BATCH_SIZE), provider calls
+    # in flight (CONCURRENCY) and provider calls per second (RATE_PER_SECOND,
+    # 0 = unlimited). Each channel is drained on its own thread.
+    NOTIFY_EMAIL_BATCH_SIZE: int = 100
+    # More than MAIL_POOL_SIZE only queues for an SMTP session
+    NOTIFY_EMAIL_CONCURRENCY: int = 4
+    NOTIFY_EMAIL_RATE_PER_SECOND: float = 0
+    # The webhook channel is only used when a URL is set. Notifications are
+    # POSTed as a JSON list, NOTIFY_WEBHOOK_PER_REQUEST at a time.
+    NOTIFY_WEBHOOK_URL: str = ""
+    NOTIFY_WEBHOOK_TIMEOUT_SECONDS: float = 10
+    NOTIFY_WEBHOOK_BATCH_SIZE: int = 500
+    NOTIFY_WEBHOOK_PER_REQUEST: int = 50
+    NOTIFY_WEBHOOK_CONCURRENCY: int = 2
+    NOTIFY_WEBHOOK_RATE_PER_SECOND: float = 5
+    # SMS is a local stub that logs the message until a provider is wired in
+    NOTIFY_SMS_BATCH_SIZE: int = 50
+    NOTIFY_SMS_CONCURRENCY: int = 2
+    NOTIFY_SMS_RATE_PER_SECOND: float = 10
+    # In-app notifications are only marked delivered, so batches can be large
+    NOTIFY_IN_APP_BATCH_SIZE: int = 1000
+
+    # --- CACHE SETTINGS ---
+    # Per-worker cache of token subject -> user profile used by get_current_user
+    USER_CACHE_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: int = 60
+    # Per-worker cache of each user's dashboard. Writes invalidate it in the
+    # worker that made them; the TTL bounds staleness in the other workers.
+    DASHBOARD_CACHE_SIZE: int = 10000
+    DASHBOARD_CACHE_TTL_SECONDS: int = 30
+
+    # --- CAREGIVER SETTINGS ---
+    # Patients loaded per round of queries when a caregiver's panel is streamed
+    CAREGIVER_PANEL_BATCH_SIZE: int = 200
+
+    # --- SOS SETTINGS ---
+    # Notification channels an SOS goes out on (see app/utils/sos.py); each
+    # is used only if configured (e.g. webhook needs NOTIFY_WEBHOOK_URL).
+    # Add "sms" once a real SMS provider backs that channel.
+    SOS_CHANNELS: str = "email,webhook"
+    # The whole fan-out is cut off after this long
+    SOS_LATENCY_BUDGET_SECONDS: float = 10
+    # The response is sent once this many deliveries are acknowledged
+    SOS_MIN_ACKS: int = 1
+    # A single delivery counts as timed out after this long
+    SOS_DELIVERY_TIMEOUT_SECONDS: float = 8
+    # Calls each channel may have in flight for SOS alerts, on threads of
+    # their own (bulk notifications use the NOTIFY_*_CONCURRENCY threads)
+    SOS_CONCURRENCY: int = 16
+
+    # --- HEALTH TIPS SETTINGS ---
+    # How often each worker loads tips added by other workers into its catalog
+    TIP_CATALOG_REFRESH_SECONDS: int = 300
+
+    # --- ANALYTICS SETTINGS ---
+    # How often the scheduler leader refreshes adherence_stats, and how many
+    # medications it recomputes per batch
+    ADHERENCE_REFRESH_SECONDS: int = 300
+    ADHERENCE_BATCH_SIZE: int = 500
+    # Dose events just below the last run's high-water mark that are looked at
+    # again, for ids that were still being committed when that run read it
+    ADHERENCE_RESCAN_EVENTS: int = 1000
+
+    # --- PAGINATION SETTINGS ---
+    # Rows per page of the list endpoints when no `limit` is given, and the largest `limit` allowed
+    PAGE_SIZE_DEFAULT: int = 50
+    PAGE_SIZE_MAX: int = 200
+
+    # --- RESPONSE SETTINGS ---
+    # Encode list responses with precompiled row adapters and orjson instead
+    # of re-validating every row through its response_model (see app/api/fast_json.py)
+    FAST_JSON: bool = False
+    # gzip/brotli compression of responses (brotli needs the `brotli` package).
+    # Only bodies of at least MINIMUM_SIZE bytes with one of these media types are compressed.
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_CONTENT_TYPES: str = "application/json,application/x-ndjson,text/csv,text/calendar,text/html,text/plain"
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # --- EXPORT SETTINGS ---
+    # Rows fetched per server-side cursor round trip (and per streamed chunk) of an account export
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # --- BATCH WRITE SETTINGS ---
+    # Most items one batch create/update/delete request may carry
+    BATCH_MAX_ITEMS: int = 500
+
+    # --- IMPORT SETTINGS ---
+    # Rows per multi-row INSERT of a bulk import (the whole import is still one transaction)
+    IMPORT_BATCH_SIZE: int = 500
+
+    # --- ADMIN SETTINGS ---
+    # Comma-separated emails of the users allowed to use admin endpoints (e.g. the bulk export)
+    ADMIN_EMAILS: str = ""
 
     # --- FRONTEND SETTINGS ---
     FRONTEND_URL: str
 
+    # --- REMINDER SETTINGS ---
+    # Used for users who have not chosen their own timezone / reminder time
+    DEFAULT_TIMEZONE: str = "Asia/Kolkata"
+    DEFAULT_REMINDER_TIME: time = time(8, 0)
+    # Reminders are sent in slots of this many minutes; must divide 60
+    REMINDER_SLOT_MINUTES: int = 5
+    # Slots missed while no worker led the scheduler (e.g. during a
+    # leadership change) are caught up on if at most this many hours old
+    REMINDER_CATCHUP_HOURS: int = 6
+    # No dose reminder is sent if the medication was marked taken this many
+    # minutes before (or any time after) the dose time
+    DOSE_REMINDER_TAKEN_WINDOW_MINUTES: int = 60
+    # Due medications looked up per query when a tick fires many doses at once
+    DOSE_REMINDER_QUERY_CHUNK: int = 500
+
+    # --- SCHEDULER SETTINGS ---
+    # Scheduled jobs run on this pool instead of the API's event loop:
+    # "threadpool" or "processpool"
+    SCHEDULER_EXECUTOR: str = "threadpool"
+    SCHEDULER_POOL_SIZE: int = 4
+    # Split the daily reminder job into this many chunks that run in parallel
+    REMINDER_JOB_CHUNKS: int = 1
+    # Only the worker holding the scheduler lease runs jobs. A dead leader's
+    # lease expires after the TTL; live leaders renew it every RENEW seconds.
+    SCHEDULER_LEASE_TTL_SECONDS: int = 30
+    SCHEDULER_LEASE_RENEW_SECONDS: int = 10
+    # Number of users the daily reminder job loads per keyset page
+    REMINDER_BATCH_SIZE: int = 500
+
+    @property
+    def admin_emails(self) -> set:
+        return {email.strip().lower() for email in self.ADMIN_EMAILS.split(",") if email.strip()}
+
+    @property
+    def notification_routes(self) -> dict:
+        routes = {}
+        for route in self.NOTIFICATION_ROUTES.split(";"):
+            kind, _, channels = route.partition("=")
+            if kind.strip():
+                routes[kind.strip()] = [channel.strip() for channel in channels.split(",") if channel.strip()]
+        return routes
+
     class Config:
         # This tells Pydantic to look for a .env file if the variables aren't
         # already in the environment. While we load it manually above,
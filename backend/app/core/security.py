@@ -1,5 +1,7 @@
 # backend/app/core/security.py
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -16,6 +18,28 @@ from app.core.config import settings
 # be able to verify passwords hashed with other algorithms if we add more later.
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# --- Password Hashing Pool ---
+# bcrypt is deliberately slow (~100s of ms per call). It runs on its own small
+# thread pool (bcrypt releases the GIL) instead of tying up the request
+# threadpool for the whole hash. At most PASSWORD_HASH_MAX_PENDING calls may be
+# running or queued; beyond that we fail fast with PasswordHasherBusy (a 503)
+# so a login flood cannot starve every other endpoint.
+_hash_pool = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+_hash_slots = threading.BoundedSemaphore(settings.PASSWORD_HASH_MAX_PENDING)
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many password hashes are already running or queued."""
+
+
+def _run_in_hash_pool(func, *args):
+    if not _hash_slots.acquire(blocking=False):
+        raise PasswordHasherBusy()
+    try:
+        return _hash_pool.submit(func, *args).result()
+    finally:
+        _hash_slots.release()
+
 
 # --- Security Functions ---
 
@@ -29,8 +53,11 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
     Returns:
         True if the passwords match, False otherwise.
+
+    Raises:
+        PasswordHasherBusy: If the hashing pool is saturated.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return _run_in_hash_pool(pwd_context.verify, plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
@@ -42,8 +69,11 @@ def get_password_hash(password: str) -> str:
 
     Returns:
         A securely hashed version of the password.
+
+    Raises:
+        PasswordHasherBusy: If the hashing pool is saturated.
     """
-    return pwd_context.hash(password)
+    return _run_in_hash_pool(pwd_context.hash, password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
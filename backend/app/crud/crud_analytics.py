@@ -0,0 +1,89 @@
+# backend/app/crud/crud_analytics.py
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date, timedelta
+
+from app.db import models
+from app.crud.crud_dose import week_start
+from app.utils.adherence import local_date
+
+
+def get_adherence(db: Session, owner_id: int, window_days: int) -> List[dict]:
+    """
+    Every medication of a user with its precomputed adherence for one window,
+    in one indexed query. Medications the refresh job has not reached yet
+    come back with empty figures.
+    """
+    rows = db.execute(
+        select(
+            models.Medication.id, models.Medication.name, models.Medication.frequency,
+            models.AdherenceStat,
+        )
+        .outerjoin(models.AdherenceStat, and_(
+            models.AdherenceStat.medication_id == models.Medication.id,
+            models.AdherenceStat.window_days == window_days,
+        ))
+        .where(models.Medication.owner_id == owner_id)
+        .order_by(models.Medication.id)
+    ).all()
+    result = []
+    for medication_id, name, frequency, stat in rows:
+        item = {"medication_id": medication_id, "name": name, "frequency": frequency, "window_days": window_days}
+        if stat is not None:
+            item.update(
+                computed_for=stat.computed_for,
+                expected_days=stat.expected_days,
+                days_taken=stat.days_taken,
+                missed_days=max(0, stat.expected_days - stat.days_taken),
+                doses_taken=stat.doses_taken,
+                adherence_pct=stat.adherence_pct,
+                current_streak=stat.current_streak,
+                longest_streak=stat.longest_streak,
+            )
+        result.append(item)
+    return result
+
+
+def get_weekly_trend(
+    db: Session, db_medication: models.Medication, weeks: int, today: date, tz_name: str
+) -> List[dict]:
+    """
+    Doses and missed days per week for the last `weeks` weeks (the current
+    one included, counted up to yesterday), read from the weekly rollups:
+    at most `weeks` rows.
+    """
+    first_week = week_start(today) - timedelta(weeks=weeks - 1)
+    rollups = {
+        row.week_start: row
+        for row in db.query(models.DoseRollupWeekly)
+        .filter(models.DoseRollupWeekly.medication_id == db_medication.id)
+        .filter(models.DoseRollupWeekly.week_start >= first_week)
+    }
+    first_day: Optional[date] = local_date(db_medication.created_at, tz_name)
+    if first_day is None:
+        first_day = db.scalar(
+            select(func.min(models.DoseRollupDaily.day))
+            .where(models.DoseRollupDaily.medication_id == db_medication.id)
+        )
+
+    trend = []
+    for index in range(weeks):
+        start = first_week + timedelta(weeks=index)
+        expected_days = 0
+        if db_medication.frequency == "Daily" and first_day is not None:
+            # Completed days of the week on which a dose was due
+            first = max(start, first_day)
+            last = min(start + timedelta(days=6), today - timedelta(days=1))
+            expected_days = max(0, (last - first).days + 1)
+        rollup = rollups.get(start)
+        days_taken = rollup.days_taken if rollup else 0
+        trend.append({
+            "week_start": start,
+            "expected_days": expected_days,
+            "days_taken": days_taken,
+            "missed_days": max(0, expected_days - days_taken),
+            "doses_taken": rollup.doses_taken if rollup else 0,
+        })
+    return trend
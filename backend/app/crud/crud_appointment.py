@@ -1,22 +1,47 @@
 # backend/app/crud/crud_appointment.py
 
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, or_, select
+from typing import List, Optional, Tuple
+from datetime import datetime
 
 from app.db import models
 from app.schemas import appointment as appointment_schema
+from app.core.cache import dashboard_cache
 
-def get_appointments_by_user(db: Session, owner_id: int) -> List[models.Appointment]:
+def _appointments_by_user_stmt(owner_id, limit, after, start, end, ascending):
+    when = models.Appointment.appointment_datetime
+    stmt = select(models.Appointment).where(models.Appointment.owner_id == owner_id)
+    if start is not None:
+        stmt = stmt.where(when >= start)
+    if end is not None:
+        stmt = stmt.where(when <= end)
+    if after is not None:
+        # Rows strictly past (after_datetime, after_id) in the sort order;
+        # the plain range term lets the (owner_id, appointment_datetime) index do the work
+        after_datetime, after_id = after
+        if ascending:
+            stmt = stmt.where(when >= after_datetime, or_(when > after_datetime, models.Appointment.id > after_id))
+        else:
+            stmt = stmt.where(when <= after_datetime, or_(when < after_datetime, models.Appointment.id < after_id))
+    if ascending:
+        stmt = stmt.order_by(when, models.Appointment.id)
+    else:
+        stmt = stmt.order_by(desc(when), desc(models.Appointment.id))
+    return stmt.limit(limit)
+
+
+def get_appointments_by_user(
+    db: Session, owner_id: int, limit: Optional[int] = None, after: Optional[Tuple[datetime, int]] = None,
+    start: Optional[datetime] = None, end: Optional[datetime] = None, ascending: bool = False,
+) -> List[models.Appointment]:
     """
-    Retrieves all appointments for a specific user, ordered by most recent first.
+    Retrieves a user's appointments, most recent first (or soonest first with
+    ascending=True), optionally limited to the range start..end.
+    For keyset paging pass (appointment_datetime, id) of the last row seen as `after`.
     """
-    return (
-        db.query(models.Appointment)
-        .filter(models.Appointment.owner_id == owner_id)
-        .order_by(desc(models.Appointment.appointment_datetime))
-        .all()
-    )
+    return db.scalars(_appointments_by_user_stmt(owner_id, limit, after, start, end, ascending)).all()
 
 
 def create_user_appointment(
@@ -29,4 +54,51 @@ def create_user_appointment(
     db.add(db_appointment)
     db.commit()
     db.refresh(db_appointment)
-    return db_appointment
\ No newline at end of file
+    dashboard_cache.invalidate(owner_id)
+    return db_appointment
+
+
+def delete_appointment(db: Session, db_appointment: models.Appointment) -> models.Appointment:
+    """
+    Deletes an appointment from the database.
+    """
+    db.delete(db_appointment)
+    db.commit()
+    dashboard_cache.invalidate(db_appointment.owner_id)
+    return db_appointment
+
+
+# --- Async variants (DB_MODE = "async") ---
+
+async def get_appointment_by_id_async(db: AsyncSession, appointment_id: int) -> Optional[models.Appointment]:
+    """Retrieves a single appointment by its ID."""
+    return await db.get(models.Appointment, appointment_id)
+
+
+async def get_appointments_by_user_async(
+    db: AsyncSession, owner_id: int, limit: Optional[int] = None, after: Optional[Tuple[datetime, int]] = None,
+    start: Optional[datetime] = None, end: Optional[datetime] = None, ascending: bool = False,
+) -> List[models.Appointment]:
+    """Async version of get_appointments_by_user."""
+    result = await db.scalars(_appointments_by_user_stmt(owner_id, limit, after, start, end, ascending))
+    return list(result)
+
+
+async def create_user_appointment_async(
+    db: AsyncSession, appointment: appointment_schema.AppointmentCreate, owner_id: int
+) -> models.Appointment:
+    """Async version of create_user_appointment."""
+    db_appointment = models.Appointment(**appointment.model_dump(), owner_id=owner_id)
+    db.add(db_appointment)
+    await db.commit()
+    await db.refresh(db_appointment)
+    dashboard_cache.invalidate(owner_id)
+    return db_appointment
+
+
+async def delete_appointment_async(db: AsyncSession, db_appointment: models.Appointment) -> models.Appointment:
+    """Deletes an appointment from the database."""
+    await db.delete(db_appointment)
+    await db.commit()
+    dashboard_cache.invalidate(db_appointment.owner_id)
+    return db_appointment
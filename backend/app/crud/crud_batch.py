@@ -0,0 +1,153 @@
+# backend/app/crud/crud_batch.py
+#
+# Batch writes for the owner-scoped tables (medications, appointments,
+# emergency contacts). Each function applies a whole batch in one transaction
+# with set-based statements instead of one add/commit/refresh per row, and
+# returns plain result rows (they stay readable after the commit without a
+# reload per row).
+
+from collections import defaultdict
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Sequence
+
+from app.db import models
+from app.core.cache import dashboard_cache
+from app.utils.dose_reminders import dose_reminder_engine
+
+
+def _owners_stmt(model, ids: Sequence[int]):
+    return select(model.id, model.owner_id).where(model.id.in_(ids))
+
+
+def _insert_stmt(model):
+    table = model.__table__
+    # Rows come back in the order of the parameters, so callers can pair each
+    # one with the item it was created from
+    return insert(table).returning(*table.c, sort_by_parameter_order=True)
+
+
+def _update_groups(model, items: Sequence[dict]):
+    """
+    Groups the updates by the set of columns they change, so each group is
+    one executemany UPDATE. Yields (statement, parameters).
+    """
+    table = model.__table__
+    groups = defaultdict(list)
+    for item in items:
+        values = {key: value for key, value in item.items() if key != "id"}
+        if values:
+            # Bound names must differ from the column names in an UPDATE
+            groups[tuple(sorted(values))].append(
+                {"_id": item["id"], **{f"_{key}": value for key, value in values.items()}}
+            )
+    for columns, params in groups.items():
+        stmt = (
+            update(table)
+            .where(table.c.id == bindparam("_id"))
+            .values({column: bindparam(f"_{column}") for column in columns})
+        )
+        yield stmt, params
+
+
+def _select_stmt(model, ids: Sequence[int]):
+    table = model.__table__
+    return select(*table.c).where(table.c.id.in_(ids))
+
+
+def _delete_stmt(model, ids: Sequence[int]):
+    table = model.__table__
+    return delete(table).where(table.c.id.in_(ids)).returning(*table.c)
+
+
+def _in_order(rows, ids: Sequence[int]) -> list:
+    by_id = {row.id: row for row in rows}
+    return [by_id[item_id] for item_id in ids]
+
+
+def _after_write(model, owner_id: int, deleted_ids: Sequence[int] = ()) -> None:
+    dashboard_cache.invalidate(owner_id)
+    # Created and updated medications reach the dose reminder engine through
+    # medications.updated_at; deletes are passed on directly
+    if model is models.Medication:
+        for medication_id in deleted_ids:
+            dose_reminder_engine.medication_deleted(medication_id)
+
+
+def get_owners(db: Session, model, ids: Sequence[int]) -> Dict[int, int]:
+    """Returns {id: owner_id} for the rows of `model` that exist, in one query."""
+    return dict(db.execute(_owners_stmt(model, ids)).all())
+
+
+def create_many(db: Session, model, owner_id: int, items: Sequence[dict]) -> list:
+    """
+    Inserts all items for the owner with one multi-row INSERT ... RETURNING
+    and commits once. Returns the new rows in input order.
+    """
+    rows = db.execute(_insert_stmt(model), [{**item, "owner_id": owner_id} for item in items]).all()
+    db.commit()
+    _after_write(model, owner_id)
+    return rows
+
+
+def update_many(db: Session, model, owner_id: int, items: Sequence[dict]) -> list:
+    """
+    Applies partial updates ({"id": ..., column: value, ...}) with one
+    executemany UPDATE per set of changed columns, reads the rows back with a
+    single SELECT and commits once. Returns the rows in input order.
+    Ownership must have been checked (see get_owners).
+    """
+    for stmt, params in _update_groups(model, items):
+        db.execute(stmt, params)
+    ids = [item["id"] for item in items]
+    rows = db.execute(_select_stmt(model, ids)).all()
+    db.commit()
+    _after_write(model, owner_id)
+    return _in_order(rows, ids)
+
+
+def delete_many(db: Session, model, owner_id: int, ids: Sequence[int]) -> list:
+    """
+    Deletes the rows with one DELETE ... RETURNING and commits once.
+    Returns the deleted rows in input order.
+    Ownership must have been checked (see get_owners).
+    """
+    rows = db.execute(_delete_stmt(model, ids)).all()
+    db.commit()
+    _after_write(model, owner_id, deleted_ids=ids)
+    return _in_order(rows, ids)
+
+
+# --- Async variants (DB_MODE = "async") ---
+
+async def get_owners_async(db: AsyncSession, model, ids: Sequence[int]) -> Dict[int, int]:
+    """Async version of get_owners."""
+    return dict((await db.execute(_owners_stmt(model, ids))).all())
+
+
+async def create_many_async(db: AsyncSession, model, owner_id: int, items: Sequence[dict]) -> list:
+    """Async version of create_many."""
+    rows = (await db.execute(_insert_stmt(model), [{**item, "owner_id": owner_id} for item in items])).all()
+    await db.commit()
+    _after_write(model, owner_id)
+    return rows
+
+
+async def update_many_async(db: AsyncSession, model, owner_id: int, items: Sequence[dict]) -> list:
+    """Async version of update_many."""
+    for stmt, params in _update_groups(model, items):
+        await db.execute(stmt, params)
+    ids = [item["id"] for item in items]
+    rows = (await db.execute(_select_stmt(model, ids))).all()
+    await db.commit()
+    _after_write(model, owner_id)
+    return _in_order(rows, ids)
+
+
+async def delete_many_async(db: AsyncSession, model, owner_id: int, ids: Sequence[int]) -> list:
+    """Async version of delete_many."""
+    rows = (await db.execute(_delete_stmt(model, ids))).all()
+    await db.commit()
+    _after_write(model, owner_id, deleted_ids=ids)
+    return _in_order(rows, ids)
@@ -0,0 +1,116 @@
+# backend/app/crud/crud_caregiver.py
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import List, Optional
+
+from app.db import models
+
+
+def get_link(db: Session, caregiver_id: int, patient_id: int) -> Optional[models.CaregiverLink]:
+    return db.scalar(
+        select(models.CaregiverLink)
+        .where(models.CaregiverLink.caregiver_id == caregiver_id, models.CaregiverLink.patient_id == patient_id)
+    )
+
+
+def delete_link(db: Session, db_link: models.CaregiverLink) -> None:
+    """
+    Removes a link; the caregiver loses access right away.
+    """
+    db.delete(db_link)
+    db.commit()
+
+
+def get_invite(db: Session, invite_id: int) -> Optional[models.CaregiverInvite]:
+    return db.get(models.CaregiverInvite, invite_id)
+
+
+def get_pending_invite(db: Session, patient_id: int, email: str) -> Optional[models.CaregiverInvite]:
+    return db.scalar(
+        select(models.CaregiverInvite)
+        .where(models.CaregiverInvite.patient_id == patient_id, models.CaregiverInvite.email == email.lower())
+    )
+
+
+def create_invite(db: Session, patient_id: int, email: str) -> models.CaregiverInvite:
+    """
+    Adds a pending invite WITHOUT committing, flushed so it has its id. The
+    caller commits it together with the invite email it queues.
+    """
+    db_invite = models.CaregiverInvite(patient_id=patient_id, email=email.lower())
+    db.add(db_invite)
+    db.flush()
+    return db_invite
+
+
+def delete_invite(db: Session, db_invite: models.CaregiverInvite) -> None:
+    db.delete(db_invite)
+    db.commit()
+
+
+def accept_invite(db: Session, db_invite: models.CaregiverInvite, caregiver_id: int) -> models.CaregiverLink:
+    """
+    Turns an invite into a link (or keeps the existing one) and removes the invite.
+    """
+    db_link = get_link(db, caregiver_id=caregiver_id, patient_id=db_invite.patient_id)
+    if db_link is None:
+        db_link = models.CaregiverLink(caregiver_id=caregiver_id, patient_id=db_invite.patient_id)
+        db.add(db_link)
+    db.delete(db_invite)
+    db.commit()
+    db.refresh(db_link)
+    return db_link
+
+
+def get_invites_for(db: Session, email: str) -> List[dict]:
+    """The pending invites addressed to an email, oldest first, with who sent them."""
+    rows = db.execute(
+        select(
+            models.CaregiverInvite.id, models.CaregiverInvite.created_at,
+            models.User.id.label("patient_id"), models.User.full_name, models.User.email,
+        )
+        .join(models.User, models.User.id == models.CaregiverInvite.patient_id)
+        .where(models.CaregiverInvite.email == email.lower())
+        .order_by(models.CaregiverInvite.id)
+    )
+    return [
+        {"id": r.id, "patient_id": r.patient_id, "full_name": r.full_name, "email": r.email, "invited_at": r.created_at}
+        for r in rows
+    ]
+
+
+def get_caregivers(db: Session, patient_id: int) -> List[dict]:
+    """The caregivers a patient has linked, oldest link first."""
+    rows = db.execute(
+        select(models.User.id, models.User.full_name, models.User.email, models.CaregiverLink.created_at)
+        .join(models.CaregiverLink, models.CaregiverLink.caregiver_id == models.User.id)
+        .where(models.CaregiverLink.patient_id == patient_id)
+        .order_by(models.CaregiverLink.id)
+    )
+    return [{"id": r.id, "full_name": r.full_name, "email": r.email, "linked_at": r.created_at} for r in rows]
+
+
+def get_patients(
+    db: Session, caregiver_id: int, limit: Optional[int] = None, after_id: Optional[int] = None
+) -> List[dict]:
+    """
+    A caregiver's patients in patient id order, read off the
+    (caregiver_id, patient_id) unique index. For keyset paging pass the id of
+    the last patient seen as `after_id`.
+    """
+    stmt = (
+        select(
+            models.User.id, models.User.full_name, models.User.email, models.User.timezone,
+            models.CaregiverLink.created_at,
+        )
+        .join(models.CaregiverLink, models.CaregiverLink.patient_id == models.User.id)
+        .where(models.CaregiverLink.caregiver_id == caregiver_id)
+    )
+    if after_id is not None:
+        stmt = stmt.where(models.CaregiverLink.patient_id > after_id)
+    rows = db.execute(stmt.order_by(models.CaregiverLink.patient_id).limit(limit))
+    return [
+        {"id": r.id, "full_name": r.full_name, "email": r.email, "timezone": r.timezone, "linked_at": r.created_at}
+        for r in rows
+    ]
@@ -1,16 +1,28 @@
 # backend/app/crud/crud_contact.py
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 
 from app.db import models
 from app.schemas import contact as contact_schema
 
-def get_contacts_by_user(db: Session, owner_id: int) -> List[models.EmergencyContact]:
+def _contacts_by_user_stmt(owner_id, limit, after_id):
+    stmt = select(models.EmergencyContact).where(models.EmergencyContact.owner_id == owner_id)
+    if after_id is not None:
+        stmt = stmt.where(models.EmergencyContact.id > after_id)
+    return stmt.order_by(models.EmergencyContact.id).limit(limit)
+
+
+def get_contacts_by_user(
+    db: Session, owner_id: int, limit: Optional[int] = None, after_id: Optional[int] = None
+) -> List[models.EmergencyContact]:
     """
-    Retrieves all emergency contacts for a specific user.
+    Retrieves a user's emergency contacts in id order.
+    For keyset paging pass the id of the last row seen as `after_id`.
     """
-    return db.query(models.EmergencyContact).filter(models.EmergencyContact.owner_id == owner_id).all()
+    return db.scalars(_contacts_by_user_stmt(owner_id, limit, after_id)).all()
 
 
 def create_user_contact(
@@ -32,4 +44,37 @@ def delete_contact(db: Session, db_contact: models.EmergencyContact) -> models.E
     """
     db.delete(db_contact)
     db.commit()
-    return db_contact
\ No newline at end of file
+    return db_contact
+
+
+# --- Async variants (DB_MODE = "async") ---
+
+async def get_contact_by_id_async(db: AsyncSession, contact_id: int) -> Optional[models.EmergencyContact]:
+    """Retrieves a single emergency contact by its ID."""
+    return await db.get(models.EmergencyContact, contact_id)
+
+
+async def get_contacts_by_user_async(
+    db: AsyncSession, owner_id: int, limit: Optional[int] = None, after_id: Optional[int] = None
+) -> List[models.EmergencyContact]:
+    """Async version of get_contacts_by_user."""
+    result = await db.scalars(_contacts_by_user_stmt(owner_id, limit, after_id))
+    return list(result)
+
+
+async def create_user_contact_async(
+    db: AsyncSession, contact: contact_schema.ContactCreate, owner_id: int
+) -> models.EmergencyContact:
+    """Async version of create_user_contact."""
+    db_contact = models.EmergencyContact(**contact.model_dump(), owner_id=owner_id)
+    db.add(db_contact)
+    await db.commit()
+    await db.refresh(db_contact)
+    return db_contact
+
+
+async def delete_contact_async(db: AsyncSession, db_contact: models.EmergencyContact) -> models.EmergencyContact:
+    """Async version of delete_contact."""
+    await db.delete(db_contact)
+    await db.commit()
+    return db_contact
@@ -0,0 +1,158 @@
+# backend/app/crud/crud_dashboard.py
+
+from collections import defaultdict
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session, aliased
+from typing import Dict, Optional
+from datetime import datetime, timezone
+
+from app.db import models
+from app.schemas import appointment as appointment_schema
+from app.core.cache import dashboard_cache
+from app.utils.reminder_slots import local_day_start_utc, local_today
+
+
+def _pending_today(day_start_utc: datetime):
+    """A 'Daily' medication not taken yet today; the day starts at `day_start_utc` (last_taken_at is UTC)."""
+    return and_(
+        models.Medication.frequency == "Daily",
+        # Check if last_taken_at is NULL or was before today
+        (models.Medication.last_taken_at == None) | (models.Medication.last_taken_at < day_start_utc),
+    )
+
+
+def _medication_item(name, dosage, meal_timing, specific_time) -> dict:
+    return {
+        "name": name,
+        "dosage": dosage,
+        "timing": meal_timing or (specific_time.strftime('%I:%M %p') if specific_time else ''),
+    }
+
+
+def _dashboard_stmt(owner_id: int, day_start_utc: datetime):
+    """
+    One query for the whole dashboard: the user's row, outer-joined to each
+    'Daily' medication not taken yet today and to their next appointment.
+    Returns one row per pending medication (or a single row if there are none).
+    """
+    upcoming = aliased(models.Appointment)
+    next_appointment_id = (
+        select(upcoming.id)
+        .where(upcoming.owner_id == models.User.id)
+        .where(upcoming.appointment_datetime >= datetime.now(timezone.utc))
+        .order_by(upcoming.appointment_datetime)
+        .limit(1)
+        .correlate(models.User)
+        .scalar_subquery()
+    )
+    return (
+        select(
+            models.Medication.name, models.Medication.dosage,
+            models.Medication.meal_timing, models.Medication.specific_time,
+            models.Appointment,
+        )
+        .select_from(models.User)
+        .outerjoin(
+            models.Medication,
+            and_(models.Medication.owner_id == models.User.id, _pending_today(day_start_utc)),
+        )
+        .outerjoin(models.Appointment, models.Appointment.id == next_appointment_id)
+        .where(models.User.id == owner_id)
+        .order_by(models.Medication.id)
+    )
+
+
+def get_dashboard_data(db: Session, owner_id: int, tz_name: Optional[str]) -> dict:
+    """
+    Returns the pending medications of the user's local today (in `tz_name`)
+    and their next appointment.
+    Served from dashboard_cache; crud_medication and crud_appointment
+    invalidate the user's entry on every write, and a new day starts afresh.
+    """
+    today = local_today(tz_name)
+    cached = dashboard_cache.get(owner_id)
+    if cached is not None and cached[0] == today:
+        return cached[1]
+
+    medications_today, next_appointment = [], None
+    stmt = _dashboard_stmt(owner_id, local_day_start_utc(today, tz_name))
+    for name, dosage, meal_timing, specific_time, appointment in db.execute(stmt):
+        if name is not None:
+            medications_today.append(_medication_item(name, dosage, meal_timing, specific_time))
+        if appointment is not None and next_appointment is None:
+            next_appointment = appointment_schema.Appointment.model_validate(appointment).model_dump()
+
+    data = {"medications_today": medications_today, "next_appointment": next_appointment}
+    dashboard_cache.set(owner_id, (today, data))
+    return data
+
+
+
+def get_panel_data(db: Session, owner_timezones: Dict[int, Optional[str]]) -> Dict[int, dict]:
+    """
+    The dashboard data of many users at once, e.g. a caregiver's patients,
+    given as {user id: timezone}; each user's "today" is their own local day.
+    Users with a fresh dashboard_cache entry are served from it; for the rest
+    two queries cover them all, whatever their number: every pending
+    medication (owner_id IN ..., per timezone) and, with a window function,
+    every next appointment. Their entries are cached as if built by
+    get_dashboard_data.
+    """
+    panel, missing = {}, []
+    today_by_owner = {}
+    missing_by_tz = defaultdict(list)
+    for owner_id, tz_name in owner_timezones.items():
+        today = today_by_owner[owner_id] = local_today(tz_name)
+        cached = dashboard_cache.get(owner_id)
+        if cached is not None and cached[0] == today:
+            panel[owner_id] = cached[1]
+        else:
+            missing.append(owner_id)
+            missing_by_tz[tz_name or None].append(owner_id)
+    if not missing:
+        return panel
+
+    # One condition per timezone: its users' local day starts at its own UTC instant
+    pending = or_(*(
+        and_(models.Medication.owner_id.in_(owner_ids), _pending_today(local_day_start_utc(local_today(tz_name), tz_name)))
+        for tz_name, owner_ids in missing_by_tz.items()
+    ))
+
+    medications_by_owner = defaultdict(list)
+    for owner_id, name, dosage, meal_timing, specific_time in db.execute(
+        select(
+            models.Medication.owner_id, models.Medication.name, models.Medication.dosage,
+            models.Medication.meal_timing, models.Medication.specific_time,
+        )
+        .where(pending)
+        .order_by(models.Medication.owner_id, models.Medication.id)
+    ):
+        medications_by_owner[owner_id].append(_medication_item(name, dosage, meal_timing, specific_time))
+
+    # Each user's earliest upcoming appointment: rank them per owner, keep rank 1
+    ranked = (
+        select(
+            models.Appointment.id,
+            func.row_number().over(
+                partition_by=models.Appointment.owner_id,
+                order_by=(models.Appointment.appointment_datetime, models.Appointment.id),
+            ).label("rank"),
+        )
+        .where(models.Appointment.owner_id.in_(missing))
+        .where(models.Appointment.appointment_datetime >= datetime.now(timezone.utc))
+        .subquery()
+    )
+    next_by_owner = {
+        appointment.owner_id: appointment_schema.Appointment.model_validate(appointment).model_dump()
+        for appointment in db.scalars(
+            select(models.Appointment)
+            .join(ranked, ranked.c.id == models.Appointment.id)
+            .where(ranked.c.rank == 1)
+        )
+    }
+
+    for owner_id in missing:
+        data = {"medications_today": medications_by_owner[owner_id], "next_appointment": next_by_owner.get(owner_id)}
+        dashboard_cache.set(owner_id, (today_by_owner[owner_id], data))
+        panel[owner_id] = data
+    return panel
@@ -0,0 +1,124 @@
+# backend/app/crud/crud_dose.py
+
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings
+from app.db import models
+
+
+def local_day(taken_at: datetime, tz_name: Optional[str]) -> date:
+    """The user's local calendar day of an (aware) dose time."""
+    return taken_at.astimezone(ZoneInfo(tz_name or settings.DEFAULT_TIMEZONE)).date()
+
+
+def month_bucket(day: date) -> date:
+    return day.replace(day=1)
+
+
+def week_start(day: date) -> date:
+    """Monday of the day's week."""
+    return day - timedelta(days=day.weekday())
+
+
+def _upsert(dialect_name: str):
+    # INSERT ... ON CONFLICT DO UPDATE is dialect-specific in SQLAlchemy
+    return postgresql.insert if dialect_name == "postgresql" else sqlite.insert
+
+
+def _event_stmt(medication_id: int, owner_id: int, taken_at: datetime, day: date):
+    return insert(models.DoseEvent).values(
+        medication_id=medication_id, owner_id=owner_id, taken_at=taken_at,
+        local_date=day, taken_month=month_bucket(day),
+    )
+
+
+def _daily_stmt(dialect_name: str, medication_id: int, owner_id: int, day: date):
+    table = models.DoseRollupDaily.__table__
+    stmt = _upsert(dialect_name)(table).values(
+        medication_id=medication_id, day=day, owner_id=owner_id, doses_taken=1
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.medication_id, table.c.day],
+        set_={"doses_taken": table.c.doses_taken + 1},
+    ).returning(table.c.doses_taken)
+
+
+def _weekly_stmt(dialect_name: str, medication_id: int, owner_id: int, day: date, first_of_day: bool):
+    table = models.DoseRollupWeekly.__table__
+    stmt = _upsert(dialect_name)(table).values(
+        medication_id=medication_id, week_start=week_start(day), owner_id=owner_id, doses_taken=1, days_taken=1
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.medication_id, table.c.week_start],
+        set_={
+            "doses_taken": table.c.doses_taken + 1,
+            "days_taken": table.c.days_taken + (1 if first_of_day else 0),
+        },
+    )
+
+
+def record_dose(
+    db: Session, medication_id: int, owner_id: int, taken_at: datetime, tz_name: Optional[str] = None
+) -> None:
+    """
+    Appends a dose event and bumps the daily and weekly rollups, WITHOUT
+    committing: the caller commits it together with last_taken_at.
+    Three statements per dose, however long the history is.
+    """
+    day = local_day(taken_at, tz_name)
+    dialect_name = db.get_bind().dialect.name
+    db.execute(_event_stmt(medication_id, owner_id, taken_at, day))
+    doses_that_day = db.execute(_daily_stmt(dialect_name, medication_id, owner_id, day)).scalar_one()
+    db.execute(_weekly_stmt(dialect_name, medication_id, owner_id, day, first_of_day=doses_that_day == 1))
+
+
+def _doses_stmt(medication_id, limit, before_id, start, end):
+    stmt = select(models.DoseEvent).where(models.DoseEvent.medication_id == medication_id)
+    # Bounds on the month bucket as well, so only those months are read
+    if start is not None:
+        stmt = stmt.where(models.DoseEvent.taken_month >= month_bucket(start), models.DoseEvent.local_date >= start)
+    if end is not None:
+        stmt = stmt.where(models.DoseEvent.taken_month <= month_bucket(end), models.DoseEvent.local_date <= end)
+    if before_id is not None:
+        stmt = stmt.where(models.DoseEvent.id < before_id)
+    return stmt.order_by(models.DoseEvent.id.desc()).limit(limit)
+
+
+def get_doses(
+    db: Session, medication_id: int, limit: Optional[int] = None, before_id: Optional[int] = None,
+    start: Optional[date] = None, end: Optional[date] = None,
+) -> List[models.DoseEvent]:
+    """
+    Retrieves a medication's dose events, newest first, optionally limited to
+    local days start..end. For keyset paging pass the id of the last row seen
+    as `before_id`.
+    """
+    return db.scalars(_doses_stmt(medication_id, limit, before_id, start, end)).all()
+
+
+# --- Async variants (DB_MODE = "async") ---
+
+async def record_dose_async(
+    db: AsyncSession, medication_id: int, owner_id: int, taken_at: datetime, tz_name: Optional[str] = None
+) -> None:
+    """Async version of record_dose."""
+    day = local_day(taken_at, tz_name)
+    dialect_name = db.bind.dialect.name
+    await db.execute(_event_stmt(medication_id, owner_id, taken_at, day))
+    doses_that_day = (await db.execute(_daily_stmt(dialect_name, medication_id, owner_id, day))).scalar_one()
+    await db.execute(_weekly_stmt(dialect_name, medication_id, owner_id, day, first_of_day=doses_that_day == 1))
+
+
+async def get_doses_async(
+    db: AsyncSession, medication_id: int, limit: Optional[int] = None, before_id: Optional[int] = None,
+    start: Optional[date] = None, end: Optional[date] = None,
+) -> List[models.DoseEvent]:
+    """Async version of get_doses."""
+    result = await db.scalars(_doses_stmt(medication_id, limit, before_id, start, end))
+    return list(result)
@@ -0,0 +1,62 @@
+# backend/app/crud/crud_export.py
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from app.db import models
+
+# What an account export contains, in output order: (record type, table,
+# column that holds the owner's user id, exported columns).
+# Passwords and reset tokens are never exported.
+EXPORT_SOURCES = [
+    (
+        "user", models.User.__table__, "id",
+        ["id", "email", "full_name", "dob", "address", "is_active", "timezone", "reminder_time"],
+    ),
+    (
+        "medication", models.Medication.__table__, "owner_id",
+        ["id", "owner_id", "name", "dosage", "timing_type", "meal_timing", "specific_time", "frequency", "last_taken_at"],
+    ),
+    (
+        "appointment", models.Appointment.__table__, "owner_id",
+        ["id", "owner_id", "doctor_name", "appointment_datetime", "location", "purpose"],
+    ),
+    (
+        "contact", models.EmergencyContact.__table__, "owner_id",
+        ["id", "owner_id", "contact_name", "phone_number", "relationship_type", "email"],
+    ),
+    (
+        "dose_event", models.DoseEvent.__table__, "owner_id",
+        ["id", "owner_id", "medication_id", "taken_at", "local_date"],
+    ),
+]
+
+
+def export_columns() -> List[str]:
+    """Every exported column name, in first-seen order (the CSV header)."""
+    columns = []
+    for _, _, _, source_columns in EXPORT_SOURCES:
+        columns.extend(c for c in source_columns if c not in columns)
+    return columns
+
+
+def iter_export_batches(
+    db: Session, owner_id: Optional[int], batch_size: int
+) -> Iterator[Tuple[str, Sequence[str], Sequence[tuple]]]:
+    """
+    Yields (record type, column names, rows) one batch of at most `batch_size`
+    rows at a time: first the profile, then the medications, appointments,
+    contacts and dose history. With owner_id=None every account is exported (admin backup),
+    table by table, each row carrying its owner_id.
+
+    Rows are read with yield_per, which uses a server-side cursor on
+    PostgreSQL, so memory stays flat however big the export is.
+    """
+    for record_type, table, owner_column, columns in EXPORT_SOURCES:
+        stmt = select(*(table.c[name] for name in columns)).order_by(table.c.id)
+        if owner_id is not None:
+            stmt = stmt.where(table.c[owner_column] == owner_id)
+        result = db.execute(stmt.execution_options(yield_per=batch_size))
+        for rows in result.partitions():
+            yield record_type, columns, rows
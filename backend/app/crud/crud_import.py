@@ -0,0 +1,86 @@
+# backend/app/crud/crud_import.py
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from pydantic import BaseModel, ValidationError
+from typing import Callable, Iterable, List, Optional, Tuple, Type
+
+from app.db import models
+from app.crud import crud_medication
+from app.schemas import appointment as appointment_schema, medication as medication_schema
+from app.schemas.bulk_import import ImportResult, ImportRowError
+from app.core.cache import dashboard_cache
+
+
+def _bulk_import(
+    db: Session,
+    model,
+    schema: Type[BaseModel],
+    owner_id: int,
+    rows: Iterable[Tuple[int, dict]],
+    batch_size: int,
+    atomic: bool,
+    rule_error: Callable[[BaseModel], Optional[str]] = lambda item: None,
+) -> ImportResult:
+    """
+    Validates (row number, raw values) pairs against `schema` and inserts the
+    valid ones with one multi-row INSERT per `batch_size` rows, all in a
+    single transaction. Invalid rows are skipped and reported. With
+    atomic=True any invalid row rolls the whole import back.
+    """
+    created, errors, batch = 0, [], []
+    try:
+        for row_number, values in rows:
+            try:
+                item = schema.model_validate(values)
+            except ValidationError as e:
+                errors.append(ImportRowError(
+                    row=row_number,
+                    errors=[f"{'.'.join(str(p) for p in err['loc']) or 'row'}: {err['msg']}" for err in e.errors()],
+                ))
+                continue
+            message = rule_error(item)
+            if message:
+                errors.append(ImportRowError(row=row_number, errors=[message]))
+                continue
+            batch.append({**item.model_dump(), "owner_id": owner_id})
+            if len(batch) >= batch_size:
+                db.execute(insert(model), batch)
+                created += len(batch)
+                batch = []
+        if batch:
+            db.execute(insert(model), batch)
+            created += len(batch)
+        if atomic and errors:
+            db.rollback()
+            return ImportResult(created=0, errors=errors)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    if created:
+        dashboard_cache.invalidate(owner_id)
+    return ImportResult(created=created, errors=errors)
+
+
+def import_medications(
+    db: Session, owner_id: int, rows: Iterable[Tuple[int, dict]], batch_size: int, atomic: bool = False
+) -> ImportResult:
+    """
+    Bulk-creates medications for a user from (row number, values) pairs.
+    New timed doses reach the dose reminder engine through
+    medications.updated_at on its next tick.
+    """
+    return _bulk_import(
+        db, models.Medication, medication_schema.MedicationCreate, owner_id, rows, batch_size, atomic,
+        rule_error=crud_medication.timing_rule_error,
+    )
+
+
+def import_appointments(
+    db: Session, owner_id: int, rows: Iterable[Tuple[int, dict]], batch_size: int, atomic: bool = False
+) -> ImportResult:
+    """Bulk-creates appointments for a user from (row number, values) pairs."""
+    return _bulk_import(
+        db, models.Appointment, appointment_schema.AppointmentCreate, owner_id, rows, batch_size, atomic,
+    )
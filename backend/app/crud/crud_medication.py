@@ -1,10 +1,16 @@
 # backend/app/crud/crud_medication.py (Updated and Corrected Version)
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
+from datetime import datetime
 
 from app.db import models
 from app.schemas import medication as medication_schema
+from app.crud import crud_dose
+from app.utils.dose_reminders import dose_reminder_engine
+from app.core.cache import dashboard_cache
 
 def get_medication_by_id(db: Session, medication_id: int) -> Optional[models.Medication]:
     """
@@ -12,11 +18,37 @@ def get_medication_by_id(db: Session, medication_id: int) -> Optional[models.Med
     """
     return db.query(models.Medication).filter(models.Medication.id == medication_id).first()
 
-def get_medications_by_user(db: Session, owner_id: int) -> List[models.Medication]:
+def _medications_by_user_stmt(owner_id, limit, after_id, frequency, timing_type):
+    stmt = select(models.Medication).where(models.Medication.owner_id == owner_id)
+    if frequency is not None:
+        stmt = stmt.where(models.Medication.frequency == frequency)
+    if timing_type is not None:
+        stmt = stmt.where(models.Medication.timing_type == timing_type)
+    if after_id is not None:
+        stmt = stmt.where(models.Medication.id > after_id)
+    return stmt.order_by(models.Medication.id).limit(limit)
+
+
+def get_medications_by_user(
+    db: Session, owner_id: int, limit: Optional[int] = None, after_id: Optional[int] = None,
+    frequency: Optional[str] = None, timing_type: Optional[str] = None,
+) -> List[models.Medication]:
+    """
+    Retrieves a user's medications in id order, optionally filtered.
+    For keyset paging pass the id of the last row seen as `after_id`.
+    """
+    return db.scalars(_medications_by_user_stmt(owner_id, limit, after_id, frequency, timing_type)).all()
+
+
+def timing_rule_error(medication: medication_schema.MedicationCreate) -> Optional[str]:
     """
-    Retrieves all medications for a specific user.
+    The timing fields a new medication must have, as an error message, or None.
     """
-    return db.query(models.Medication).filter(models.Medication.owner_id == owner_id).all()
+    if medication.timing_type == "Specific-Time" and not medication.specific_time:
+        return "Specific time is required for this timing type."
+    if medication.timing_type == "Meal-Related" and not medication.meal_timing:
+        return "Meal timing is required for this timing type."
+    return None
 
 
 def create_user_medication(
@@ -30,6 +62,8 @@ def create_user_medication(
     db.add(db_medication)
     db.commit()
     db.refresh(db_medication)
+    dashboard_cache.invalidate(owner_id)
+    dose_reminder_engine.medication_changed(db_medication)
     return db_medication
 
 
@@ -48,6 +82,26 @@ def update_medication(
     db.add(db_medication)
     db.commit() # This line saves the changes to the database.
     db.refresh(db_medication)
+    dashboard_cache.invalidate(db_medication.owner_id)
+    if update_data.keys() & {"timing_type", "specific_time", "frequency"}:
+        dose_reminder_engine.medication_changed(db_medication)
+    return db_medication
+
+
+def mark_medication_taken(
+    db: Session, db_medication: models.Medication, taken_at: datetime, tz_name: Optional[str] = None
+) -> models.Medication:
+    """
+    Records that a medication was taken at `taken_at`: appends the dose to
+    the dose log (and its rollups) and updates last_taken_at, in one commit.
+    `tz_name` is the owner's timezone, which decides the day the dose counts for.
+    """
+    db_medication.last_taken_at = taken_at
+    db.add(db_medication)
+    crud_dose.record_dose(db, db_medication.id, db_medication.owner_id, taken_at, tz_name)
+    db.commit()
+    db.refresh(db_medication)
+    dashboard_cache.invalidate(db_medication.owner_id)
     return db_medication
 
 
@@ -57,5 +111,70 @@ def delete_medication(db: Session, db_medication: models.Medication) -> models.M
     """
     db.delete(db_medication)
     db.commit()
+    dashboard_cache.invalidate(db_medication.owner_id)
+    dose_reminder_engine.medication_deleted(db_medication.id)
     return db_medication
 
+
+# --- Async variants (DB_MODE = "async") ---
+# Same behaviour as above on an AsyncSession. Dose reminder changes made here
+# reach the engine through medications.updated_at on its next tick.
+
+async def get_medication_by_id_async(db: AsyncSession, medication_id: int) -> Optional[models.Medication]:
+    """Async version of get_medication_by_id."""
+    return await db.get(models.Medication, medication_id)
+
+
+async def get_medications_by_user_async(
+    db: AsyncSession, owner_id: int, limit: Optional[int] = None, after_id: Optional[int] = None,
+    frequency: Optional[str] = None, timing_type: Optional[str] = None,
+) -> List[models.Medication]:
+    """Async version of get_medications_by_user."""
+    result = await db.scalars(_medications_by_user_stmt(owner_id, limit, after_id, frequency, timing_type))
+    return list(result)
+
+
+async def create_user_medication_async(
+    db: AsyncSession, medication: medication_schema.MedicationCreate, owner_id: int
+) -> models.Medication:
+    """Async version of create_user_medication."""
+    db_medication = models.Medication(**medication.model_dump(), owner_id=owner_id)
+    db.add(db_medication)
+    await db.commit()
+    await db.refresh(db_medication)
+    dashboard_cache.invalidate(owner_id)
+    return db_medication
+
+
+async def update_medication_async(
+    db: AsyncSession, db_medication: models.Medication, medication_in: medication_schema.MedicationUpdate
+) -> models.Medication:
+    """Async version of update_medication."""
+    update_data = medication_in.model_dump(exclude_unset=True)
+    for key, value in update_data.items():
+        setattr(db_medication, key, value)
+    await db.commit()
+    await db.refresh(db_medication)
+    dashboard_cache.invalidate(db_medication.owner_id)
+    return db_medication
+
+
+async def mark_medication_taken_async(
+    db: AsyncSession, db_medication: models.Medication, taken_at: datetime, tz_name: Optional[str] = None
+) -> models.Medication:
+    """Async version of mark_medication_taken."""
+    db_medication.last_taken_at = taken_at
+    await crud_dose.record_dose_async(db, db_medication.id, db_medication.owner_id, taken_at, tz_name)
+    await db.commit()
+    await db.refresh(db_medication)
+    dashboard_cache.invalidate(db_medication.owner_id)
+    return db_medication
+
+
+async def delete_medication_async(db: AsyncSession, db_medication: models.Medication) -> models.Medication:
+    """Async version of delete_medication."""
+    await db.delete(db_medication)
+    await db.commit()
+    dashboard_cache.invalidate(db_medication.owner_id)
+    dose_reminder_engine.medication_deleted(db_medication.id)
+    return db_medication
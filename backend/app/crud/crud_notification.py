@@ -0,0 +1,63 @@
+# backend/app/crud/crud_notification.py
+#
+# The in-app inbox: outbox rows of the "in_app" channel that the worker has
+# delivered.
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import datetime, timezone
+
+from app.db import models
+
+IN_APP = "in_app"
+
+
+def _inbox_filter(user_id: int):
+    return (
+        models.NotificationOutbox.user_id == user_id,
+        models.NotificationOutbox.channel == IN_APP,
+        models.NotificationOutbox.status == "sent",
+    )
+
+
+def get_inbox(
+    db: Session, user_id: int, limit: Optional[int] = None, before_id: Optional[int] = None, unread_only: bool = False
+) -> List[models.NotificationOutbox]:
+    """
+    Retrieves a user's in-app notifications, newest first.
+    For keyset paging pass the id of the last row seen as `before_id`.
+    """
+    stmt = select(models.NotificationOutbox).where(*_inbox_filter(user_id))
+    if unread_only:
+        stmt = stmt.where(models.NotificationOutbox.read_at == None)
+    if before_id is not None:
+        stmt = stmt.where(models.NotificationOutbox.id < before_id)
+    return db.scalars(stmt.order_by(models.NotificationOutbox.id.desc()).limit(limit)).all()
+
+
+def get_notification(db: Session, user_id: int, notification_id: int) -> Optional[models.NotificationOutbox]:
+    """Retrieves one of the user's in-app notifications by its ID."""
+    return db.scalars(
+        select(models.NotificationOutbox)
+        .where(*_inbox_filter(user_id))
+        .where(models.NotificationOutbox.id == notification_id)
+    ).first()
+
+
+def mark_read(db: Session, user_id: int, notification_id: Optional[int] = None) -> int:
+    """
+    Marks one of the user's in-app notifications read, or all of them when
+    no id is given, with a single UPDATE. Returns the number of rows changed.
+    """
+    stmt = (
+        update(models.NotificationOutbox)
+        .where(*_inbox_filter(user_id))
+        .where(models.NotificationOutbox.read_at == None)
+        .values(read_at=datetime.now(timezone.utc))
+    )
+    if notification_id is not None:
+        stmt = stmt.where(models.NotificationOutbox.id == notification_id)
+    updated = db.execute(stmt).rowcount
+    db.commit()
+    return updated
@@ -0,0 +1,139 @@
+# backend/app/crud/crud_outbox.py
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+from typing import Iterable, List, Optional
+from datetime import datetime, timedelta, timezone
+
+from app.db import models
+from app.utils.channels import channels_for
+
+
+def enqueue_notification(
+    db: Session,
+    *,
+    kind: str,
+    user_id: Optional[int] = None,
+    email: Optional[str] = None,
+    phone: Optional[str] = None,
+    subject: str,
+    text_content: str,
+    html_content: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
+) -> int:
+    """
+    Adds a notification to the outbox WITHOUT committing, one row for each
+    channel NOTIFICATION_ROUTES sends this kind to and that can reach the
+    recipient. The caller commits it together with the rest of its work, so
+    the notification is only ever queued if that work is saved too.
+    Returns the number of rows queued; channels where the idempotency key is
+    already queued are skipped.
+    """
+    return enqueue_notifications(db, [{
+        "kind": kind, "user_id": user_id, "email": email, "phone": phone,
+        "subject": subject, "text_content": text_content, "html_content": html_content,
+        "idempotency_key": idempotency_key,
+    }])
+
+
+def enqueue_notifications(db: Session, notifications: Iterable[dict]) -> int:
+    """
+    Adds many notifications to the outbox WITHOUT committing.
+    Each item takes the keyword arguments of enqueue_notification. Existing
+    idempotency keys are looked up with one query for the whole batch.
+    Returns the number of rows actually queued.
+    """
+    rows = []
+    for notification in notifications:
+        recipient = {key: notification.get(key) for key in ("user_id", "email", "phone")}
+        for channel in channels_for(notification["kind"]):
+            address = channel.address(recipient)
+            if address:
+                rows.append((channel.name, address, notification))
+
+    keys = [(channel, n["idempotency_key"]) for channel, _, n in rows if n.get("idempotency_key")]
+    existing_keys = set()
+    if keys:
+        existing_keys = set(
+            db.query(models.NotificationOutbox.channel, models.NotificationOutbox.idempotency_key)
+            .filter(tuple_(models.NotificationOutbox.channel, models.NotificationOutbox.idempotency_key).in_(keys))
+            .all()
+        )
+
+    now = datetime.now(timezone.utc)
+    new_rows = []
+    for channel, address, notification in rows:
+        key = (channel, notification.get("idempotency_key"))
+        if key in existing_keys:
+            continue
+        if key[1] is not None:
+            existing_keys.add(key)
+        new_rows.append(
+            models.NotificationOutbox(
+                channel=channel,
+                kind=notification["kind"],
+                idempotency_key=notification.get("idempotency_key"),
+                user_id=notification.get("user_id"),
+                recipient=address,
+                subject=notification["subject"],
+                html_content=notification.get("html_content"),
+                text_content=notification["text_content"],
+                status="pending",
+                attempts=0,
+                next_attempt_at=now,
+                created_at=now,
+            )
+        )
+    db.add_all(new_rows)
+    return len(new_rows)
+
+
+def claim_due(db: Session, channel: str, limit: int, lease_seconds: int) -> List[models.NotificationOutbox]:
+    """
+    Retrieves a channel's oldest pending notifications that are due for a
+    delivery attempt and leases them, WITHOUT committing: their
+    next_attempt_at moves `lease_seconds` ahead.
+    On PostgreSQL the rows are locked with SKIP LOCKED so several workers can
+    claim at once. The caller commits the lease before sending, which releases
+    the locks; the lease then keeps other workers off the rows, and hands them
+    back if this worker dies before recording the outcome.
+    """
+    notifications = (
+        db.query(models.NotificationOutbox)
+        .filter(models.NotificationOutbox.channel == channel)
+        .filter(models.NotificationOutbox.status == "pending")
+        .filter(models.NotificationOutbox.next_attempt_at <= datetime.now(timezone.utc))
+        .order_by(models.NotificationOutbox.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    lease_until = datetime.now(timezone.utc) + timedelta(seconds=lease_seconds)
+    for notification in notifications:
+        notification.next_attempt_at = lease_until
+    return notifications
+
+
+def mark_sent(db_notification: models.NotificationOutbox) -> None:
+    """Records a successful delivery."""
+    db_notification.status = "sent"
+    db_notification.attempts += 1
+    db_notification.last_error = None
+    db_notification.sent_at = datetime.now(timezone.utc)
+
+
+def mark_failed(
+    db_notification: models.NotificationOutbox, error: str, max_attempts: int, retry_base_seconds: int
+) -> None:
+    """
+    Records a failed delivery.
+    The next attempt is pushed back exponentially (base, 2*base, 4*base, ...).
+    After max_attempts the notification is dead-lettered and no longer retried.
+    """
+    db_notification.attempts += 1
+    db_notification.last_error = error
+    if db_notification.attempts >= max_attempts:
+        db_notification.status = "dead"
+        return
+    delay = retry_base_seconds * (2 ** (db_notification.attempts - 1))
+    db_notification.next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
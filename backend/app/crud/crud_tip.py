@@ -0,0 +1,20 @@
+# backend/app/crud/crud_tip.py
+
+from sqlalchemy.orm import Session
+
+from app.db import models
+from app.schemas import tip as tip_schema
+from app.utils.tip_catalog import tip_catalog
+
+
+def create_tip(db: Session, tip: tip_schema.TipCreate) -> models.HealthTip:
+    """
+    Creates a new health tip and adds it to this worker's tip catalog.
+    Other workers pick it up on their next catalog refresh.
+    """
+    db_tip = models.HealthTip(**tip.model_dump())
+    db.add(db_tip)
+    db.commit()
+    db.refresh(db_tip)
+    tip_catalog.add(db_tip)
+    return db_tip
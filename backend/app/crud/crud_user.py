@@ -1,11 +1,16 @@
 # backend/app/crud/crud_user.py
 
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from app.db import models
 from app.schemas import user as user_schema
 from app.core.security import get_password_hash
+from app.core.cache import user_cache
+from app.utils.reminder_slots import compute_reminder_slot
 
 def get_user(db: Session, user_id: int) -> Optional[models.User]:
     """Retrieves a user from the database by their ID."""
@@ -23,7 +28,8 @@ def create_user(db: Session, user: user_schema.UserCreate) -> models.User:
     db_user = models.User(
         email=user.email,
         full_name=user.full_name,
-        hashed_password=hashed_password
+        hashed_password=hashed_password,
+        reminder_slot=compute_reminder_slot(None, None),
     )
     db.add(db_user)
     db.commit()
@@ -44,10 +50,21 @@ def update_user(
     # Set the new values on the existing user object
     for key, value in update_data.items():
         setattr(db_user, key, value)
+
+    # Move the user to the reminder slot of their new local reminder time
+    if "timezone" in update_data or "reminder_time" in update_data:
+        db_user.reminder_slot = compute_reminder_slot(db_user.timezone, db_user.reminder_time)
+    # Dose times are local too; touching the medications makes the dose
+    # reminder engine reschedule them on its next refresh
+    if "timezone" in update_data:
+        db.query(models.Medication).filter(models.Medication.owner_id == db_user.id).update(
+            {models.Medication.updated_at: datetime.now(timezone.utc)}, synchronize_session=False
+        )
         
     db.add(db_user) # Add the updated object to the session
     db.commit() # Commit the changes to the database
     db.refresh(db_user) # Refresh the object with the latest data from the DB
+    user_cache.invalidate(db_user.email)
     return db_user
 def set_password_reset_token(db: Session, db_user: models.User, token: str, expires_at: datetime) -> models.User:
     """Sets a password reset token and expiry on a user object."""
@@ -56,4 +73,65 @@ def set_password_reset_token(db: Session, db_user: models.User, token: str, expi
     db.add(db_user)
     db.commit()
     db.refresh(db_user)
-    return db_user
\ No newline at end of file
+    return db_user
+
+def reset_password(db: Session, db_user: models.User, new_password: str) -> models.User:
+    """Sets a new password and clears the reset token."""
+    db_user.hashed_password = get_password_hash(new_password)
+    # Invalidate the reset token
+    db_user.reset_password_token = None
+    db_user.reset_token_expires_at = None
+    db.add(db_user)
+    db.commit()
+    user_cache.invalidate(db_user.email)
+    return db_user
+
+
+# --- Async variants (DB_MODE = "async") ---
+
+async def get_user_async(db: AsyncSession, user_id: int) -> Optional[models.User]:
+    """Async version of get_user."""
+    return await db.get(models.User, user_id)
+
+
+async def get_user_by_email_async(db: AsyncSession, email: str) -> Optional[models.User]:
+    """Async version of get_user_by_email."""
+    return await db.scalar(select(models.User).where(models.User.email == email))
+
+
+async def create_user_async(db: AsyncSession, user: user_schema.UserCreate) -> models.User:
+    """Async version of create_user; bcrypt runs off the event loop."""
+    hashed_password = await run_in_threadpool(get_password_hash, user.password)
+    db_user = models.User(
+        email=user.email,
+        full_name=user.full_name,
+        hashed_password=hashed_password,
+        reminder_slot=compute_reminder_slot(None, None),
+    )
+    db.add(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    return db_user
+
+
+async def update_user_async(
+    db: AsyncSession, db_user: models.User, user_in: user_schema.UserUpdate
+) -> models.User:
+    """Async version of update_user."""
+    update_data = user_in.model_dump(exclude_unset=True)
+    for key, value in update_data.items():
+        setattr(db_user, key, value)
+
+    if "timezone" in update_data or "reminder_time" in update_data:
+        db_user.reminder_slot = compute_reminder_slot(db_user.timezone, db_user.reminder_time)
+    if "timezone" in update_data:
+        await db.execute(
+            update(models.Medication)
+            .where(models.Medication.owner_id == db_user.id)
+            .values(updated_at=datetime.now(timezone.utc))
+        )
+
+    await db.commit()
+    await db.refresh(db_user)
+    user_cache.invalidate(db_user.email)
+    return db_user
@@ -1,6 +1,7 @@
 # backend/app/db/database.py
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -37,4 +38,39 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# --- Async engine (DB_MODE = "async") ---
+# Used by the async endpoint stack (app/api/v1/endpoints_async). It is only
+# created in async mode, so the async drivers (asyncpg / aiosqlite) are not
+# needed to run the sync stack.
+def to_async_url(url: str) -> str:
+    """Maps a sync DATABASE_URL to its async driver, e.g. postgresql:// -> postgresql+asyncpg://."""
+    for sync_prefix, async_prefix in (
+        ("postgresql+psycopg2://", "postgresql+asyncpg://"),
+        ("postgresql://", "postgresql+asyncpg://"),
+        ("postgres://", "postgresql+asyncpg://"),
+        ("sqlite://", "sqlite+aiosqlite://"),
+    ):
+        if url.startswith(sync_prefix):
+            return async_prefix + url[len(sync_prefix):]
+    return url
+
+async_engine = None
+AsyncSessionLocal = None
+if settings.DB_MODE == "async":
+    async_url = settings.ASYNC_DATABASE_URL or to_async_url(settings.DATABASE_URL)
+    # aiosqlite opens a connection per session (NullPool) and takes no pool size
+    pool_args = {} if async_url.startswith("sqlite") else {"pool_size": settings.ASYNC_DB_POOL_SIZE}
+    async_engine = create_async_engine(async_url, pool_pre_ping=True, **pool_args)
+    # expire_on_commit=False: objects stay readable after commit without an
+    # implicit (and in async mode impossible) lazy reload
+    AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+async def get_async_db():
+    """
+    The async counterpart of get_db, for the async endpoint stack.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,44 @@
+# backend/app/db/migrations.py
+
+import os
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+from .database import engine
+
+# backend/alembic.ini; the revisions live in backend/alembic/versions
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "alembic.ini")
+
+
+def alembic_config() -> Config:
+    """The Alembic config, usable from any working directory."""
+    config = Config(ALEMBIC_INI)
+    config.set_main_option("script_location", os.path.join(os.path.dirname(ALEMBIC_INI), "alembic"))
+    return config
+
+
+def upgrade_to_head():
+    """
+    Applies all pending migrations. Same as `alembic upgrade head`; run it
+    once per deploy (or from scripts such as the benchmarks), not per worker.
+    """
+    command.upgrade(alembic_config(), "head")
+
+
+def check_schema_version():
+    """
+    Cheap startup check: one SELECT on alembic_version compared with the
+    newest revision on disk. Raises RuntimeError if the database is behind,
+    instead of letting requests fail later on a missing column.
+    """
+    head = ScriptDirectory.from_config(alembic_config()).get_current_head()
+    with engine.connect() as connection:
+        current = MigrationContext.configure(connection).get_current_revision()
+    if current != head:
+        raise RuntimeError(
+            f"Database schema is at revision {current}, the code needs {head}. "
+            "Run `alembic upgrade head` from the backend folder."
+        )
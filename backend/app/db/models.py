@@ -1,7 +1,7 @@
 # backend/app/db/models.py
 
 from sqlalchemy import (
-    Boolean, Column, Integer, String, DateTime, Date, ForeignKey, Text, Time
+    Boolean, Column, Integer, Float, String, DateTime, Date, ForeignKey, Text, Time, Index, UniqueConstraint, text
 )
 from sqlalchemy.orm import relationship
 import datetime
@@ -9,6 +9,9 @@ import datetime
 # Import the Base class from our database setup
 from .database import Base
 
+# Condition of the partial index on medications that get dose reminders
+DOSE_SCHEDULE_WHERE = "timing_type = 'Specific-Time' AND frequency = 'Daily' AND specific_time IS NOT NULL"
+
 class User(Base):
     """
     User model for the 'users' table.
@@ -24,6 +27,12 @@ class User(Base):
     # Optional profile details
     dob = Column(Date) # Date of Birth
     address = Column(String)
+
+    # Reminder preferences; NULL means the defaults from settings
+    timezone = Column(String, nullable=True) # IANA name, e.g. "Asia/Kolkata"
+    reminder_time = Column(Time, nullable=True) # Local time of the daily digest
+    # Precomputed UTC slot of reminder_time (see app/utils/reminder_slots.py)
+    reminder_slot = Column(Integer, nullable=True)
      # --- NEW COLUMNS FOR PASSWORD RESET ---
     reset_password_token = Column(String, unique=True, nullable=True)
     reset_token_expires_at = Column(DateTime, nullable=True)
@@ -33,6 +42,11 @@ class User(Base):
     appointments = relationship("Appointment", back_populates="owner")
     contacts = relationship("EmergencyContact", back_populates="owner")
 
+    __table_args__ = (
+        # The reminder job pages through one slot's users in id order
+        Index("ix_users_reminder_slot_id", "reminder_slot", "id"),
+    )
+
 class Medication(Base):
     """
     UPDATED Medication model.
@@ -54,8 +68,33 @@ class Medication(Base):
     # New field for tracking
     last_taken_at = Column(DateTime, nullable=True)
 
+    # When the medication was added; adherence is only expected from then on
+    created_at = Column(
+        DateTime(timezone=True), nullable=True,
+        default=lambda: datetime.datetime.now(datetime.timezone.utc),
+    )
+
+    # Lets the dose reminder engine pick up changes made by other workers
+    updated_at = Column(
+        DateTime(timezone=True), nullable=True, index=True,
+        default=lambda: datetime.datetime.now(datetime.timezone.utc),
+        onupdate=lambda: datetime.datetime.now(datetime.timezone.utc),
+    )
+
     owner_id = Column(Integer, ForeignKey("users.id"))
     owner = relationship("User", back_populates="medications")
+
+    __table_args__ = (
+        # A user's medications, and the 'Daily, not taken today' lookups of
+        # the dashboard and the reminder job
+        Index("ix_medications_owner_frequency_last_taken", "owner_id", "frequency", "last_taken_at"),
+        # Only medications that get a dose reminder; the dose reminder engine loads these
+        Index(
+            "ix_medications_dose_schedule", "owner_id", "specific_time",
+            postgresql_where=text(DOSE_SCHEDULE_WHERE), sqlite_where=text(DOSE_SCHEDULE_WHERE),
+        ),
+    )
+
 class Appointment(Base):
     """
     Appointment model for the 'appointments' table.
@@ -73,6 +112,11 @@ class Appointment(Base):
     # Relationship: Connects this appointment back to the User
     owner = relationship("User", back_populates="appointments")
 
+    __table_args__ = (
+        # A user's appointments by date: the list, the next appointment, today's
+        Index("ix_appointments_owner_datetime", "owner_id", "appointment_datetime"),
+    )
+
 class EmergencyContact(Base):
     """
     EmergencyContact model for the 'emergency_contacts' table.
@@ -83,12 +127,159 @@ class EmergencyContact(Base):
     contact_name = Column(String, nullable=False)
     phone_number = Column(String, nullable=False)
     relationship_type = Column(String) # e.g., "Son", "Doctor", "Neighbor"
+    # Optional; contacts with an email are also reached by email on SOS
+    email = Column(String, nullable=True)
     
-    owner_id = Column(Integer, ForeignKey("users.id"))
+    owner_id = Column(Integer, ForeignKey("users.id"), index=True)
     
     # Relationship: Connects this contact back to the User
     owner = relationship("User", back_populates="contacts")
 
+class CaregiverLink(Base):
+    """
+    CaregiverLink model for the 'caregiver_links' table.
+    Gives a caregiver (or clinic nurse) read access to a patient's dashboard.
+    Links are created when the caregiver accepts the patient's invite, and
+    either side can remove them.
+    """
+    __tablename__ = "caregiver_links"
+
+    id = Column(Integer, primary_key=True, index=True)
+    caregiver_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    patient_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    created_at = Column(
+        DateTime(timezone=True), nullable=False,
+        default=lambda: datetime.datetime.now(datetime.timezone.utc),
+    )
+
+    __table_args__ = (
+        # One link per pair; also serves a caregiver's panel in patient id order
+        UniqueConstraint("caregiver_id", "patient_id", name="uq_caregiver_links_caregiver_patient"),
+    )
+
+class CaregiverInvite(Base):
+    """
+    CaregiverInvite model for the 'caregiver_invites' table.
+    A patient's pending request for someone to become their caregiver,
+    addressed by email so it can be sent whether or not that address has an
+    account yet. Accepting it creates the CaregiverLink.
+    """
+    __tablename__ = "caregiver_invites"
+
+    id = Column(Integer, primary_key=True, index=True)
+    patient_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    email = Column(String, nullable=False, index=True) # Lowercased
+    created_at = Column(
+        DateTime(timezone=True), nullable=False,
+        default=lambda: datetime.datetime.now(datetime.timezone.utc),
+    )
+
+    __table_args__ = (
+        UniqueConstraint("patient_id", "email", name="uq_caregiver_invites_patient_email"),
+        # Ids are never reused (SQLite would reuse a deleted one): the invite
+        # email's idempotency key is built from it
+        {"sqlite_autoincrement": True},
+    )
+
+class DoseEvent(Base):
+    """
+    DoseEvent model for the 'dose_events' table.
+    An append-only log with one row per dose marked as taken; rows are never
+    updated. Events are bucketed by month (taken_month, in the user's local
+    time) and every index leads with the bucket, so reading or dropping a
+    range of history only touches its own months.
+    Adherence is read from the rollup tables below, not from this log.
+    """
+    __tablename__ = "dose_events"
+
+    id = Column(Integer, primary_key=True, index=True)
+    medication_id = Column(Integer, ForeignKey("medications.id", ondelete="CASCADE"), nullable=False)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    taken_at = Column(DateTime(timezone=True), nullable=False)
+    # The user's local calendar day of taken_at, and the first day of its month
+    local_date = Column(Date, nullable=False)
+    taken_month = Column(Date, nullable=False)
+
+    __table_args__ = (
+        # One medication's history, newest first
+        Index("ix_dose_events_medication_month", "medication_id", "taken_month", "id"),
+        # All of one user's doses in a month (export, rollup rebuilds)
+        Index("ix_dose_events_owner_month", "owner_id", "taken_month"),
+    )
+
+class DoseRollupDaily(Base):
+    """
+    DoseRollupDaily model for the 'dose_rollups_daily' table.
+    Doses taken per medication per local day, kept up to date as each dose
+    event is written (see app/crud/crud_dose.py).
+    """
+    __tablename__ = "dose_rollups_daily"
+
+    medication_id = Column(Integer, ForeignKey("medications.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    doses_taken = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_dose_rollups_daily_owner_day", "owner_id", "day"),
+    )
+
+class DoseRollupWeekly(Base):
+    """
+    DoseRollupWeekly model for the 'dose_rollups_weekly' table.
+    Doses taken, and days with at least one dose, per medication per local
+    week (week_start is the Monday). Kept up to date like the daily rollup.
+    """
+    __tablename__ = "dose_rollups_weekly"
+
+    medication_id = Column(Integer, ForeignKey("medications.id", ondelete="CASCADE"), primary_key=True)
+    week_start = Column(Date, primary_key=True)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    doses_taken = Column(Integer, nullable=False, default=0)
+    days_taken = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_dose_rollups_weekly_owner_week", "owner_id", "week_start"),
+    )
+
+class AdherenceStat(Base):
+    """
+    AdherenceStat model for the 'adherence_stats' table.
+    Precomputed adherence per medication for each analytics window (30, 90
+    and 365 completed days), refreshed by a background job from the daily
+    rollups (see app/utils/adherence.py). The analytics API only reads these.
+    """
+    __tablename__ = "adherence_stats"
+
+    medication_id = Column(Integer, ForeignKey("medications.id", ondelete="CASCADE"), primary_key=True)
+    window_days = Column(Integer, primary_key=True)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    # The user's local day the figures were computed on
+    computed_for = Column(Date, nullable=False)
+    expected_days = Column(Integer, nullable=False)
+    days_taken = Column(Integer, nullable=False)
+    doses_taken = Column(Integer, nullable=False)
+    # NULL when nothing is expected (e.g. "As Needed" medications)
+    adherence_pct = Column(Float, nullable=True)
+    current_streak = Column(Integer, nullable=False)
+    longest_streak = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        Index("ix_adherence_stats_owner_window", "owner_id", "window_days"),
+    )
+
+class AggregateRefreshState(Base):
+    """
+    AggregateRefreshState model for the 'aggregate_refresh_state' table.
+    How far a background aggregate refresh has got, so the next run only
+    handles what changed since.
+    """
+    __tablename__ = "aggregate_refresh_state"
+
+    name = Column(String, primary_key=True)
+    last_event_id = Column(Integer, nullable=False, default=0)
+    last_run_at = Column(DateTime(timezone=True), nullable=True)
+
 class HealthTip(Base):
     """
     HealthTip model for the 'health_tips' table.
@@ -98,4 +289,72 @@ class HealthTip(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     tip_text = Column(Text, nullable=False)
-    category = Column(String, default="General") # e.g., "Diet", "Exercise"
\ No newline at end of file
+    category = Column(String, default="General") # e.g., "Diet", "Exercise"
+
+class NotificationOutbox(Base):
+    """
+    NotificationOutbox model for the 'notification_outbox' table.
+    Notifications are written here in the same transaction as the work that
+    caused them, one row per channel they go out on, and are delivered later
+    by the outbox worker (app/utils/outbox_worker.py).
+    Rows of the "in_app" channel are also the user's in-app inbox.
+    """
+    __tablename__ = "notification_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    channel = Column(String, nullable=False) # "email", "webhook", "sms", "in_app"
+    kind = Column(String, nullable=False) # e.g. "password_reset", "daily_reminder"
+    # Stops the same logical notification (e.g. one user's digest for one day)
+    # being queued twice on a channel
+    idempotency_key = Column(String, nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True)
+    # The channel's address: an email, a phone number, a user id...
+    recipient = Column(String, nullable=False)
+    subject = Column(String, nullable=False)
+    html_content = Column(Text, nullable=True)
+    text_content = Column(Text, nullable=False)
+
+    status = Column(String, default="pending", nullable=False) # "pending", "sent", "dead"
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+    read_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("channel", "idempotency_key", name="uq_notification_outbox_channel_key"),
+        # The worker polls each channel for due pending rows. Sent rows pile up
+        # over time, so only pending ones are indexed and the index stays small.
+        Index(
+            "ix_notification_outbox_pending_due", "channel", "next_attempt_at",
+            postgresql_where=text("status = 'pending'"), sqlite_where=text("status = 'pending'"),
+        ),
+        # A user's in-app inbox, newest first
+        Index("ix_notification_outbox_user_channel_id", "user_id", "channel", "id"),
+    )
+
+
+class SchedulerLease(Base):
+    """
+    SchedulerLease model for the 'scheduler_leases' table.
+    One row per lease name; whichever worker holds an unexpired lease is the
+    only one that runs scheduled jobs (see app/utils/leader.py).
+    """
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String, primary_key=True)
+    holder = Column(String, nullable=False) # "<hostname>:<pid>:<random>"
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class ReminderRun(Base):
+    """
+    ReminderRun model for the 'reminder_runs' table.
+    The last reminder slot each daily reminder job chunk finished, so a new
+    scheduler leader can send the slots missed before it took over.
+    """
+    __tablename__ = "reminder_runs"
+
+    job = Column(String, primary_key=True) # "daily-reminders-<chunk>/<chunk count>"
+    slot_start = Column(DateTime(timezone=True), nullable=False) # UTC
@@ -1,34 +1,84 @@
 # backend/app/main.py
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor, ProcessPoolExecutor
 
 from app.api.v1.api import api_router
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.db.database import engine
-from app.db import models
-from app.utils.scheduler import send_daily_reminders # <-- IMPORT our job
-
-# Create the table
-models.Base.metadata.create_all(bind=engine)
+from app.core.security import PasswordHasherBusy
+from app.db.database import async_engine
+from app.db.migrations import check_schema_version
+from app.utils.scheduler import send_daily_reminders, refresh_reminder_slots, init_job_process # <-- IMPORT our job
+from app.utils.outbox_worker import deliver_outbox
+from app.utils.email_utils import priority_smtp_pool, smtp_pool
+from app.utils.leader import scheduler_lease, run_if_leader
+from app.utils.dose_reminders import tick_dose_reminders
+from app.utils.tip_catalog import refresh_tip_catalog
+from app.utils.adherence import refresh_adherence_stats
 
 # --- SCHEDULER SETUP ---
-scheduler = AsyncIOScheduler()
+# Jobs do blocking DB and SMTP work, so they run on a dedicated pool and never
+# on the event loop (or the default executor) that serves API requests.
+if settings.SCHEDULER_EXECUTOR == "processpool":
+    job_executor = ProcessPoolExecutor(
+        settings.SCHEDULER_POOL_SIZE, pool_kwargs={"initializer": init_job_process}
+    )
+else:
+    job_executor = ThreadPoolExecutor(settings.SCHEDULER_POOL_SIZE)
+# The dose reminder engine keeps its heap in this process, so it always runs
+# on its own single thread here, never in a process pool
+scheduler = AsyncIOScheduler(executors={"default": job_executor, "dose": ThreadPoolExecutor(1)})
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # On startup
     print("--- Starting up application and scheduler ---")
-    # Schedule the job to run every day at 8:00 AM India time
-    scheduler.add_job(send_daily_reminders, 'cron', hour=8, minute=0, timezone='Asia/Kolkata')
+    # Tables are created and changed by migrations (`alembic upgrade head`),
+    # run once per deploy; a worker only checks it is on the latest revision
+    if settings.SCHEMA_VERSION_CHECK:
+        check_schema_version()
+    # Every worker serves tips from its own in-memory catalog
+    refresh_tip_catalog()
+    # Every worker schedules the jobs, but only the holder of the scheduler
+    # lease runs them, so N workers do not send N copies of every email
+    scheduler_lease.start()
+    # Run the reminder job at the start of every slot; each run only handles
+    # the users whose local reminder time falls in that slot, after any slots
+    # missed while no worker held the lease.
+    # Each chunk is its own job, so the chunks run in parallel on the job pool
+    for chunk in range(settings.REMINDER_JOB_CHUNKS):
+        scheduler.add_job(
+            run_if_leader, 'cron', minute=f"*/{settings.REMINDER_SLOT_MINUTES}", timezone='UTC',
+            args=[send_daily_reminders, chunk, settings.REMINDER_JOB_CHUNKS], id=f"daily-reminders-{chunk}",
+        )
+    # Fire reminders for timed doses every minute
+    scheduler.add_job(run_if_leader, 'cron', minute='*', args=[tick_dose_reminders], executor="dose", max_instances=1, id="dose-reminders")
+    # Keep the precomputed slots right across daylight saving changes
+    scheduler.add_job(run_if_leader, 'cron', minute=1, timezone='UTC', args=[refresh_reminder_slots], id="refresh-reminder-slots")
+    # Pick up tips added by other workers; runs in every worker, not just the leader
+    scheduler.add_job(refresh_tip_catalog, 'interval', seconds=settings.TIP_CATALOG_REFRESH_SECONDS, id="refresh-tip-catalog")
+    # Recompute the adherence figures of medications with new doses (and all of them after midnight)
+    scheduler.add_job(run_if_leader, 'interval', seconds=settings.ADHERENCE_REFRESH_SECONDS, args=[refresh_adherence_stats], max_instances=1, id="refresh-adherence-stats")
     # scheduler.add_job(send_daily_reminders, 'interval', seconds=60) # Runs every 60 seconds
+    if settings.OUTBOX_WORKER_IN_PROCESS:
+        # Deliver queued notifications in the background; max_instances=1 stops overlapping drains
+        scheduler.add_job(run_if_leader, 'interval', seconds=settings.OUTBOX_POLL_SECONDS, args=[deliver_outbox], max_instances=1, id="outbox-delivery")
     scheduler.start()
     yield
     # On shutdown
     print("--- Shutting down application and scheduler ---")
     scheduler.shutdown()
+    scheduler_lease.stop()
+    smtp_pool.close_all()
+    priority_smtp_pool.close_all()
+    if async_engine is not None:
+        await async_engine.dispose()
 
 # Create the main FastAPI application instance with the lifespan event handler
 app = FastAPI(
@@ -37,6 +87,27 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# A saturated password hashing pool means "try again shortly", not a server error
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Too many sign-in attempts right now, please try again shortly."},
+        headers={"Retry-After": "1"},
+    )
+
+# --- Response compression ---
+# The OpenAPI schema is built once per process, so it is also compressed only once
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+        content_types=settings.COMPRESSION_CONTENT_TYPES.split(","),
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        static_paths=[app.openapi_url],
+    )
+
 # --- CORS Middleware (remains the same) ---
 app.add_middleware(
     CORSMiddleware,
@@ -44,6 +115,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Lets browser clients read the cursor of the next page of a list
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 # ... (rest of the file remains the same) ...
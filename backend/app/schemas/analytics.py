@@ -0,0 +1,35 @@
+# backend/app/schemas/analytics.py
+
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date
+
+# --- Schema for one medication's adherence over a window ---
+# The figures are None until the background refresh has first computed them.
+class MedicationAdherence(BaseModel):
+    medication_id: int
+    name: str
+    frequency: Optional[str] = None
+    window_days: int
+    computed_for: Optional[date] = None # The local day the figures are for
+    expected_days: Optional[int] = None
+    days_taken: Optional[int] = None
+    missed_days: Optional[int] = None
+    doses_taken: Optional[int] = None
+    adherence_pct: Optional[float] = None # None when no daily dose is expected
+    current_streak: Optional[int] = None
+    longest_streak: Optional[int] = None
+
+
+# --- Schemas for a medication's weekly trend ---
+class WeeklyAdherence(BaseModel):
+    week_start: date # Monday
+    expected_days: int
+    days_taken: int
+    missed_days: int
+    doses_taken: int
+
+
+class AdherenceTrend(BaseModel):
+    medication_id: int
+    weeks: List[WeeklyAdherence]
@@ -1,6 +1,6 @@
 # backend/app/schemas/appointment.py
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional
 from datetime import datetime
 
@@ -24,6 +24,19 @@ class AppointmentUpdate(BaseModel):
     location: Optional[str] = Field(None, max_length=200)
     purpose: Optional[str] = Field(None, max_length=300)
 
+    @field_validator("doctor_name", "appointment_datetime")
+    @classmethod
+    def check_not_null(cls, value):
+        # May be left out of an update, but not cleared
+        if value is None:
+            raise ValueError("Cannot be null")
+        return value
+
+
+# --- Schema for one item of a batch update ---
+class AppointmentBatchUpdate(AppointmentUpdate):
+    id: int
+
 
 # --- Schema for Reading/Returning an Appointment ---
 class Appointment(AppointmentBase):
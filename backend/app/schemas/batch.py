@@ -0,0 +1,8 @@
+# backend/app/schemas/batch.py
+
+from pydantic import BaseModel, Field
+from typing import List
+
+# --- Schema for a batch delete ---
+class BatchDelete(BaseModel):
+    ids: List[int] = Field(..., min_length=1)
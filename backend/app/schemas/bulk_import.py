@@ -0,0 +1,15 @@
+# backend/app/schemas/bulk_import.py
+
+from pydantic import BaseModel
+from typing import List
+
+# --- Schema for one rejected row of an import ---
+class ImportRowError(BaseModel):
+    row: int # CSV line number, or position of the event in an .ics file
+    errors: List[str]
+
+
+# --- Schema for the result of a bulk import ---
+class ImportResult(BaseModel):
+    created: int
+    errors: List[ImportRowError] = []
@@ -0,0 +1,34 @@
+# backend/app/schemas/caregiver.py
+
+from pydantic import BaseModel, EmailStr
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+# --- Schema for a patient inviting a caregiver ---
+class CaregiverLinkCreate(BaseModel):
+    caregiver_email: EmailStr
+
+
+# --- Schema for an invite received by the current user ---
+class CaregiverInvite(BaseModel):
+    id: int
+    patient_id: int
+    full_name: Optional[str] = None
+    email: EmailStr
+    invited_at: datetime
+
+
+# --- Schema for the other side of a link (a caregiver or a patient) ---
+class LinkedUser(BaseModel):
+    id: int
+    full_name: Optional[str] = None
+    email: EmailStr
+    linked_at: datetime
+
+
+# --- Schema for one patient on a caregiver's dashboard ---
+class PatientDashboard(BaseModel):
+    patient_id: int
+    full_name: Optional[str] = None
+    medications_today: List[Dict[str, Any]]
+    next_appointment: Optional[Dict[str, Any]] = None
@@ -1,6 +1,6 @@
 # backend/app/schemas/contact.py
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, EmailStr, Field, field_validator
 from typing import Optional
 
 # --- Base Schema ---
@@ -8,6 +8,7 @@ class ContactBase(BaseModel):
     contact_name: str = Field(..., max_length=100)
     phone_number: str = Field(..., max_length=20)
     relationship_type: Optional[str] = Field(None, max_length=50) # e.g., "Son", "Doctor"
+    email: Optional[EmailStr] = None
 
 
 # --- Schema for Creating a Contact ---
@@ -15,6 +16,27 @@ class ContactCreate(ContactBase):
     pass
 
 
+# --- Schema for Updating a Contact ---
+class ContactUpdate(BaseModel):
+    contact_name: Optional[str] = Field(None, max_length=100)
+    phone_number: Optional[str] = Field(None, max_length=20)
+    relationship_type: Optional[str] = Field(None, max_length=50)
+    email: Optional[EmailStr] = None
+
+    @field_validator("contact_name", "phone_number")
+    @classmethod
+    def check_not_null(cls, value):
+        # May be left out of an update, but not cleared
+        if value is None:
+            raise ValueError("Cannot be null")
+        return value
+
+
+# --- Schema for one item of a batch update ---
+class ContactBatchUpdate(ContactUpdate):
+    id: int
+
+
 # --- Schema for Reading/Returning a Contact ---
 class Contact(ContactBase):
     id: int
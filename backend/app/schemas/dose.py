@@ -0,0 +1,14 @@
+# backend/app/schemas/dose.py
+
+from pydantic import BaseModel
+from datetime import date, datetime
+
+# --- Schema for Reading/Returning a Dose Event ---
+class DoseEvent(BaseModel):
+    id: int
+    medication_id: int
+    taken_at: datetime
+    local_date: date # The day the dose counts for, in the user's timezone
+
+    class Config:
+        from_attributes = True
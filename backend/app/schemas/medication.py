@@ -1,6 +1,6 @@
 # backend/app/schemas/medication.py
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional
 from datetime import time, datetime
 
@@ -33,6 +33,19 @@ class MedicationUpdate(BaseModel):
     
     frequency: Optional[str] = None
 
+    @field_validator("name", "dosage", "timing_type", "frequency")
+    @classmethod
+    def check_not_null(cls, value):
+        # May be left out of an update, but not cleared
+        if value is None:
+            raise ValueError("Cannot be null")
+        return value
+
+
+# --- Schema for one item of a batch update ---
+class MedicationBatchUpdate(MedicationUpdate):
+    id: int
+
 
 # --- Schema for Reading/Returning a Medication ---
 class Medication(MedicationBase):
@@ -0,0 +1,22 @@
+# backend/app/schemas/notification.py
+
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+# --- Schema for Reading/Returning an in-app Notification ---
+class Notification(BaseModel):
+    id: int
+    kind: str # e.g. "daily_reminder", "dose_reminder"
+    subject: str
+    text_content: str
+    created_at: datetime
+    read_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+# --- Schema for Returning the outcome of marking notifications read ---
+class NotificationsRead(BaseModel):
+    updated: int
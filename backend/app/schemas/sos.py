@@ -0,0 +1,28 @@
+# backend/app/schemas/sos.py
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+# --- Schema for raising an SOS ---
+class SOSRequest(BaseModel):
+    message: Optional[str] = Field(None, max_length=500) # e.g., "Fell at home, can't get up"
+
+
+# --- Schema for one delivery of an SOS ---
+class SOSDelivery(BaseModel):
+    contact_id: int
+    transport: str # The channel: "email", "webhook", ...
+    status: str # "sent", "failed", "timeout" or "pending" (still running when the response was sent)
+    latency_ms: Optional[float] = None
+    error: Optional[str] = None
+
+
+# --- Schema for Returning the outcome of an SOS ---
+class SOSResult(BaseModel):
+    contacts: int
+    acknowledged: int
+    failed: int
+    pending: int
+    elapsed_ms: float
+    deliveries: List[SOSDelivery]
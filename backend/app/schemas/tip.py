@@ -0,0 +1,21 @@
+# backend/app/schemas/tip.py
+
+from pydantic import BaseModel, Field
+
+# --- Base Schema ---
+class TipBase(BaseModel):
+    tip_text: str = Field(..., min_length=1, max_length=1000)
+    category: str = Field("General", max_length=50) # e.g., "Diet", "Exercise"
+
+
+# --- Schema for Creating a Tip ---
+class TipCreate(TipBase):
+    pass
+
+
+# --- Schema for Reading/Returning a Tip ---
+class Tip(TipBase):
+    id: int
+
+    class Config:
+        from_attributes = True
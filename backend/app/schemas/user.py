@@ -1,8 +1,10 @@
 # backend/app/schemas/user.py
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, field_validator
 from typing import Optional
-from datetime import date
+from datetime import date, time
+
+from app.utils.reminder_slots import is_valid_timezone
 
 # --- Base Schemas ---
 # These contain the common fields shared across other schemas.
@@ -28,6 +30,15 @@ class UserUpdate(BaseModel):
     full_name: Optional[str] = None
     dob: Optional[date] = None
     address: Optional[str] = None
+    timezone: Optional[str] = None # e.g. "Asia/Kolkata"
+    reminder_time: Optional[time] = None # e.g. 08:00:00, in the user's timezone
+
+    @field_validator("timezone")
+    @classmethod
+    def check_timezone(cls, value: Optional[str]) -> Optional[str]:
+        if value is not None and not is_valid_timezone(value):
+            raise ValueError("Unknown timezone")
+        return value
 
 
 # Schema for reading/returning user data (e.g., in a GET response)
@@ -35,6 +46,8 @@ class UserUpdate(BaseModel):
 class User(UserBase):
     id: int
     is_active: bool
+    timezone: Optional[str] = None
+    reminder_time: Optional[time] = None
 
     class Config:
         # This tells Pydantic to read the data even if it is not a dict,
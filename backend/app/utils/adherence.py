@@ -0,0 +1,197 @@
+# backend/app/utils/adherence.py
+
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import and_, delete, exists, func, insert, or_, select
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.db import models
+
+# Windows of completed days served by the analytics API
+ADHERENCE_WINDOWS = (30, 90, 365)
+# Today plus the longest window
+HORIZON_DAYS = max(ADHERENCE_WINDOWS) + 1
+REFRESH_STATE_NAME = "adherence_stats"
+
+
+# --- Day bitsets ---
+# A medication's dose history over the horizon is one integer: bit i is set
+# when at least one dose was taken i days before today (bit 0 is today).
+# Counting and streaks are then whole-integer operations over all days at
+# once instead of a loop over days.
+
+def day_bits(days: Dict[date, int], today: date) -> int:
+    bits = 0
+    for day in days:
+        offset = (today - day).days
+        if 0 <= offset < HORIZON_DAYS:
+            bits |= 1 << offset
+    return bits
+
+
+def trailing_run(bits: int) -> int:
+    """Number of consecutive set bits starting at bit 0."""
+    return (~bits & (bits + 1)).bit_length() - 1
+
+
+def longest_run(bits: int) -> int:
+    """Length of the longest run of set bits: each `x & (x >> 1)` shortens every run by one."""
+    length = 0
+    while bits:
+        bits &= bits >> 1
+        length += 1
+    return length
+
+
+def local_date(value: Optional[datetime], tz_name: str) -> Optional[date]:
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        # SQLite hands back naive datetimes; they are stored in UTC
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(ZoneInfo(tz_name)).date()
+
+
+def compute_stats(
+    days: Dict[date, int], frequency: str, first_day: Optional[date], today: date
+) -> List[dict]:
+    """
+    Figures for every window, from {local day: doses taken} of one medication.
+    Windows cover completed days only (yesterday back to `window` days ago),
+    so a dose not taken yet this morning does not count as missed. A dose is
+    expected every day from `first_day` on for "Daily" medications; other
+    frequencies get no percentage.
+    The current streak runs back from today, or from yesterday if today's
+    dose is still to come.
+    """
+    bits = day_bits(days, today)
+    current_streak = trailing_run(bits) if bits & 1 else trailing_run(bits >> 1)
+    stats = []
+    for window in ADHERENCE_WINDOWS:
+        window_bits = bits & (((1 << window) - 1) << 1)
+        expected_days = 0
+        if frequency == "Daily" and first_day is not None:
+            expected_days = max(0, min(window, (today - first_day).days))
+        expected_bits = window_bits & (((1 << expected_days) - 1) << 1)
+        stats.append({
+            "window_days": window,
+            "computed_for": today,
+            "expected_days": expected_days,
+            "days_taken": window_bits.bit_count(),
+            "doses_taken": sum(n for day, n in days.items() if 1 <= (today - day).days <= window),
+            "adherence_pct": round(100 * expected_bits.bit_count() / expected_days, 1) if expected_days else None,
+            "current_streak": current_streak,
+            "longest_streak": longest_run(window_bits),
+        })
+    return stats
+
+
+# --- The refresh job ---
+
+def _timezone_filter(tz_name: str):
+    if tz_name == settings.DEFAULT_TIMEZONE:
+        return or_(models.User.timezone == tz_name, models.User.timezone == None)
+    return models.User.timezone == tz_name
+
+
+def _refresh_batch(db, medications, tz_name: str, today: date) -> None:
+    """Recomputes and replaces the stats of one batch of medications."""
+    ids = [med.id for med in medications]
+    days_by_med = defaultdict(dict)
+    for medication_id, day, doses in db.execute(
+        select(models.DoseRollupDaily.medication_id, models.DoseRollupDaily.day, models.DoseRollupDaily.doses_taken)
+        .where(models.DoseRollupDaily.medication_id.in_(ids))
+        .where(models.DoseRollupDaily.day > today - timedelta(days=HORIZON_DAYS))
+    ):
+        days_by_med[medication_id][day] = doses
+    # Medications from before created_at existed start at their first logged dose
+    first_dose_day = dict(db.execute(
+        select(models.DoseRollupDaily.medication_id, func.min(models.DoseRollupDaily.day))
+        .where(models.DoseRollupDaily.medication_id.in_([med.id for med in medications if med.created_at is None]))
+        .group_by(models.DoseRollupDaily.medication_id)
+    ).all())
+
+    rows = []
+    for med in medications:
+        first_day = local_date(med.created_at, tz_name) or first_dose_day.get(med.id)
+        for stat in compute_stats(days_by_med[med.id], med.frequency, first_day, today):
+            rows.append({"medication_id": med.id, "owner_id": med.owner_id, **stat})
+    db.execute(delete(models.AdherenceStat).where(models.AdherenceStat.medication_id.in_(ids)))
+    db.execute(insert(models.AdherenceStat), rows)
+    db.commit()
+
+
+def refresh_adherence_stats() -> None:
+    """
+    Brings adherence_stats up to date. Only medications that need it are
+    recomputed: those with doses logged since the last run, those edited
+    since (frequency may have changed), and those whose figures are from an
+    earlier local day (windows and streaks move at midnight). Runs on the
+    scheduler leader every ADHERENCE_REFRESH_SECONDS.
+
+    Dose event ids are handed out before their transactions commit, so an
+    event can become visible after a higher id was already counted. Each run
+    therefore also looks at the last ADHERENCE_RESCAN_EVENTS ids below the
+    previous mark; recomputing a medication replaces its rows, so seeing an
+    event twice is harmless.
+    """
+    started_at = datetime.now(timezone.utc)
+    db = SessionLocal()
+    try:
+        state = db.get(models.AggregateRefreshState, REFRESH_STATE_NAME)
+        if state is None:
+            state = models.AggregateRefreshState(name=REFRESH_STATE_NAME, last_event_id=0)
+            db.add(state)
+            db.flush()
+        last_event_id = state.last_event_id
+        # Events written after this point are picked up by the next run
+        max_event_id = db.scalar(select(func.max(models.DoseEvent.id))) or 0
+
+        new_doses = exists().where(and_(
+            models.DoseEvent.medication_id == models.Medication.id,
+            models.DoseEvent.id > last_event_id - settings.ADHERENCE_RESCAN_EVENTS,
+            models.DoseEvent.id <= max_event_id,
+        ))
+        changed = or_(new_doses, models.Medication.updated_at > state.last_run_at) if state.last_run_at else new_doses
+
+        tz_names = {tz or settings.DEFAULT_TIMEZONE for (tz,) in db.query(models.User.timezone).distinct()}
+        refreshed = 0
+        for tz_name in sorted(tz_names):
+            today = datetime.now(ZoneInfo(tz_name)).date()
+            current = exists().where(and_(
+                models.AdherenceStat.medication_id == models.Medication.id,
+                models.AdherenceStat.computed_for == today,
+            ))
+            last_id = 0
+            while True:
+                medications = (
+                    db.query(
+                        models.Medication.id, models.Medication.owner_id,
+                        models.Medication.frequency, models.Medication.created_at,
+                    )
+                    .join(models.User, models.User.id == models.Medication.owner_id)
+                    .filter(_timezone_filter(tz_name))
+                    .filter(or_(~current, changed))
+                    .filter(models.Medication.id > last_id)
+                    .order_by(models.Medication.id)
+                    .limit(settings.ADHERENCE_BATCH_SIZE)
+                    .all()
+                )
+                if not medications:
+                    break
+                last_id = medications[-1].id
+                _refresh_batch(db, medications, tz_name, today)
+                refreshed += len(medications)
+
+        state = db.get(models.AggregateRefreshState, REFRESH_STATE_NAME)
+        state.last_event_id = max_event_id
+        state.last_run_at = started_at
+        db.commit()
+    finally:
+        db.close()
+    if refreshed:
+        print(f"--- Adherence stats refreshed for {refreshed} medications at {datetime.now()} ---")
@@ -0,0 +1,259 @@
+# backend/app/utils/channels.py
+#
+# Notification channels. Callers queue channel-agnostic notifications with
+# crud_outbox.enqueue_notification(s); NOTIFICATION_ROUTES decides which
+# channels each kind goes out on, and the outbox worker hands every channel
+# its own due rows.
+#
+# A channel sets how it batches (notifications per provider call), how many
+# calls it keeps in flight and how many calls per second it may make, so each
+# one can be tuned to its provider independently. Adding a channel means
+# subclassing Channel and registering it; callers do not change.
+
+import json
+import threading
+from abc import ABC, abstractmethod
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from html import escape
+from typing import Dict, List, Optional, Sequence
+
+from app.core.config import settings
+from .email_utils import deliver_email
+
+
+class RateLimiter:
+    """
+    Token bucket shared by all threads of a channel: on average at most
+    `rate` acquisitions per second, in bursts of up to `burst`.
+    A rate of 0 means unlimited.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.burst = burst or max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, priority: bool = False) -> None:
+        """
+        Takes one token, sleeping until one is available. A `priority` caller
+        never waits: it takes the token on credit, and the callers after it
+        wait that much longer.
+        """
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1 or priority:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class Channel(ABC):
+    """
+    One way of delivering notifications. Subclasses set `name` and implement
+    address() and send(); `per_call` is how many notifications one send()
+    takes.
+    """
+    name = ""
+    per_call = 1
+
+    def __init__(self, batch_size: int, concurrency: int = 1, rate_per_second: float = 0):
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.limiter = RateLimiter(rate_per_second)
+
+    def enabled(self) -> bool:
+        return True
+
+    @abstractmethod
+    def address(self, recipient: dict) -> Optional[str]:
+        """
+        Where this channel reaches a recipient ({"user_id", "email", "phone"}),
+        or None if it cannot.
+        """
+
+    @abstractmethod
+    def send(self, notifications: Sequence) -> None:
+        """One provider call for up to `per_call` outbox rows; raises if it failed."""
+
+    def send_priority(self, notifications: Sequence) -> None:
+        """
+        send() for alerts that must not queue behind bulk traffic. Channels
+        whose provider client has shared, limited resources (e.g. the SMTP
+        pool) override it to use ones set aside.
+        """
+        self.send(notifications)
+
+    def deliver(self, notifications: Sequence, priority: bool = False) -> List[Optional[Exception]]:
+        """
+        Sends a claimed batch, `per_call` rows per call with up to
+        `concurrency` calls in flight, each call waiting for the rate limiter.
+        With `priority` calls go ahead of the rate limiter and use
+        send_priority().
+        Returns one entry per row, in order: None on success, otherwise the
+        exception.
+        """
+        chunks = [notifications[i:i + self.per_call] for i in range(0, len(notifications), self.per_call)]
+        send = self.send_priority if priority else self.send
+
+        def _call(chunk):
+            self.limiter.acquire(priority)
+            try:
+                send(chunk)
+                return [None] * len(chunk)
+            except Exception as e:
+                return [e] * len(chunk)
+
+        if self.concurrency <= 1 or len(chunks) <= 1:
+            results = [_call(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(chunks))) as executor:
+                results = list(executor.map(_call, chunks))
+        return [error for chunk_errors in results for error in chunk_errors]
+
+
+class EmailChannel(Channel):
+    """Email over the pooled SMTP sessions, one message per call."""
+    name = "email"
+
+    def enabled(self) -> bool:
+        return bool(settings.MAIL_SERVER)
+
+    def address(self, recipient: dict) -> Optional[str]:
+        return recipient.get("email")
+
+    def send(self, notifications: Sequence) -> None:
+        self._send(notifications, priority=False)
+
+    def send_priority(self, notifications: Sequence) -> None:
+        # Over the SMTP sessions kept for priority mail
+        self._send(notifications, priority=True)
+
+    def _send(self, notifications: Sequence, priority: bool) -> None:
+        for notification in notifications:
+            html = notification.html_content or f"<html><body><p>{escape(notification.text_content)}</p></body></html>"
+            deliver_email(notification.recipient, notification.subject, html, notification.text_content, priority)
+
+
+class WebhookChannel(Channel):
+    """POSTs notifications to NOTIFY_WEBHOOK_URL as a JSON list, NOTIFY_WEBHOOK_PER_REQUEST per request."""
+    name = "webhook"
+
+    def __init__(self, batch_size: int, concurrency: int = 1, rate_per_second: float = 0, per_call: int = 1):
+        super().__init__(batch_size, concurrency, rate_per_second)
+        self.per_call = per_call
+
+    def enabled(self) -> bool:
+        return bool(settings.NOTIFY_WEBHOOK_URL)
+
+    def address(self, recipient: dict) -> Optional[str]:
+        return recipient.get("email")
+
+    def send(self, notifications: Sequence) -> None:
+        body = json.dumps({"notifications": [
+            {
+                "id": notification.id,
+                "kind": notification.kind,
+                "user_id": notification.user_id,
+                "recipient": notification.recipient,
+                "subject": notification.subject,
+                "text": notification.text_content,
+                "created_at": notification.created_at.isoformat(),
+            }
+            for notification in notifications
+        ]}).encode()
+        request = urllib.request.Request(
+            settings.NOTIFY_WEBHOOK_URL, data=body, headers={"Content-Type": "application/json"}, method="POST"
+        )
+        # Any non-2xx status raises HTTPError
+        with urllib.request.urlopen(request, timeout=settings.NOTIFY_WEBHOOK_TIMEOUT_SECONDS) as response:
+            response.read()
+
+
+class SMSChannel(Channel):
+    """Stub: logs the message until an SMS provider is wired in."""
+    name = "sms"
+
+    def address(self, recipient: dict) -> Optional[str]:
+        return recipient.get("phone")
+
+    def send(self, notifications: Sequence) -> None:
+        for notification in notifications:
+            print(f"SMS (stub) to {notification.recipient}: {notification.subject}")
+
+
+class InAppChannel(Channel):
+    """
+    The outbox row is the in-app notification (see /notifications), so
+    delivering only marks it sent. A whole batch is one call.
+    """
+    name = "in_app"
+
+    def __init__(self, batch_size: int):
+        super().__init__(batch_size)
+        self.per_call = batch_size
+
+    def address(self, recipient: dict) -> Optional[str]:
+        return str(recipient["user_id"]) if recipient.get("user_id") else None
+
+    def send(self, notifications: Sequence) -> None:
+        pass
+
+
+_channels: Dict[str, Channel] = {}
+
+
+def register_channel(channel: Channel) -> None:
+    """Adds or replaces the channel called `channel.name`."""
+    _channels[channel.name] = channel
+
+
+def get_channel(name: str) -> Optional[Channel]:
+    """The registered channel called `name`, configured or not."""
+    return _channels.get(name)
+
+
+def enabled_channels() -> List[Channel]:
+    return [channel for channel in _channels.values() if channel.enabled()]
+
+
+def channels_named(names: Sequence[str]) -> List[Channel]:
+    """The registered and configured channels among `names`, in that order."""
+    names = [name.strip() for name in names if name.strip()]
+    return [_channels[name] for name in names if name in _channels and _channels[name].enabled()]
+
+
+def channels_for(kind: str) -> List[Channel]:
+    """The configured channels a notification of this kind goes out on."""
+    names = settings.notification_routes.get(kind)
+    if names is None:
+        names = settings.NOTIFICATION_DEFAULT_CHANNELS.split(",")
+    return channels_named(names)
+
+
+register_channel(EmailChannel(
+    batch_size=settings.NOTIFY_EMAIL_BATCH_SIZE,
+    concurrency=settings.NOTIFY_EMAIL_CONCURRENCY,
+    rate_per_second=settings.NOTIFY_EMAIL_RATE_PER_SECOND,
+))
+register_channel(WebhookChannel(
+    batch_size=settings.NOTIFY_WEBHOOK_BATCH_SIZE,
+    concurrency=settings.NOTIFY_WEBHOOK_CONCURRENCY,
+    rate_per_second=settings.NOTIFY_WEBHOOK_RATE_PER_SECOND,
+    per_call=settings.NOTIFY_WEBHOOK_PER_REQUEST,
+))
+register_channel(SMSChannel(
+    batch_size=settings.NOTIFY_SMS_BATCH_SIZE,
+    concurrency=settings.NOTIFY_SMS_CONCURRENCY,
+    rate_per_second=settings.NOTIFY_SMS_RATE_PER_SECOND,
+))
+register_channel(InAppChannel(batch_size=settings.NOTIFY_IN_APP_BATCH_SIZE))
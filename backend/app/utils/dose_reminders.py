@@ -0,0 +1,272 @@
+# backend/app/utils/dose_reminders.py
+
+import heapq
+import sys
+import threading
+import time as time_module
+from datetime import datetime, time, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import and_
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.db import models
+from app.crud import crud_outbox
+
+# Without a tick for this long the in-memory state is considered out of date
+STALE_AFTER_SECONDS = 180
+
+
+def _is_dose_reminder_medication():
+    """Medications that get a reminder at their specific time every day."""
+    return and_(
+        models.Medication.timing_type == "Specific-Time",
+        models.Medication.specific_time != None,
+        models.Medication.frequency == "Daily",
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    """SQLite hands back timestamps as naive UTC; make them comparable with aware ones."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def next_due_at(minute_of_day: int, tz_name: str, after: float) -> float:
+    """
+    Returns the next UTC timestamp, strictly after `after`, at which the local
+    time in tz_name is minute_of_day (minutes since local midnight).
+    """
+    tz = ZoneInfo(tz_name)
+    dose_time = time(minute_of_day // 60, minute_of_day % 60)
+    local_date = datetime.fromtimestamp(after, tz).date()
+    candidate = datetime.combine(local_date, dose_time, tzinfo=tz)
+    if candidate.timestamp() <= after:
+        candidate = datetime.combine(local_date + timedelta(days=1), dose_time, tzinfo=tz)
+    return candidate.timestamp()
+
+
+class DoseReminderEngine:
+    """
+    Keeps the next due dose of every timed medication in a min-heap, so each
+    tick only pops what is due instead of scanning the medications table.
+
+    Memory per medication is one heap tuple plus one small schedule entry.
+    Changes replace the schedule entry and push a new heap tuple; the old tuple
+    is skipped when it surfaces (lazy deletion) and the heap is compacted once
+    stale tuples outnumber live ones. Medications deleted elsewhere (or whose
+    owner was deactivated) are dropped when their dose comes up and the
+    lookup finds no row.
+
+    Only the scheduler leader ticks the engine. It loads its state from the
+    database on the first tick (one narrow streaming query plus heapify), and
+    picks up changes made by other workers through medications.updated_at.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (due_at, medication_id, version)
+        self._heap: List[Tuple[float, int, int]] = []
+        # medication_id -> (version, minute_of_day, tz_name)
+        self._schedule: Dict[int, Tuple[int, int, str]] = {}
+        self._version = 0
+        self._watermark: Optional[datetime] = None
+        self._last_tick: Optional[float] = None
+        self.loaded = False
+
+    # --- Building and refreshing state ---
+
+    def _entry(self, med_id: int, specific_time, tz_name: Optional[str], now: float):
+        self._version += 1
+        minute_of_day = specific_time.hour * 60 + specific_time.minute
+        # Intern the handful of timezone names so each entry shares one string
+        tz_name = sys.intern(tz_name or settings.DEFAULT_TIMEZONE)
+        self._schedule[med_id] = (self._version, minute_of_day, tz_name)
+        return (next_due_at(minute_of_day, tz_name, now), med_id, self._version)
+
+    def _query(self, db):
+        return (
+            db.query(
+                models.Medication.id, models.Medication.specific_time,
+                models.Medication.updated_at, models.User.timezone,
+            )
+            .join(models.User, models.User.id == models.Medication.owner_id)
+            .filter(_is_dose_reminder_medication())
+        )
+
+    def load(self, db) -> None:
+        """Rebuilds the whole heap from the database."""
+        started = time_module.monotonic()
+        now = time_module.time()
+        heap, watermark = [], None
+        with self._lock:
+            self._schedule = {}
+            for med_id, specific_time, updated_at, tz_name in self._query(db).execution_options(yield_per=10000):
+                heap.append(self._entry(med_id, specific_time, tz_name, now))
+                if updated_at is not None and (watermark is None or _as_utc(updated_at) > watermark):
+                    watermark = _as_utc(updated_at)
+            heapq.heapify(heap)
+            self._heap = heap
+            self._watermark = watermark or datetime.now(timezone.utc)
+            self.loaded = True
+        print(f"--- Dose reminder engine loaded {len(heap)} medications in {time_module.monotonic() - started:.2f}s ---")
+
+    def refresh_changed(self, db) -> None:
+        """Applies medication changes made since the last refresh (possibly by other workers)."""
+        query = db.query(
+            models.Medication.id, models.Medication.specific_time, models.Medication.timing_type,
+            models.Medication.frequency, models.Medication.updated_at, models.User.timezone,
+        ).join(models.User, models.User.id == models.Medication.owner_id)
+        # Small overlap so clock skew between workers cannot hide a change;
+        # rows seen again with the same schedule are left alone, so their
+        # pending dose is not pushed past
+        query = query.filter(models.Medication.updated_at > self._watermark - timedelta(seconds=5))
+        now = time_module.time()
+        with self._lock:
+            for med_id, specific_time, timing_type, frequency, updated_at, tz_name in query:
+                if timing_type == "Specific-Time" and specific_time is not None and frequency == "Daily":
+                    entry = self._schedule.get(med_id)
+                    minute_of_day = specific_time.hour * 60 + specific_time.minute
+                    if entry is None or entry[1:] != (minute_of_day, tz_name or settings.DEFAULT_TIMEZONE):
+                        heapq.heappush(self._heap, self._entry(med_id, specific_time, tz_name, now))
+                else:
+                    self._schedule.pop(med_id, None)
+                if updated_at is not None and (self._watermark is None or _as_utc(updated_at) > self._watermark):
+                    self._watermark = _as_utc(updated_at)
+
+    def _is_active(self) -> bool:
+        """
+        True while this process is the one ticking the engine. A process that
+        stopped ticking (it lost the scheduler lease) drops its state, so hooks
+        do not keep growing a heap nobody pops.
+        """
+        if not self.loaded:
+            return False
+        if self._last_tick is not None and time_module.time() - self._last_tick > STALE_AFTER_SECONDS:
+            with self._lock:
+                self.loaded = False
+                self._heap, self._schedule = [], {}
+            return False
+        return True
+
+    def medication_changed(self, db_medication: models.Medication, tz_name: Optional[str] = None) -> None:
+        """Hook for crud_medication after a create or update in this process."""
+        if not self._is_active():
+            return
+        with self._lock:
+            if (
+                db_medication.timing_type == "Specific-Time"
+                and db_medication.specific_time is not None
+                and db_medication.frequency == "Daily"
+            ):
+                tz_name = tz_name or db_medication.owner.timezone
+                heapq.heappush(self._heap, self._entry(db_medication.id, db_medication.specific_time, tz_name, time_module.time()))
+            else:
+                self._schedule.pop(db_medication.id, None)
+
+    def medication_deleted(self, medication_id: int) -> None:
+        """Hook for crud_medication after a delete in this process."""
+        if not self._is_active():
+            return
+        with self._lock:
+            self._schedule.pop(medication_id, None)
+
+    def _compact(self) -> None:
+        live = [e for e in self._heap if self._schedule.get(e[1], (None,))[0] == e[2]]
+        heapq.heapify(live)
+        self._heap = live
+
+    # --- Firing ---
+
+    def pop_due(self, now: float) -> List[Tuple[int, float]]:
+        """
+        Removes and returns (medication_id, due_at) for every dose due at or before
+        `now`, rescheduling each medication for its next day.
+        """
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                due_at, med_id, version = heapq.heappop(self._heap)
+                entry = self._schedule.get(med_id)
+                if entry is None or entry[0] != version:
+                    continue # Stale tuple of an updated or deleted medication
+                due.append((med_id, due_at))
+                _, minute_of_day, tz_name = entry
+                # Never reschedule into the past, so a late tick fires each dose once
+                heapq.heappush(self._heap, (next_due_at(minute_of_day, tz_name, max(due_at, now)), med_id, version))
+            if len(self._heap) > 2 * len(self._schedule) + 1024:
+                self._compact()
+        return due
+
+    def tick(self) -> None:
+        """
+        Scheduled every minute on the leader: loads or refreshes state, then
+        queues a reminder for every dose that has come due.
+        """
+        now = time_module.time()
+        db = SessionLocal()
+        try:
+            # A gap in ticks means another worker was leader meanwhile; start fresh
+            if not self.loaded or self._last_tick is None or now - self._last_tick > STALE_AFTER_SECONDS:
+                self.load(db)
+            else:
+                self.refresh_changed(db)
+            self._last_tick = now
+
+            due = self.pop_due(now)
+            if not due:
+                return
+            due_by_id = dict(due)
+            due_ids = list(due_by_id)
+            rows = []
+            # Chunked so a burst of due doses stays under the bound-parameter limit
+            for start in range(0, len(due_ids), settings.DOSE_REMINDER_QUERY_CHUNK):
+                rows.extend(
+                    db.query(models.Medication, models.User.email, models.User.full_name)
+                    .join(models.User, models.User.id == models.Medication.owner_id)
+                    .filter(models.Medication.id.in_(due_ids[start:start + settings.DOSE_REMINDER_QUERY_CHUNK]))
+                    .filter(models.User.is_active == True)
+                    .all()
+                )
+            # No row: deleted (possibly by another worker) or the owner was
+            # deactivated. Forget them; their heap tuples are skipped as stale.
+            missing = set(due_ids) - {med.id for med, _, _ in rows}
+            if missing:
+                with self._lock:
+                    for med_id in missing:
+                        self._schedule.pop(med_id, None)
+            notifications = []
+            for med, email, full_name in rows:
+                due_at = datetime.fromtimestamp(due_by_id[med.id], timezone.utc)
+                if _taken_recently(med.last_taken_at, due_at):
+                    continue
+                dose_time = med.specific_time.strftime('%I:%M %p')
+                notifications.append({
+                    "kind": "dose_reminder",
+                    "user_id": med.owner_id,
+                    "email": email,
+                    "subject": f"Time to take {med.name}",
+                    "html_content": f"<html><body><p>Hello {full_name},</p><p>It is {dose_time}: time to take <b>{med.name}</b> ({med.dosage}).</p></body></html>",
+                    "text_content": f"Hello {full_name},\nIt is {dose_time}: time to take {med.name} ({med.dosage}).\n",
+                    "idempotency_key": f"dose-reminder:{med.id}:{due_at.isoformat()}",
+                })
+            crud_outbox.enqueue_notifications(db, notifications)
+            db.commit()
+        finally:
+            db.close()
+
+
+def _taken_recently(last_taken_at: Optional[datetime], due_at: datetime) -> bool:
+    """True if the dose was already marked taken shortly before it was due."""
+    if last_taken_at is None:
+        return False
+    return _as_utc(last_taken_at) >= due_at - timedelta(minutes=settings.DOSE_REMINDER_TAKEN_WINDOW_MINUTES)
+
+
+dose_reminder_engine = DoseReminderEngine()
+
+
+def tick_dose_reminders():
+    """Scheduled entry point for the dose reminder engine."""
+    dose_reminder_engine.tick()
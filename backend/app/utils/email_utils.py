@@ -1,18 +1,15 @@
 # backend/app/utils/email_utils.py
 
 import smtplib
+import threading
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+from html import escape
 from app.core.config import settings
 
-def send_email(recipient_email: str, subject: str, html_content: str, text_content: str):
-    """
-    A generic function to send an email.
-    """
-    if not settings.MAIL_USERNAME or not settings.MAIL_PASSWORD:
-        print("WARN: Email settings are not configured. Cannot send email.")
-        return False
-
+def build_message(recipient_email: str, subject: str, html_content: str, text_content: str) -> MIMEMultipart:
+    """Builds the MIME message for a plain-text + HTML email."""
     message = MIMEMultipart("alternative")
     message["Subject"] = subject
     message["From"] = settings.MAIL_FROM
@@ -22,20 +19,178 @@ def send_email(recipient_email: str, subject: str, html_content: str, text_conte
     part2 = MIMEText(html_content, "html")
     message.attach(part1)
     message.attach(part2)
+    return message
+
+# The server turned down this message; the session itself is still usable
+_MESSAGE_REJECTED = (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError)
+
+
+def _is_connection_lost(error: Exception) -> bool:
+    """
+    True if the session is gone: the server hung up, or a socket error.
+    SMTPException subclasses OSError, so other SMTP errors must be excluded.
+    """
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+class SMTPConnectionPool:
+    """
+    A bounded pool of connected, logged-in SMTP sessions.
+
+    Opening a session costs a TCP connect, STARTTLS and a login, which is far
+    more than sending one message. The pool keeps up to `max_size` sessions
+    and hands them out to one thread at a time. A session is retired after
+    `max_messages_per_connection` messages (many providers cap this) or after
+    sitting idle for `idle_timeout` seconds, and is dropped whenever it fails.
+    """
+
+    def __init__(self, max_size: int, max_messages_per_connection: int, idle_timeout: int):
+        self.max_size = max_size
+        self.max_messages_per_connection = max_messages_per_connection
+        self.idle_timeout = idle_timeout
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        # Idle sessions as [server, messages_sent, last_used_at]; last in, first out
+        self._idle = []
+
+    def _connect(self) -> smtplib.SMTP:
+        server = smtplib.SMTP(settings.MAIL_SERVER, settings.MAIL_PORT, timeout=settings.MAIL_TIMEOUT_SECONDS)
+        try:
+            if settings.MAIL_STARTTLS:
+                server.starttls()
+            if settings.MAIL_USERNAME and settings.MAIL_PASSWORD:
+                server.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD)
+        except Exception:
+            self._close(server)
+            raise
+        return server
+
+    @staticmethod
+    def _close(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except Exception:
+            server.close()
+
+    def _checkout(self) -> list:
+        stale = []
+        with self._lock:
+            entry = None
+            while self._idle:
+                candidate = self._idle.pop()
+                if time.monotonic() - candidate[2] < self.idle_timeout:
+                    entry = candidate
+                    break
+                # The server has most likely dropped it by now
+                stale.append(candidate)
+        for old in stale:
+            self._close(old[0])
+        return entry or [self._connect(), 0, time.monotonic()]
+
+    def _checkin(self, entry: list) -> None:
+        if entry[1] >= self.max_messages_per_connection:
+            self._close(entry[0])
+            return
+        entry[2] = time.monotonic()
+        with self._lock:
+            self._idle.append(entry)
+
+    def sendmail(self, from_addr: str, to_addr: str, msg: str) -> None:
+        """
+        Sends one message over a pooled session, blocking while all sessions are busy.
+        A reused session that turns out to be dead is replaced and the send retried once.
+        """
+        self._slots.acquire()
+        try:
+            entry = self._checkout()
+            reused = entry[1] > 0
+            try:
+                entry[0].sendmail(from_addr, to_addr, msg)
+            except _MESSAGE_REJECTED:
+                # Retrying would be rejected again; keep the session
+                self._checkin(entry)
+                raise
+            except Exception as e:
+                self._close(entry[0])
+                if not (reused and _is_connection_lost(e)):
+                    raise
+                entry = [self._connect(), 0, time.monotonic()]
+                try:
+                    entry[0].sendmail(from_addr, to_addr, msg)
+                except _MESSAGE_REJECTED:
+                    self._checkin(entry)
+                    raise
+                except Exception:
+                    self._close(entry[0])
+                    raise
+            entry[1] += 1
+            self._checkin(entry)
+        finally:
+            self._slots.release()
+
+    def forget_all(self) -> None:
+        """
+        Drops idle sessions WITHOUT closing them.
+        Used in a freshly forked worker process, where the sockets still belong
+        to the parent and must not be written to.
+        """
+        with self._lock:
+            self._idle = []
+
+    def close_all(self) -> None:
+        """Closes every idle session, e.g. on application shutdown."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for entry in idle:
+            self._close(entry[0])
+
+
+smtp_pool = SMTPConnectionPool(
+    max_size=settings.MAIL_POOL_SIZE,
+    max_messages_per_connection=settings.MAIL_MAX_MESSAGES_PER_CONNECTION,
+    idle_timeout=settings.MAIL_POOL_IDLE_SECONDS,
+)
+# Kept apart for SOS alerts, which must not wait behind a reminder burst
+priority_smtp_pool = SMTPConnectionPool(
+    max_size=settings.MAIL_PRIORITY_POOL_SIZE,
+    max_messages_per_connection=settings.MAIL_MAX_MESSAGES_PER_CONNECTION,
+    idle_timeout=settings.MAIL_POOL_IDLE_SECONDS,
+)
+
+def deliver_email(
+    recipient_email: str, subject: str, html_content: str, text_content: str, priority: bool = False
+) -> None:
+    """
+    Sends an email over a pooled SMTP session and raises on any failure.
+    `priority` mail uses its own pool of sessions.
+    STARTTLS and login are skipped when disabled/unset, so this also works
+    against a local SMTP sink (e.g. `python -m aiosmtpd -n -l localhost:8025`).
+    """
+    message = build_message(recipient_email, subject, html_content, text_content)
+    pool = priority_smtp_pool if priority else smtp_pool
+    pool.sendmail(settings.MAIL_FROM, recipient_email, message.as_string())
+
+def send_email(recipient_email: str, subject: str, html_content: str, text_content: str):
+    """
+    A generic function to send an email immediately.
+    Prefer queueing through crud_outbox.enqueue_notification; this blocks on SMTP.
+    """
+    if not settings.MAIL_SERVER:
+        print("WARN: Email settings are not configured. Cannot send email.")
+        return False
 
     try:
-        with smtplib.SMTP(settings.MAIL_SERVER, settings.MAIL_PORT) as server:
-            server.starttls()
-            server.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD)
-            server.sendmail(settings.MAIL_FROM, recipient_email, message.as_string())
+        deliver_email(recipient_email, subject, html_content, text_content)
         print(f"Email sent successfully to {recipient_email}")
         return True
     except Exception as e:
         print(f"Failed to send email: {e}")
         return False
 
-def send_password_reset_email(recipient_email: str, reset_link: str):
-    """Sends a password reset email to the user."""
+def password_reset_email_content(reset_link: str) -> tuple[str, str, str]:
+    """Builds the password reset email. Returns (subject, html_content, text_content)."""
     subject = "Reset Your Password"
     text = f"""Hi, Click the link to reset your password: {reset_link}"""
     html = f"""
@@ -48,4 +203,24 @@ def send_password_reset_email(recipient_email: str, reset_link: str):
         </a>
     </body></html>
     """
-    send_email(recipient_email, subject, html, text)
\ No newline at end of file
+    return subject, html, text
+
+def caregiver_invite_email_content(patient: str, app_link: str) -> tuple[str, str, str]:
+    """Builds the caregiver invite email. Returns (subject, html_content, text_content)."""
+    subject = f"{patient} would like you to be their caregiver"
+    text = (
+        f"Hi, {patient} would like you to look after them and see their medication dashboard. "
+        f"Sign in (or create an account with this email address) to accept: {app_link}"
+    )
+    html = f"""
+    <html><body>
+        <p>Hi,<br>
+           {escape(patient)} would like you to look after them and see their medication dashboard.
+           Sign in, or create an account with this email address, to accept the invite.
+        </p>
+        <a href="{app_link}" style="background-color:#1E90FF; color:white; padding:15px 25px; text-align:center; text-decoration:none; display:inline-block; border-radius:5px;">
+            Open the app
+        </a>
+    </body></html>
+    """
+    return subject, html, text
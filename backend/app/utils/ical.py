@@ -0,0 +1,98 @@
+# backend/app/utils/ical.py
+#
+# A small, streaming reader for the VEVENT entries of an iCalendar (.ics)
+# file (RFC 5545), enough to import appointments exported by clinic and
+# calendar software. Lines are read one at a time, so large calendars are
+# never held in memory.
+
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+# property name -> (parameters, value)
+Event = Dict[str, Tuple[Dict[str, str], str]]
+
+
+def _unfold(lines: Iterable[str]) -> Iterator[str]:
+    """Joins folded lines: a line starting with a space or tab continues the previous one."""
+    current = None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            if current is not None:
+                current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def _parse_line(line: str) -> Tuple[str, Dict[str, str], str]:
+    """Splits 'NAME;PARAM=x:value' into (NAME, {PARAM: x}, value)."""
+    head, _, value = line.partition(":")
+    name, *params = head.split(";")
+    parameters = {}
+    for param in params:
+        key, _, param_value = param.partition("=")
+        parameters[key.upper()] = param_value.strip('"')
+    return name.upper(), parameters, value
+
+
+def iter_events(lines: Iterable[str]) -> Iterator[Event]:
+    """Yields the properties of every VEVENT in the file, in file order."""
+    event: Optional[Event] = None
+    nested = 0
+    for line in _unfold(lines):
+        name, params, value = _parse_line(line)
+        if name == "BEGIN":
+            if value.upper() == "VEVENT":
+                event, nested = {}, 0
+            elif event is not None:
+                # e.g. a VALARM inside the event; its properties are not the event's
+                nested += 1
+        elif name == "END":
+            if value.upper() == "VEVENT" and event is not None:
+                yield event
+                event = None
+            elif event is not None:
+                nested -= 1
+        elif event is not None and nested == 0 and name not in event:
+            event[name] = (params, value)
+
+
+def unescape_text(value: str) -> str:
+    """Undoes the TEXT escaping of RFC 5545 (\\n, \\, \\; and \\\\)."""
+    out, chars = [], iter(value)
+    for char in chars:
+        if char == "\\":
+            escaped = next(chars, "")
+            out.append("\n" if escaped in ("n", "N") else escaped)
+        else:
+            out.append(char)
+    return "".join(out)
+
+
+def parse_datetime(params: Dict[str, str], value: str, local_tz: str) -> datetime:
+    """
+    Parses a DATE or DATE-TIME value into a naive local datetime in `local_tz`,
+    the way appointment times are stored.
+    UTC times ('...Z') and times with a TZID are converted to `local_tz`;
+    floating times are taken as they are; an all-day DATE becomes midnight.
+    Raises ValueError for anything else.
+    """
+    value = value.strip()
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        return datetime.strptime(value, "%Y%m%d")
+    if value.endswith("Z"):
+        parsed = datetime.strptime(value[:-1], "%Y%m%dT%H%M%S").replace(tzinfo=timezone.utc)
+    else:
+        parsed = datetime.strptime(value, "%Y%m%dT%H%M%S")
+        if "TZID" not in params:
+            return parsed
+        try:
+            parsed = parsed.replace(tzinfo=ZoneInfo(params["TZID"]))
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Unknown timezone {params['TZID']!r}")
+    return parsed.astimezone(ZoneInfo(local_tz)).replace(tzinfo=None)
@@ -0,0 +1,140 @@
+# backend/app/utils/leader.py
+
+import os
+import socket
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.db import models
+
+# Identifies this API process across all nodes. Forked job processes inherit
+# it, so they can check the lease on behalf of the process that spawned them.
+INSTANCE_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class LeaderLease:
+    """
+    A database-backed lease that elects one scheduler leader among all workers.
+
+    Every worker runs a heartbeat thread that tries to take or renew the lease
+    every `renew_seconds`. Taking it only succeeds if it is free, expired, or
+    already ours, which a single conditional UPDATE decides atomically. If the
+    leader dies its lease simply runs out, and another worker takes over within
+    about ttl_seconds + renew_seconds.
+    """
+
+    def __init__(self, name: str, ttl_seconds: int, renew_seconds: int, holder: str = INSTANCE_ID):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.renew_seconds = renew_seconds
+        self.holder = holder
+        self._stop = threading.Event()
+        self._thread = None
+
+    def try_acquire(self) -> bool:
+        """Takes or renews the lease. Returns True if we hold it afterwards."""
+        db = SessionLocal()
+        try:
+            now = datetime.now(timezone.utc)
+            values = {
+                models.SchedulerLease.holder: self.holder,
+                models.SchedulerLease.expires_at: now + timedelta(seconds=self.ttl_seconds),
+            }
+            updated = (
+                db.query(models.SchedulerLease)
+                .filter(models.SchedulerLease.name == self.name)
+                .filter(or_(models.SchedulerLease.holder == self.holder, models.SchedulerLease.expires_at < now))
+                .update(values, synchronize_session=False)
+            )
+            if not updated:
+                exists = db.query(models.SchedulerLease.name).filter(models.SchedulerLease.name == self.name).first()
+                if exists:
+                    db.rollback()
+                    return False
+                db.add(models.SchedulerLease(name=self.name, holder=self.holder, expires_at=values[models.SchedulerLease.expires_at]))
+            db.commit()
+            return True
+        except IntegrityError:
+            # Another worker inserted the row first
+            db.rollback()
+            return False
+        finally:
+            db.close()
+
+    def is_held(self) -> bool:
+        """Checks in the database that we hold an unexpired lease right now."""
+        db = SessionLocal()
+        try:
+            return db.query(models.SchedulerLease.name).filter(
+                models.SchedulerLease.name == self.name,
+                models.SchedulerLease.holder == self.holder,
+                models.SchedulerLease.expires_at > datetime.now(timezone.utc),
+            ).first() is not None
+        finally:
+            db.close()
+
+    def release(self) -> None:
+        """Gives the lease up straight away so another worker can take over without waiting for expiry."""
+        db = SessionLocal()
+        try:
+            db.query(models.SchedulerLease).filter(
+                models.SchedulerLease.name == self.name,
+                models.SchedulerLease.holder == self.holder,
+            ).delete(synchronize_session=False)
+            db.commit()
+        finally:
+            db.close()
+
+    def _heartbeat(self) -> None:
+        was_leader = False
+        while not self._stop.is_set():
+            try:
+                is_leader = self.try_acquire()
+            except Exception as e:
+                # Without a DB we cannot prove we are leader; let the lease lapse
+                print(f"Scheduler lease heartbeat failed: {e}")
+                is_leader = False
+            if is_leader != was_leader:
+                print(f"--- {self.holder} {'acquired' if is_leader else 'lost'} the '{self.name}' lease ---")
+                was_leader = is_leader
+            self._stop.wait(self.renew_seconds)
+
+    def start(self) -> None:
+        """Starts the background heartbeat thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._heartbeat, name=f"lease-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the heartbeat and releases the lease."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        try:
+            self.release()
+        except Exception as e:
+            print(f"Could not release scheduler lease: {e}")
+
+
+scheduler_lease = LeaderLease(
+    "scheduler",
+    ttl_seconds=settings.SCHEDULER_LEASE_TTL_SECONDS,
+    renew_seconds=settings.SCHEDULER_LEASE_RENEW_SECONDS,
+)
+
+
+def run_if_leader(job, *args):
+    """
+    Scheduled entry point for jobs that must run on exactly one worker.
+    Every worker fires the job, but only the lease holder actually runs it.
+    `job` must be a module-level function so it can be sent to process pools.
+    """
+    if not scheduler_lease.is_held():
+        return
+    return job(*args)
@@ -0,0 +1,87 @@
+# backend/app/utils/outbox_worker.py
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.crud import crud_outbox
+from .channels import Channel, enabled_channels
+
+logger = logging.getLogger(__name__)
+
+def deliver_channel_batch(channel: Channel) -> int:
+    """
+    Delivers one batch of a channel's due notifications from the outbox.
+    Successes are marked 'sent'; failures are rescheduled with exponential
+    backoff and dead-lettered after OUTBOX_MAX_ATTEMPTS.
+    Returns the number of notifications attempted.
+    """
+    # The claimed rows stay usable after the lease is committed
+    db = SessionLocal(expire_on_commit=False)
+    try:
+        notifications = crud_outbox.claim_due(
+            db, channel.name, limit=channel.batch_size, lease_seconds=settings.OUTBOX_LEASE_SECONDS
+        )
+        # Commit the lease before any I/O, so no locks or transaction are held
+        # while a slow provider is being waited on
+        db.commit()
+        # The channel applies its own batching, concurrency and rate limit
+        errors = channel.deliver(notifications)
+        for notification, e in zip(notifications, errors):
+            if e is None:
+                crud_outbox.mark_sent(notification)
+            else:
+                crud_outbox.mark_failed(
+                    notification,
+                    error=f"{type(e).__name__}: {e}",
+                    max_attempts=settings.OUTBOX_MAX_ATTEMPTS,
+                    retry_base_seconds=settings.OUTBOX_RETRY_BASE_SECONDS,
+                )
+                if notification.status == "dead":
+                    logger.warning(
+                        "Notification %s (%s) to %s dead-lettered after %s attempts: %s",
+                        notification.id, channel.name, notification.recipient, notification.attempts, e,
+                    )
+        # Recording the outcome is a second, short transaction
+        db.commit()
+        return len(notifications)
+    finally:
+        db.close()
+
+def drain_channel(channel: Channel) -> None:
+    """Delivers a channel's notifications batch by batch until nothing is due."""
+    try:
+        # A full batch means there may be more waiting
+        while deliver_channel_batch(channel) >= channel.batch_size:
+            pass
+    except Exception:
+        logger.exception("Outbox delivery error on channel %s", channel.name)
+
+def deliver_outbox():
+    """
+    Drains the outbox. This is the scheduled job.
+    Every channel is drained on its own thread, so a slow or rate-limited
+    channel never holds up the others.
+    """
+    channels = enabled_channels()
+    if not channels:
+        return
+    with ThreadPoolExecutor(max_workers=len(channels), thread_name_prefix="outbox") as executor:
+        list(executor.map(drain_channel, channels))
+
+def run_forever():
+    """Runs the delivery worker as its own process, polling every OUTBOX_POLL_SECONDS."""
+    logger.info("Outbox worker started")
+    while True:
+        try:
+            deliver_outbox()
+        except Exception:
+            # A DB hiccup must not kill the worker; try again on the next poll
+            logger.exception("Outbox worker error")
+        time.sleep(settings.OUTBOX_POLL_SECONDS)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    run_forever()
@@ -0,0 +1,63 @@
+# backend/app/utils/reminder_slots.py
+
+from datetime import date, datetime, time, timezone
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings
+
+# The day is divided into fixed slots of REMINDER_SLOT_MINUTES (UTC). Each user
+# is assigned the slot their local reminder time falls in, stored in
+# users.reminder_slot, so a tick only has to look at the users of one slot.
+SLOTS_PER_DAY = 24 * 60 // settings.REMINDER_SLOT_MINUTES
+
+
+def compute_reminder_slot(tz_name: Optional[str], reminder_time: Optional[time], on_date: Optional[date] = None) -> int:
+    """
+    Returns the UTC slot in which a user's local reminder time falls on the given date.
+    Missing values fall back to DEFAULT_TIMEZONE and DEFAULT_REMINDER_TIME.
+    The date matters because of daylight saving; slots are refreshed regularly.
+    """
+    tz = ZoneInfo(tz_name or settings.DEFAULT_TIMEZONE)
+    reminder_time = reminder_time or settings.DEFAULT_REMINDER_TIME
+    on_date = on_date or datetime.now(tz).date()
+    local_dt = datetime.combine(on_date, reminder_time, tzinfo=tz)
+    utc_dt = local_dt.astimezone(timezone.utc)
+    return (utc_dt.hour * 60 + utc_dt.minute) // settings.REMINDER_SLOT_MINUTES
+
+
+def local_today(tz_name: Optional[str]) -> date:
+    """Today's date in the timezone (DEFAULT_TIMEZONE if not set)."""
+    return datetime.now(ZoneInfo(tz_name or settings.DEFAULT_TIMEZONE)).date()
+
+
+def local_day_start_utc(day: date, tz_name: Optional[str]) -> datetime:
+    """
+    The UTC instant at which `day` begins in the timezone (DEFAULT_TIMEZONE if
+    not set). Timestamps such as last_taken_at are stored in UTC, so "taken
+    today" must be compared against this, not against a naive local midnight.
+    """
+    local_midnight = datetime.combine(day, time.min, tzinfo=ZoneInfo(tz_name or settings.DEFAULT_TIMEZONE))
+    return local_midnight.astimezone(timezone.utc)
+
+
+def current_slot(now: Optional[datetime] = None) -> int:
+    """Returns the UTC slot that contains `now` (default: the current time)."""
+    now = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+    return (now.hour * 60 + now.minute) // settings.REMINDER_SLOT_MINUTES
+
+
+def slot_start(now: Optional[datetime] = None) -> datetime:
+    """Returns the UTC instant at which the slot containing `now` (default: the current time) began."""
+    now = (now or datetime.now(timezone.utc)).astimezone(timezone.utc)
+    minutes = current_slot(now) * settings.REMINDER_SLOT_MINUTES
+    return now.replace(hour=minutes // 60, minute=minutes % 60, second=0, microsecond=0)
+
+
+def is_valid_timezone(tz_name: str) -> bool:
+    """Checks that tz_name is a known IANA timezone such as 'Asia/Kolkata'."""
+    try:
+        ZoneInfo(tz_name)
+        return True
+    except Exception:
+        return False
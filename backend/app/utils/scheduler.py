@@ -1,77 +1,270 @@
-# backend/app/utils/scheduler.py
-
-from sqlalchemy import and_
-from datetime import datetime, time, date, timezone
-from app.db.database import SessionLocal
-from app.db import models
-from .email_utils import send_email
-
-def send_daily_reminders():
-    """
-    The main job that runs daily. It finds users with reminders for today
-    and sends them a single summary email.
-    """
-    print(f"--- Running daily reminder job at {datetime.now()} ---")
-    db = SessionLocal()
-    try:
-        # Get all active users
-        users = db.query(models.User).filter(models.User.is_active == True).all()
-        
-        for user in users:
-            today_start = datetime.combine(date.today(), time.min)
-            
-            # Find medications due today for this user
-            meds_due = db.query(models.Medication).filter(
-                and_(
-                    models.Medication.owner_id == user.id,
-                    models.Medication.frequency == "Daily",
-                    # Check if last_taken_at is NULL or was before today
-                    (models.Medication.last_taken_at == None) | (models.Medication.last_taken_at < today_start)
-                )
-            ).all()
-
-            # Find appointments for today for this user
-            today_end = datetime.combine(date.today(), time.max)
-            appts_today = db.query(models.Appointment).filter(
-                and_(
-                    models.Appointment.owner_id == user.id,
-                    models.Appointment.appointment_datetime >= today_start,
-                    models.Appointment.appointment_datetime <= today_end
-                )
-            ).all()
-
-            # If there's nothing to remind, skip to the next user
-            if not meds_due and not appts_today:
-                continue
-
-            # --- Format the Email Content ---
-            subject = "Your Daily Health Reminders"
-            html_content = f"<html><body><h2>Hello {user.full_name},</h2><p>Here are your health reminders for today, {date.today().strftime('%B %d, %Y')}:</p>"
-            text_content = f"Hello {user.full_name},\nHere are your reminders for today:\n"
-
-            if meds_due:
-                html_content += "<h3>💊 Medications to Take:</h3><ul>"
-                text_content += "\n--- Medications to Take ---\n"
-                for med in meds_due:
-                    timing = med.meal_timing or (med.specific_time.strftime('%I:%M %p') if med.specific_time else '')
-                    html_content += f"<li><b>{med.name}</b> ({med.dosage}) - Take {timing}</li>"
-                    text_content += f"- {med.name} ({med.dosage}) - Take {timing}\n"
-                html_content += "</ul>"
-
-            if appts_today:
-                html_content += "<h3>🗓️ Appointments Today:</h3><ul>"
-                text_content += "\n--- Appointments Today ---\n"
-                for appt in appts_today:
-                    appt_time = appt.appointment_datetime.strftime('%I:%M %p')
-                    html_content += f"<li><b>Dr. {appt.doctor_name}</b> at {appt_time}</li>"
-                    text_content += f"- Dr. {appt.doctor_name} at {appt_time}\n"
-                html_content += "</ul>"
-            
-            html_content += "<p>Have a healthy day!</p></body></html>"
-            
-            # Send the email
-            send_email(user.email, subject, html_content, text_content)
-
-    finally:
-        db.close()
-    print("--- Daily reminder job finished ---")
\ No newline at end of file
+# backend/app/utils/scheduler.py
+
+from collections import defaultdict
+from sqlalchemy import and_, or_, exists, true
+from datetime import datetime, time, date, timedelta, timezone
+from typing import Iterator, Optional
+from zoneinfo import ZoneInfo
+from app.core.config import settings
+from app.db.database import SessionLocal, engine
+from app.db import models
+from app.crud import crud_outbox
+from .email_utils import priority_smtp_pool, smtp_pool
+from .reminder_slots import compute_reminder_slot, current_slot, local_day_start_utc, slot_start
+
+
+def init_job_process():
+    """
+    Initializer for scheduler worker processes (SCHEDULER_EXECUTOR="processpool").
+    A forked process inherits the parent's pooled DB and SMTP connections;
+    it must open its own instead of sharing those sockets.
+    """
+    engine.dispose(close=False)
+    smtp_pool.forget_all()
+    priority_smtp_pool.forget_all()
+
+
+def _medication_due_filter(day_start_utc: datetime):
+    """
+    Condition for a 'Daily' medication that has not been taken yet today.
+    `day_start_utc` is the user's local midnight in UTC, like last_taken_at.
+    """
+    return and_(
+        models.Medication.frequency == "Daily",
+        # Check if last_taken_at is NULL or was before today
+        (models.Medication.last_taken_at == None) | (models.Medication.last_taken_at < day_start_utc)
+    )
+
+
+def _appointment_today_filter(today_start: datetime, today_end: datetime):
+    """Condition for an appointment that falls on today's date."""
+    return and_(
+        models.Appointment.appointment_datetime >= today_start,
+        models.Appointment.appointment_datetime <= today_end
+    )
+
+
+def _timezone_filter(tz_name: str):
+    """Users in tz_name; users without a timezone count as DEFAULT_TIMEZONE."""
+    if tz_name == settings.DEFAULT_TIMEZONE:
+        return or_(models.User.timezone == tz_name, models.User.timezone == None)
+    return models.User.timezone == tz_name
+
+
+def iter_reminder_batches(
+    db, today_start: datetime, today_end: datetime, batch_size: int, chunk: int = 0, chunk_count: int = 1,
+    slot: Optional[int] = None, tz_name: Optional[str] = None,
+):
+    """
+    Yields (users, meds_by_owner, appts_by_owner) for one page of users at a time.
+    With chunk_count > 1 only users with id % chunk_count == chunk are included,
+    so several chunks can run side by side without overlapping. `slot` and
+    `tz_name` restrict the run to one reminder slot and one timezone.
+    today_start/today_end are naive local times, like appointment times; for
+    last_taken_at (UTC) the day starts at local midnight in `tz_name`
+    (DEFAULT_TIMEZONE when not given).
+
+    Users are paged with a keyset on users.id, so every page costs the same
+    regardless of how far into the table we are. Users with nothing due today
+    are filtered out by the database through EXISTS sub-queries. For each page
+    we then fetch all due medications and today's appointments with a single
+    query each (owner_id IN (...)) instead of two queries per user.
+    """
+    meds_due = _medication_due_filter(local_day_start_utc(today_start.date(), tz_name))
+    appts_today = _appointment_today_filter(today_start, today_end)
+
+    has_meds_due = exists().where(
+        and_(models.Medication.owner_id == models.User.id, meds_due)
+    )
+    has_appts_today = exists().where(
+        and_(models.Appointment.owner_id == models.User.id, appts_today)
+    )
+
+    last_id = 0
+    while True:
+        users = (
+            db.query(models.User.id, models.User.full_name, models.User.email)
+            .filter(models.User.is_active == True)
+            .filter(models.User.id > last_id)
+            .filter(models.User.id % chunk_count == chunk if chunk_count > 1 else true())
+            .filter(models.User.reminder_slot == slot if slot is not None else true())
+            .filter(_timezone_filter(tz_name) if tz_name is not None else true())
+            .filter(or_(has_meds_due, has_appts_today))
+            .order_by(models.User.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not users:
+            return
+        last_id = users[-1].id
+        owner_ids = [user.id for user in users]
+
+        meds_by_owner = defaultdict(list)
+        for med in (
+            db.query(models.Medication)
+            .filter(models.Medication.owner_id.in_(owner_ids), meds_due)
+            .order_by(models.Medication.owner_id, models.Medication.id)
+        ):
+            meds_by_owner[med.owner_id].append(med)
+
+        appts_by_owner = defaultdict(list)
+        for appt in (
+            db.query(models.Appointment)
+            .filter(models.Appointment.owner_id.in_(owner_ids), appts_today)
+            .order_by(models.Appointment.owner_id, models.Appointment.appointment_datetime)
+        ):
+            appts_by_owner[appt.owner_id].append(appt)
+
+        yield users, meds_by_owner, appts_by_owner
+
+        # Drop the ORM objects of this page so memory stays flat across pages
+        db.expunge_all()
+
+
+def build_reminder_email(full_name: str, meds_due: list, appts_today: list, today: Optional[date] = None) -> tuple[str, str, str]:
+    """
+    Formats the daily reminder email. Returns (subject, html_content, text_content).
+    """
+    today = today or date.today()
+    subject = "Your Daily Health Reminders"
+    html_content = f"<html><body><h2>Hello {full_name},</h2><p>Here are your health reminders for today, {today.strftime('%B %d, %Y')}:</p>"
+    text_content = f"Hello {full_name},\nHere are your reminders for today:\n"
+
+    if meds_due:
+        html_content += "<h3>💊 Medications to Take:</h3><ul>"
+        text_content += "\n--- Medications to Take ---\n"
+        for med in meds_due:
+            timing = med.meal_timing or (med.specific_time.strftime('%I:%M %p') if med.specific_time else '')
+            html_content += f"<li><b>{med.name}</b> ({med.dosage}) - Take {timing}</li>"
+            text_content += f"- {med.name} ({med.dosage}) - Take {timing}\n"
+        html_content += "</ul>"
+
+    if appts_today:
+        html_content += "<h3>🗓️ Appointments Today:</h3><ul>"
+        text_content += "\n--- Appointments Today ---\n"
+        for appt in appts_today:
+            appt_time = appt.appointment_datetime.strftime('%I:%M %p')
+            html_content += f"<li><b>Dr. {appt.doctor_name}</b> at {appt_time}</li>"
+            text_content += f"- Dr. {appt.doctor_name} at {appt_time}\n"
+        html_content += "</ul>"
+
+    html_content += "<p>Have a healthy day!</p></body></html>"
+    return subject, html_content, text_content
+
+
+def _queue_reminders_for_day(db, local_today: date, chunk: int, chunk_count: int, slot=None, tz_name=None) -> int:
+    """Queues the digests for one local calendar day. Returns the number of notifications queued."""
+    today_start = datetime.combine(local_today, time.min)
+    today_end = datetime.combine(local_today, time.max)
+    queued = 0
+    for users, meds_by_owner, appts_by_owner in iter_reminder_batches(
+        db, today_start, today_end, settings.REMINDER_BATCH_SIZE, chunk, chunk_count, slot, tz_name
+    ):
+        notifications = []
+        for user in users:
+            subject, html_content, text_content = build_reminder_email(
+                user.full_name, meds_by_owner[user.id], appts_by_owner[user.id], local_today
+            )
+            notifications.append({
+                "kind": "daily_reminder",
+                "user_id": user.id,
+                "email": user.email,
+                "subject": subject,
+                "html_content": html_content,
+                "text_content": text_content,
+                # One digest per user per day, even if the job runs again
+                "idempotency_key": f"daily-reminder:{user.id}:{local_today.isoformat()}",
+            })
+        # Queue the page's notifications for the outbox worker instead of sending inline
+        queued += crud_outbox.enqueue_notifications(db, notifications)
+        db.commit()
+    return queued
+
+
+def _queue_reminders_for_slot(db, slot: int, at: datetime, chunk: int, chunk_count: int) -> int:
+    """Queues the digests of the users in `slot`, for their local day at the instant `at`."""
+    # Users in one slot can live in several timezones, each with its own "today"
+    tz_names = {
+        tz or settings.DEFAULT_TIMEZONE
+        for (tz,) in db.query(models.User.timezone)
+        .filter(models.User.reminder_slot == slot)
+        .distinct()
+    }
+    queued = 0
+    for tz_name in sorted(tz_names):
+        local_today = at.astimezone(ZoneInfo(tz_name)).date()
+        queued += _queue_reminders_for_day(db, local_today, chunk, chunk_count, slot, tz_name)
+    return queued
+
+
+def _due_slot_starts(last_done: Optional[datetime], now_start: datetime) -> Iterator[datetime]:
+    """
+    The slots to run now: the current one and any missed since `last_done`
+    (the last slot finished), going back at most REMINDER_CATCHUP_HOURS.
+    """
+    step = timedelta(minutes=settings.REMINDER_SLOT_MINUTES)
+    at = now_start
+    if last_done is not None:
+        # SQLite hands back naive datetimes; they are UTC
+        last_done = last_done if last_done.tzinfo else last_done.replace(tzinfo=timezone.utc)
+        at = max(last_done + step, now_start - timedelta(hours=settings.REMINDER_CATCHUP_HOURS))
+    while at <= now_start:
+        yield at
+        at += step
+
+
+def send_daily_reminders(chunk: int = 0, chunk_count: int = 1, slot: Optional[int] = None):
+    """
+    The main job. Every REMINDER_SLOT_MINUTES it queues the daily summary
+    for the users whose local reminder time falls in the current slot, so the
+    work is spread over the day instead of hitting everyone at once.
+    The job can be split into `chunk_count` parts (see REMINDER_JOB_CHUNKS)
+    that run in parallel on the scheduler's worker pool.
+
+    Each chunk records the last slot it finished in reminder_runs, and first
+    runs the slots it missed since then, e.g. while no worker held the
+    scheduler lease. The digests' daily idempotency keys make a slot that
+    is run twice harmless. Passing `slot` runs just that slot, unrecorded.
+    """
+    db = SessionLocal()
+    try:
+        if slot is not None:
+            queued = _queue_reminders_for_slot(db, slot, datetime.now(timezone.utc), chunk, chunk_count)
+        else:
+            job = f"daily-reminders-{chunk}/{chunk_count}"
+            run = db.get(models.ReminderRun, job)
+            queued = 0
+            for at in _due_slot_starts(run.slot_start if run else None, slot_start()):
+                slot = current_slot(at)
+                queued += _queue_reminders_for_slot(db, slot, at, chunk, chunk_count)
+                # merge(): the reminder pages expunge the session's objects
+                db.merge(models.ReminderRun(job=job, slot_start=at))
+                db.commit()
+    finally:
+        db.close()
+    if queued:
+        print(f"--- Reminder slot {slot} (chunk {chunk + 1}/{chunk_count}): queued {queued} notifications at {datetime.now()} ---")
+
+
+def refresh_reminder_slots():
+    """
+    Recomputes users.reminder_slot for every (timezone, reminder_time) pair.
+    Daylight saving moves a local time to another UTC slot, so this runs
+    regularly. There are only a few distinct pairs, so it is one small
+    UPDATE per pair rather than a pass over every user.
+    """
+    db = SessionLocal()
+    try:
+        pairs = db.query(models.User.timezone, models.User.reminder_time).distinct().all()
+        for tz_name, reminder_time in pairs:
+            slot = compute_reminder_slot(tz_name, reminder_time)
+            (
+                db.query(models.User)
+                .filter(models.User.timezone == tz_name if tz_name is not None else models.User.timezone == None)
+                .filter(models.User.reminder_time == reminder_time if reminder_time is not None else models.User.reminder_time == None)
+                .filter(or_(models.User.reminder_slot != slot, models.User.reminder_slot == None))
+                .update({models.User.reminder_slot: slot}, synchronize_session=False)
+            )
+        db.commit()
+    finally:
+        db.close()
@@ -0,0 +1,153 @@
+# backend/app/utils/sos.py
+#
+# SOS fan-out: notifies every emergency contact of a user at once, over every
+# notification channel (app/utils/channels.py) listed in SOS_CHANNELS that
+# can reach them.
+#
+# An SOS cannot wait for the outbox worker's next poll, so each delivery is
+# handed to its channel right away, with the same provider code as queued
+# notifications but never behind them: SOS has its own threads per channel
+# (SOS_CONCURRENCY), goes ahead of the channel's rate limiter and, for email,
+# uses the SMTP sessions set aside for priority mail. Each delivery is
+# bounded by SOS_DELIVERY_TIMEOUT_SECONDS and the whole fan-out by
+# SOS_LATENCY_BUDGET_SECONDS. fan_out() returns as soon as SOS_MIN_ACKS
+# deliveries have been acknowledged; the others carry on in the background
+# until they finish or the budget runs out.
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence
+
+from app.core.config import settings
+from app.db import models
+from app.utils.channels import Channel, channels_named
+
+SENT, FAILED, TIMEOUT, PENDING = "sent", "failed", "timeout", "pending"
+
+
+def sos_channels() -> List[Channel]:
+    """The configured channels listed in SOS_CHANNELS."""
+    return channels_named(settings.SOS_CHANNELS.split(","))
+
+
+def sos_message(user_name: Optional[str], user_email: str, note: Optional[str]) -> tuple:
+    """Builds the alert. Returns (subject, text)."""
+    who = user_name or user_email
+    subject = f"SOS: {who} needs help"
+    text = f"{who} ({user_email}) has sent an emergency alert and listed you as an emergency contact."
+    if note:
+        text += f"\n\nMessage: {note}"
+    return subject, text
+
+
+# Channel sends block, so each channel gets SOS_CONCURRENCY threads for SOS
+# alerts, apart from the ones the outbox worker drains it with
+_executors: Dict[Channel, ThreadPoolExecutor] = {}
+
+
+def _executor(channel: Channel) -> ThreadPoolExecutor:
+    if channel not in _executors:
+        _executors[channel] = ThreadPoolExecutor(
+            max_workers=max(1, settings.SOS_CONCURRENCY), thread_name_prefix=f"sos-{channel.name}"
+        )
+    return _executors[channel]
+
+
+async def _deliver(channel: Channel, contact_id: int, notification, started: float) -> dict:
+    result = {"contact_id": contact_id, "transport": channel.name, "status": SENT, "latency_ms": None, "error": None}
+    loop = asyncio.get_running_loop()
+    try:
+        # deliver() reports errors instead of raising them
+        errors = await asyncio.wait_for(
+            loop.run_in_executor(_executor(channel), channel.deliver, [notification], True),
+            timeout=settings.SOS_DELIVERY_TIMEOUT_SECONDS,
+        )
+        if errors[0] is not None:
+            result["status"], result["error"] = FAILED, str(errors[0])
+    except asyncio.TimeoutError:
+        result["status"] = TIMEOUT
+    result["latency_ms"] = round((time.monotonic() - started) * 1000, 1)
+    return result
+
+
+# Deliveries still running after fan_out() returned; kept referenced until done
+_background = set()
+
+
+async def _finish(pending: set, deadline: float) -> None:
+    """Lets the remaining deliveries run until the budget is spent, cancels the rest and logs the outcome."""
+    done, late = await asyncio.wait(pending, timeout=max(0.0, deadline - time.monotonic()))
+    for task in late:
+        task.cancel()
+    results = [task.result() for task in done]
+    sent = sum(1 for result in results if result["status"] == SENT)
+    print(f"SOS fan-out finished in the background: {sent} more sent, "
+          f"{len(results) - sent} failed, {len(late)} cut off by the latency budget")
+
+
+async def fan_out(
+    contacts: Sequence, subject: str, text: str, user_id: Optional[int] = None,
+    budget: Optional[float] = None, min_acks: Optional[int] = None,
+    channels: Optional[Sequence[Channel]] = None,
+) -> dict:
+    """
+    Sends the alert to every contact over every channel that reaches them,
+    all at once. Contacts need id, email and phone_number attributes;
+    user_id is the user raising the alert.
+
+    Returns once `min_acks` deliveries have been acknowledged, every delivery
+    has finished or the latency budget is spent, whichever comes first.
+    Deliveries still running at that point are reported as "pending".
+    """
+    budget = settings.SOS_LATENCY_BUDGET_SECONDS if budget is None else budget
+    min_acks = settings.SOS_MIN_ACKS if min_acks is None else min_acks
+    channels = sos_channels() if channels is None else channels
+    started = time.monotonic()
+    deadline = started + budget
+    now = datetime.now(timezone.utc)
+
+    tasks = {}
+    for contact in contacts:
+        recipient = {"email": contact.email, "phone": contact.phone_number}
+        for channel in channels:
+            address = channel.address(recipient)
+            if address:
+                # An unsaved outbox row, which is what channels send
+                notification = models.NotificationOutbox(
+                    channel=channel.name, kind="sos", user_id=user_id, recipient=address,
+                    subject=subject, text_content=text, created_at=now,
+                )
+                task = asyncio.create_task(_deliver(channel, contact.id, notification, started))
+                tasks[task] = (contact.id, channel.name)
+
+    pending, results = set(tasks), []
+    acks = 0
+    while pending and acks < min_acks:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            result = task.result()
+            results.append(result)
+            acks += result["status"] == SENT
+
+    for task in pending:
+        contact_id, transport = tasks[task]
+        results.append({"contact_id": contact_id, "transport": transport, "status": PENDING,
+                        "latency_ms": None, "error": None})
+    if pending:
+        finisher = asyncio.create_task(_finish(pending, deadline))
+        _background.add(finisher)
+        finisher.add_done_callback(_background.discard)
+
+    return {
+        "contacts": len(contacts),
+        "acknowledged": acks,
+        "failed": sum(1 for result in results if result["status"] in (FAILED, TIMEOUT)),
+        "pending": len(pending),
+        "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+        "deliveries": results,
+    }
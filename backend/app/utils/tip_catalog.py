@@ -0,0 +1,100 @@
+# backend/app/utils/tip_catalog.py
+
+import threading
+from collections import defaultdict
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from app.db.database import SessionLocal
+from app.db import models
+
+# (id, tip_text, category)
+TipEntry = Tuple[int, str, str]
+
+
+class TipCatalog:
+    """
+    The health_tips table, held in memory and indexed by category.
+
+    Tips are only ever added, so the catalog is loaded once at startup and
+    then refreshed incrementally: tips inserted by this worker are added
+    directly, and refresh() picks up the ones inserted by other workers by
+    reading only rows with an id above the highest one it has read. Only
+    refresh() moves that mark: ids are not committed in order, so a tip this
+    worker added may have a higher id than one another worker is still
+    committing.
+
+    The tip of the day is a pure function of (user, day, catalog size), so it
+    is stable for a user all day, moves to the next tip the day after, and is
+    picked by index in O(1) instead of an ORDER BY random() scan.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tips: List[TipEntry] = []
+        self._by_category: Dict[str, List[TipEntry]] = defaultdict(list)
+        self._ids = set()
+        self._max_id = 0
+        self.loaded = False
+
+    def _add(self, entry: TipEntry) -> None:
+        if entry[0] in self._ids:
+            return
+        self._ids.add(entry[0])
+        self._tips.append(entry)
+        self._by_category[entry[2]].append(entry)
+
+    def refresh(self, db) -> int:
+        """Loads tips added since the last load/refresh. Returns how many were new."""
+        rows = (
+            db.query(models.HealthTip.id, models.HealthTip.tip_text, models.HealthTip.category)
+            .filter(models.HealthTip.id > self._max_id)
+            .order_by(models.HealthTip.id)
+            .all()
+        )
+        with self._lock:
+            before = len(self._tips)
+            for tip_id, tip_text, category in rows:
+                self._add((tip_id, tip_text, category or "General"))
+                self._max_id = max(self._max_id, tip_id)
+            self.loaded = True
+            return len(self._tips) - before
+
+    def add(self, db_tip: models.HealthTip) -> None:
+        """Adds a tip this worker just inserted."""
+        with self._lock:
+            self._add((db_tip.id, db_tip.tip_text, db_tip.category or "General"))
+
+    def tips(self, category: Optional[str] = None) -> List[TipEntry]:
+        """All tips (or one category's), oldest first."""
+        with self._lock:
+            return list(self._tips if category is None else self._by_category.get(category, []))
+
+    def categories(self) -> List[str]:
+        with self._lock:
+            return sorted(self._by_category)
+
+    def tip_of_the_day(self, user_id: int, day: date, category: Optional[str] = None) -> Optional[str]:
+        """
+        The user's tip for `day`: consecutive days walk through the catalog,
+        and different users start at different places. None if there are no tips.
+        """
+        with self._lock:
+            tips = self._tips if category is None else self._by_category.get(category)
+            if not tips:
+                return None
+            return tips[(day.toordinal() + user_id) % len(tips)][1]
+
+
+tip_catalog = TipCatalog()
+
+
+def refresh_tip_catalog():
+    """Startup load and scheduled incremental refresh of this worker's tip catalog."""
+    db = SessionLocal()
+    try:
+        added = tip_catalog.refresh(db)
+    finally:
+        db.close()
+    if added:
+        print(f"--- Tip catalog: loaded {added} new tips ---")
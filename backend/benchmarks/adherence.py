@@ -0,0 +1,102 @@
+# backend/benchmarks/adherence.py
+#
+# Gives one user --medications daily medications with a year of dose
+# history (daily rollups, --adherence percent of days taken), then measures
+#   1. a full refresh of adherence_stats (every medication recomputed)
+#   2. an incremental refresh after a handful of new doses
+#   3. GET /analytics/adherence for each window and the weekly trend
+#
+#   python -m benchmarks.adherence --medications 2000 --requests 300
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import create_user, running_server, summarize
+
+
+def seed_history(email, medications, adherence_pct):
+    from app.crud.crud_dose import week_start
+    from app.db import models
+    from app.db.database import SessionLocal
+    from zoneinfo import ZoneInfo
+    from app.core.config import settings
+
+    today = datetime.now(ZoneInfo(settings.DEFAULT_TIMEZONE)).date()
+    created_at = datetime.now(timezone.utc) - timedelta(days=400)
+    rng = random.Random(7)
+    db = SessionLocal()
+    try:
+        owner_id = db.query(models.User.id).filter(models.User.email == email).scalar()
+        db.execute(models.Medication.__table__.insert(), [
+            {"name": f"Med {i}", "dosage": "1 tablet", "owner_id": owner_id, "timing_type": "Meal-Related",
+             "meal_timing": "After Breakfast", "frequency": "Daily", "created_at": created_at}
+            for i in range(medications)
+        ])
+        med_ids = [row.id for row in db.query(models.Medication.id).filter(models.Medication.owner_id == owner_id)]
+        for med_id in med_ids:
+            daily, weekly = [], {}
+            for offset in range(1, 366):
+                if rng.random() * 100 >= adherence_pct:
+                    continue
+                day = today - timedelta(days=offset)
+                daily.append({"medication_id": med_id, "day": day, "owner_id": owner_id, "doses_taken": 1})
+                week = weekly.setdefault(week_start(day), {"medication_id": med_id, "week_start": week_start(day),
+                                                           "owner_id": owner_id, "doses_taken": 0, "days_taken": 0})
+                week["doses_taken"] += 1
+                week["days_taken"] += 1
+            db.execute(models.DoseRollupDaily.__table__.insert(), daily)
+            db.execute(models.DoseRollupWeekly.__table__.insert(), list(weekly.values()))
+        db.commit()
+        return med_ids
+    finally:
+        db.close()
+
+
+def timed(name, function):
+    started = time.perf_counter()
+    function()
+    print(f"{name}: {(time.perf_counter() - started) * 1000:.0f} ms")
+
+
+def measure(client, path, params, requests):
+    latencies = []
+    for _ in range(requests):
+        started = time.perf_counter()
+        client.get(path, params=params).raise_for_status()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Adherence refresh and analytics latency")
+    parser.add_argument("--medications", type=int, default=2000)
+    parser.add_argument("--adherence", type=float, default=85)
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+
+    import httpx
+
+    with running_server() as base_url:
+        with httpx.Client(base_url=base_url) as client:
+            headers = create_user(client, "adherence@example.com")
+        med_ids = seed_history("adherence@example.com", args.medications, args.adherence)
+
+        from app.utils.adherence import refresh_adherence_stats
+
+        timed(f"full refresh, {len(med_ids)} medications x 365 days", refresh_adherence_stats)
+        with httpx.Client(base_url=base_url, headers=headers, timeout=30) as client:
+            for med_id in med_ids[:10]:
+                client.post(f"/api/v1/medications/{med_id}/taken").raise_for_status()
+            timed("incremental refresh, 10 new doses", refresh_adherence_stats)
+
+            for window in (30, 90, 365):
+                summarize(f"GET /analytics/adherence?window={window}",
+                          measure(client, "/api/v1/analytics/adherence", {"window": window}, args.requests))
+            summarize("GET /analytics/adherence/{id}/trend?weeks=52",
+                      measure(client, f"/api/v1/analytics/adherence/{med_ids[0]}/trend", {"weeks": 52}, args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# backend/benchmarks/common.py
+#
+# Shared helpers for the benchmark scripts in this folder. Run any of them
+# from the backend folder, e.g. `python -m benchmarks.login_flood`.
+# Without DATABASE_URL they use a throwaway SQLite file.
+
+import contextlib
+import os
+import socket
+import statistics
+import tempfile
+import threading
+import time
+
+_DEFAULTS = {
+    "DATABASE_URL": f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}",
+    "SECRET_KEY": "benchmark-secret",
+    "MAIL_USERNAME": "",
+    "MAIL_PASSWORD": "",
+    "MAIL_FROM": "bench@example.com",
+    "MAIL_SERVER": "localhost",
+    "FRONTEND_URL": "http://localhost:8501",
+    # Keep background jobs out of the measurements
+    "OUTBOX_WORKER_IN_PROCESS": "false",
+}
+for _key, _value in _DEFAULTS.items():
+    os.environ.setdefault(_key, _value)
+
+
+def percentile(samples, pct):
+    """Returns the pct-th percentile (0-100) of a list of numbers."""
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(name, latencies_ms):
+    """Prints count, p50, p99 and max of a list of latencies in milliseconds."""
+    if not latencies_ms:
+        print(f"{name}: no samples")
+        return
+    print(
+        f"{name}: n={len(latencies_ms)} "
+        f"p50={statistics.median(latencies_ms):.1f}ms "
+        f"p99={percentile(latencies_ms, 99):.1f}ms "
+        f"max={max(latencies_ms):.1f}ms"
+    )
+
+
+@contextlib.contextmanager
+def running_server():
+    """Runs the API with uvicorn in a background thread and yields its base URL."""
+    import uvicorn
+    from app.db.migrations import upgrade_to_head
+    from app.main import app
+
+    upgrade_to_head()
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+def create_user(client, email, password="benchmark-password", full_name="Bench User"):
+    """Registers a user (if needed) and returns an Authorization header for them."""
+    client.post("/api/v1/users/", json={"email": email, "password": password, "full_name": full_name})
+    response = client.post("/api/v1/auth/login/access-token", data={"username": email, "password": password})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
@@ -0,0 +1,76 @@
+# backend/benchmarks/dashboard_latency.py
+#
+# Measures GET /dashboard/ for a user with a long history (--history
+# medications and past appointments). One pass with the per-user dashboard
+# cache on and one with every request forced to rebuild it, e.g.
+#
+#   python -m benchmarks.dashboard_latency --history 20000 --requests 500
+
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+
+from benchmarks.common import create_user, running_server, summarize
+
+
+def seed_history(email, history):
+    """Gives the user `history` medications (mostly taken today) and past appointments."""
+    from app.core.cache import dashboard_cache
+    from app.db import models
+    from app.db.database import SessionLocal
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    db = SessionLocal()
+    try:
+        owner_id = db.query(models.User.id).filter(models.User.email == email).scalar()
+        db.execute(models.Medication.__table__.insert(), [
+            {"name": f"Med {i}", "dosage": "1 tablet", "owner_id": owner_id, "timing_type": "Meal-Related",
+             "meal_timing": "After Breakfast", "frequency": "Daily",
+             "last_taken_at": None if i % 1000 == 0 else now}
+            for i in range(history)
+        ])
+        db.execute(models.Appointment.__table__.insert(), [
+            {"doctor_name": f"Doctor {i}", "owner_id": owner_id,
+             "appointment_datetime": now - timedelta(days=i + 1)}
+            for i in range(history)
+        ] + [{"doctor_name": "Next", "owner_id": owner_id, "appointment_datetime": now + timedelta(days=3)}])
+        db.commit()
+    finally:
+        db.close()
+    dashboard_cache.clear()
+
+
+def measure(client, requests, invalidate=None):
+    latencies = []
+    for _ in range(requests):
+        if invalidate:
+            invalidate()
+        started = time.perf_counter()
+        client.get("/api/v1/dashboard/").raise_for_status()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GET /dashboard/ latency")
+    parser.add_argument("--history", type=int, default=20000)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    import httpx
+
+    with running_server() as base_url:
+        with httpx.Client(base_url=base_url) as client:
+            headers = create_user(client, "dashboard@example.com")
+        seed_history("dashboard@example.com", args.history)
+
+        from app.core.cache import dashboard_cache
+
+        with httpx.Client(base_url=base_url, headers=headers, timeout=30) as client:
+            client.get("/api/v1/dashboard/").raise_for_status()
+            summarize("dashboard, cached", measure(client, args.requests))
+            summarize("dashboard, rebuilt every time", measure(client, args.requests, dashboard_cache.clear))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+# backend/benchmarks/explain_hot_queries.py
+#
+# Fills the database with --rows medications and appointments (plus users,
+# contacts and outbox rows in proportion), runs the hot code paths, and
+# EXPLAINs every SQL statement they issue. Exits with status 1 if any of them
+# reads a hot table with a full table scan, e.g. after an index was dropped
+# or a query was changed so it can no longer use one.
+#
+#   python -m benchmarks.explain_hot_queries                # SQLite, 1M rows
+#   DATABASE_URL=postgresql://... python -m benchmarks.explain_hot_queries
+#
+# Use an empty database; the tables are filled with generated data.
+
+import argparse
+import json
+import random
+import sys
+import time as time_module
+from datetime import datetime, time, timedelta, timezone
+from types import SimpleNamespace
+
+import benchmarks.common  # noqa: F401  (sets the default environment)
+
+HOT_TABLES = {"users", "medications", "appointments", "emergency_contacts", "notification_outbox"}
+# Scanning a partial index reads only the rows matching its condition, not the table
+PARTIAL_INDEXES = {"ix_medications_dose_schedule", "ix_notification_outbox_pending_due"}
+
+
+def seed(engine, rows, chunk_size=50000):
+    """Inserts generated rows with Core executemany, in chunks."""
+    from app.db import models
+    from app.utils.reminder_slots import SLOTS_PER_DAY
+
+    rng = random.Random(42)
+    user_count = max(rows // 10, 1)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    def insert(table, make_row, count):
+        with engine.begin() as conn:
+            for start in range(0, count, chunk_size):
+                conn.execute(table.insert(), [make_row(i) for i in range(start, min(start + chunk_size, count))])
+
+    started = time_module.perf_counter()
+    insert(models.User.__table__, lambda i: {
+        "id": i + 1, "email": f"user{i + 1}@example.com", "full_name": f"User {i + 1}",
+        "hashed_password": "x", "is_active": rng.random() > 0.02,
+        "reminder_slot": rng.randrange(SLOTS_PER_DAY),
+    }, user_count)
+    insert(models.Medication.__table__, lambda i: {
+        "name": f"Med {i}", "dosage": "1 tablet", "owner_id": rng.randint(1, user_count),
+        "timing_type": "Specific-Time" if i % 3 == 0 else "Meal-Related",
+        "specific_time": time(rng.randrange(24), rng.randrange(0, 60, 5)) if i % 3 == 0 else None,
+        "meal_timing": None if i % 3 == 0 else "After Breakfast",
+        "frequency": "Daily" if i % 4 else "As Needed",
+        "last_taken_at": None if i % 2 else now - timedelta(hours=rng.randrange(72)),
+        "updated_at": now,
+    }, rows)
+    insert(models.Appointment.__table__, lambda i: {
+        "doctor_name": f"Doctor {i % 500}", "owner_id": rng.randint(1, user_count),
+        "appointment_datetime": now + timedelta(minutes=rng.randrange(-525600, 525600)),
+    }, rows)
+    insert(models.EmergencyContact.__table__, lambda i: {
+        "contact_name": f"Contact {i}", "phone_number": "5550100", "owner_id": rng.randint(1, user_count),
+    }, rows // 5)
+    insert(models.NotificationOutbox.__table__, lambda i: {
+        "channel": ("email", "in_app")[i % 2], "kind": "daily_reminder", "user_id": i % user_count + 1,
+        "recipient": f"user{i % user_count + 1}@example.com" if i % 2 == 0 else str(i % user_count + 1),
+        "subject": "s", "html_content": "h", "text_content": "t",
+        # Mostly delivered history, a few still pending
+        "status": "pending" if i % 100 == 0 else "sent", "attempts": 1,
+        "next_attempt_at": now - timedelta(minutes=rng.randrange(600)), "created_at": now,
+    }, rows // 2)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("ANALYZE")
+    print(f"Seeded {rows} medications/appointments for {user_count} users in {time_module.perf_counter() - started:.1f}s")
+
+
+def hot_paths(db, user):
+    """The code paths to check, as (name, callable) pairs."""
+    from app.api.v1.endpoints import dashboard
+    from app.core.config import settings
+    from app.crud import crud_appointment, crud_contact, crud_medication, crud_notification, crud_outbox, crud_user
+    from app.utils.dose_reminders import DoseReminderEngine
+    from app.utils.scheduler import iter_reminder_batches
+
+    today_start = datetime.combine(datetime.now().date(), time.min)
+    today_end = datetime.combine(datetime.now().date(), time.max)
+    page_size = settings.PAGE_SIZE_DEFAULT + 1
+    return [
+        ("login: user by email", lambda: crud_user.get_user_by_email(db, email=user.email)),
+        ("medications page", lambda: crud_medication.get_medications_by_user(
+            db, owner_id=user.id, limit=page_size, after_id=1,
+        )),
+        ("appointments page", lambda: crud_appointment.get_appointments_by_user(
+            db, owner_id=user.id, limit=page_size, after=(datetime.now(), 1 << 30),
+        )),
+        ("upcoming appointments page", lambda: crud_appointment.get_appointments_by_user(
+            db, owner_id=user.id, limit=page_size, start=datetime.now(), ascending=True,
+        )),
+        ("contacts page", lambda: crud_contact.get_contacts_by_user(db, owner_id=user.id, limit=page_size, after_id=1)),
+        ("dashboard", lambda: dashboard.get_dashboard_data(db=db, current_user=user)),
+        ("daily reminders page", lambda: next(iter_reminder_batches(
+            db, today_start, today_end, settings.REMINDER_BATCH_SIZE,
+            slot=user.reminder_slot, tz_name=settings.DEFAULT_TIMEZONE,
+        ), None)),
+        ("outbox claim", lambda: crud_outbox.claim_due(
+            db, "email", limit=settings.NOTIFY_EMAIL_BATCH_SIZE, lease_seconds=settings.OUTBOX_LEASE_SECONDS,
+        )),
+        ("in-app inbox page", lambda: crud_notification.get_inbox(db, user_id=user.id, limit=page_size)),
+        ("dose engine load", lambda: DoseReminderEngine().load(db)),
+    ]
+
+
+def full_scans(conn, statement, parameters):
+    """EXPLAINs one statement and returns (plan lines, full scans of hot tables)."""
+    if conn.dialect.name == "sqlite":
+        plan = [row[3] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)]
+        # "SCAN t" is a full table scan; "SEARCH t USING INDEX ..." is not
+        scans = [
+            line for line in plan
+            if line.split(" ")[0] == "SCAN" and line.split(" ")[1] in HOT_TABLES
+            and not any(f"INDEX {index}" in line for index in PARTIAL_INDEXES)
+        ]
+        return plan, scans
+    (document,) = conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters).one()
+    if isinstance(document, str):
+        document = json.loads(document)
+    plan, scans = [], []
+
+    def walk(node, depth=0):
+        line = f"{'  ' * depth}{node['Node Type']} {node.get('Relation Name', '')} {node.get('Index Name', '')}".rstrip()
+        plan.append(line)
+        if node["Node Type"] == "Seq Scan" and node.get("Relation Name") in HOT_TABLES:
+            scans.append(line.strip())
+        for child in node.get("Plans", []):
+            walk(child, depth + 1)
+
+    walk(document[0]["Plan"])
+    return plan, scans
+
+
+def main():
+    parser = argparse.ArgumentParser(description="EXPLAIN the hot queries at scale")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    from sqlalchemy import event
+    from app.db import models
+    from app.db.database import SessionLocal, engine
+    from app.db.migrations import upgrade_to_head
+
+    upgrade_to_head()
+    seed(engine, args.rows)
+
+    db = SessionLocal()
+    db_user = db.get(models.User, 1)
+    user = SimpleNamespace(
+        id=db_user.id, email=db_user.email, full_name=db_user.full_name, reminder_slot=db_user.reminder_slot,
+        timezone=db_user.timezone,
+    )
+
+    captured = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, parameters, context, executemany: captured.append((statement, parameters)))
+
+    failures = 0
+    for name, run in hot_paths(db, user):
+        captured.clear()
+        run()
+        db.rollback()
+        statements = [(s, p) for s, p in captured if s.lstrip().upper().startswith(("SELECT", "WITH"))]
+        print(f"\n== {name}")
+        for statement, parameters in statements:
+            with engine.connect() as conn:
+                plan, scans = full_scans(conn, statement, parameters)
+            for line in plan:
+                print(f"   {line}")
+            if scans:
+                failures += 1
+                print(f"   FULL SCAN: {'; '.join(scans)}")
+                print(f"   in: {' '.join(statement.split())}")
+    db.close()
+
+    print()
+    if failures:
+        print(f"FAILED: {failures} hot statement(s) use a full table scan")
+        sys.exit(1)
+    print("OK: no hot statement uses a full table scan")
+
+
+if __name__ == "__main__":
+    main()
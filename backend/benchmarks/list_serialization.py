@@ -0,0 +1,117 @@
+# backend/benchmarks/list_serialization.py
+#
+# Compares the default response path (response_model validation + the
+# standard JSON encoder) with the FAST_JSON path on 1k-row lists:
+#   1. in-process: ORM rows -> response bytes, no HTTP
+#   2. over HTTP: GET /medications/ and /appointments/ with limit=1000
+#
+#   python -m benchmarks.list_serialization --rows 1000 --seconds 5
+
+import argparse
+import os
+import time
+from datetime import datetime, time as time_of_day, timedelta
+
+os.environ.setdefault("PAGE_SIZE_MAX", "1000")
+
+from benchmarks.common import create_user, running_server, summarize
+
+
+def seed(email, rows):
+    from app.db import models
+    from app.db.database import SessionLocal
+
+    now = datetime.now()
+    db = SessionLocal()
+    try:
+        owner_id = db.query(models.User.id).filter(models.User.email == email).scalar()
+        db.execute(models.Medication.__table__.insert(), [
+            {"name": f"Medication {i}", "dosage": "500 mg", "owner_id": owner_id, "timing_type": "Specific-Time",
+             "specific_time": time_of_day(i % 24, 0), "frequency": "Daily", "last_taken_at": now, "updated_at": now}
+            for i in range(rows)
+        ])
+        db.execute(models.Appointment.__table__.insert(), [
+            {"doctor_name": f"Doctor {i}", "owner_id": owner_id, "appointment_datetime": now + timedelta(hours=i),
+             "location": "City Clinic, 2nd floor", "purpose": "Routine check-up"}
+            for i in range(rows)
+        ])
+        db.commit()
+        return owner_id
+    finally:
+        db.close()
+
+
+def in_process(owner_id, rows, seconds):
+    """Encodes the same ORM rows both ways and reports lists per second."""
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse
+    from pydantic import TypeAdapter
+    from typing import List
+
+    from app.api.fast_json import serializer_for
+    from app.crud import crud_appointment, crud_medication
+    from app.db.database import SessionLocal
+    from app.schemas import appointment as appointment_schema, medication as medication_schema
+
+    db = SessionLocal()
+    try:
+        cases = [
+            ("medications", crud_medication.get_medications_by_user(db, owner_id=owner_id, limit=rows), medication_schema.Medication),
+            ("appointments", crud_appointment.get_appointments_by_user(db, owner_id=owner_id, limit=rows), appointment_schema.Appointment),
+        ]
+        for name, orm_rows, schema in cases:
+            adapter = TypeAdapter(List[schema])
+
+            def default_path():
+                # What FastAPI does with a response_model: validate, dump, encode
+                validated = adapter.validate_python(orm_rows, from_attributes=True)
+                return JSONResponse(jsonable_encoder(adapter.dump_python(validated, mode="json"))).body
+
+            fast_path = lambda: serializer_for(schema).dumps(orm_rows)
+            for label, encode in (("default", default_path), ("fast_json", fast_path)):
+                count, deadline = 0, time.perf_counter() + seconds
+                while time.perf_counter() < deadline:
+                    encode()
+                    count += 1
+                print(f"in-process {name} x{len(orm_rows)} {label}: {count / seconds:.1f} lists/s")
+    finally:
+        db.close()
+
+
+def over_http(base_url, headers, rows, seconds):
+    import httpx
+    from app.core.config import settings
+
+    with httpx.Client(base_url=base_url, headers=headers, timeout=30) as client:
+        for path in ("/api/v1/medications/", "/api/v1/appointments/"):
+            for fast in (False, True):
+                settings.FAST_JSON = fast
+                latencies, deadline = [], time.perf_counter() + seconds
+                while time.perf_counter() < deadline:
+                    started = time.perf_counter()
+                    response = client.get(path, params={"limit": rows})
+                    response.raise_for_status()
+                    latencies.append((time.perf_counter() - started) * 1000)
+                label = "fast_json" if fast else "default"
+                print(f"HTTP {path} x{len(response.json())} {label}: {len(latencies) / seconds:.1f} req/s")
+                summarize(f"  {label}", latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="List serialization throughput")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--seconds", type=float, default=5)
+    args = parser.parse_args()
+
+    import httpx
+
+    with running_server() as base_url:
+        with httpx.Client(base_url=base_url) as client:
+            headers = create_user(client, "lists@example.com")
+        owner_id = seed("lists@example.com", args.rows)
+        in_process(owner_id, args.rows, args.seconds)
+        over_http(base_url, headers, args.rows, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
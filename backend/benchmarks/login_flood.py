@@ -0,0 +1,73 @@
+# backend/benchmarks/login_flood.py
+#
+# Floods the login endpoint while measuring an unrelated endpoint (/users/me).
+# Shows login throughput, how many logins were shed with 503, and the p99 of
+# the unrelated endpoint. Compare runs with different PASSWORD_HASH_WORKERS /
+# PASSWORD_HASH_MAX_PENDING settings, e.g.
+#
+#   python -m benchmarks.login_flood --seconds 10 --login-clients 64
+
+import argparse
+import threading
+import time
+from collections import Counter
+
+from benchmarks.common import create_user, running_server, summarize
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--login-clients", type=int, default=64)
+    parser.add_argument("--probe-clients", type=int, default=4)
+    args = parser.parse_args()
+
+    import httpx
+
+    with running_server() as base_url:
+        with httpx.Client(base_url=base_url) as client:
+            headers = create_user(client, "flood@example.com")
+
+        deadline = time.monotonic() + args.seconds
+        statuses = Counter()
+        login_ms, probe_ms = [], []
+        lock = threading.Lock()
+
+        def login_worker():
+            with httpx.Client(base_url=base_url, timeout=30) as client:
+                while time.monotonic() < deadline:
+                    started = time.perf_counter()
+                    response = client.post(
+                        "/api/v1/auth/login/access-token",
+                        data={"username": "flood@example.com", "password": "benchmark-password"},
+                    )
+                    elapsed = (time.perf_counter() - started) * 1000
+                    with lock:
+                        statuses[response.status_code] += 1
+                        if response.status_code == 200:
+                            login_ms.append(elapsed)
+
+        def probe_worker():
+            with httpx.Client(base_url=base_url, timeout=30, headers=headers) as client:
+                while time.monotonic() < deadline:
+                    started = time.perf_counter()
+                    client.get("/api/v1/users/me").raise_for_status()
+                    with lock:
+                        probe_ms.append((time.perf_counter() - started) * 1000)
+                    time.sleep(0.01)
+
+        threads = [threading.Thread(target=login_worker) for _ in range(args.login_clients)]
+        threads += [threading.Thread(target=probe_worker) for _ in range(args.probe_clients)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    print(f"login status codes: {dict(statuses)}")
+    print(f"successful logins/s: {statuses[200] / args.seconds:.1f}")
+    summarize("login (200 only)", login_ms)
+    summarize("GET /users/me during flood", probe_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# backend/benchmarks/sos_fanout.py
+#
+# Measures SOS fan-out latency for 10 and 100 emergency contacts. Every
+# contact is reached over stand-ins for the SOS_CHANNELS channels, with
+# their configured rate limits, whose provider latency is drawn around
+# --latency-ms (with --slow-pct percent of calls taking several times
+# longer). Concurrency, acknowledgements and budget default to the SOS_*
+# settings, so the numbers describe the configured deployment. Reports
+#   1. time to the response (first --min-acks acknowledgements)
+#   2. time until every delivery has finished
+#   3. what sending one at a time would have taken
+#
+#   python -m benchmarks.sos_fanout --runs 20 --latency-ms 80
+
+import argparse
+import asyncio
+import contextlib
+import io
+import random
+import threading
+import time
+from types import SimpleNamespace
+
+from benchmarks.common import summarize
+
+
+def make_channels(latency_ms, slow_pct, rng):
+    from app.core.config import settings
+    from app.utils.channels import Channel, get_channel
+
+    class JitteredChannel(Channel):
+        """A stand-in provider whose every call takes a different, sometimes much longer, time."""
+
+        def __init__(self, real):
+            super().__init__(batch_size=1, concurrency=real.concurrency, rate_per_second=real.limiter.rate)
+            self.name = real.name
+            self.real = real
+            self.spent = 0.0
+            self._lock = threading.Lock()
+
+        def address(self, recipient):
+            return self.real.address(recipient)
+
+        def send(self, notifications):
+            with self._lock:
+                delay = rng.uniform(0.5, 1.5) * latency_ms / 1000
+                if rng.random() * 100 < slow_pct:
+                    delay *= 10
+                self.spent += delay
+            time.sleep(delay)
+
+    names = [name.strip() for name in settings.SOS_CHANNELS.split(",")]
+    return [JitteredChannel(get_channel(name)) for name in names if get_channel(name)]
+
+
+async def one_run(sos, channels, contacts, args, wait_for_all):
+    for channel in channels:
+        channel.spent = 0.0
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = await sos.fan_out(
+            contacts, "SOS", "benchmark", budget=args.budget,
+            min_acks=len(contacts) * len(channels) if wait_for_all else args.min_acks,
+            channels=channels,
+        )
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    return elapsed_ms, result, sum(channel.spent for channel in channels) * 1000
+
+
+async def bench(count, args):
+    from app.core.config import settings
+    from app.utils import sos
+
+    settings.SOS_CONCURRENCY = args.concurrency
+    rng = random.Random(count)
+    channels = make_channels(args.latency_ms, args.slow_pct, rng)
+    contacts = [SimpleNamespace(id=i, email=f"c{i}@example.com", phone_number=f"+1555{i:07d}") for i in range(count)]
+    first, complete, sequential = [], [], []
+    for _ in range(args.runs):
+        elapsed_ms, result, _ = await one_run(sos, channels, contacts, args, wait_for_all=False)
+        first.append(elapsed_ms)
+        elapsed_ms, result, spent_ms = await one_run(sos, channels, contacts, args, wait_for_all=True)
+        complete.append(elapsed_ms)
+        sequential.append(spent_ms)
+    deliveries = len(result["deliveries"])
+    summarize(f"{count} contacts ({deliveries} deliveries): response after {args.min_acks} ack(s)", first)
+    summarize(f"{count} contacts ({deliveries} deliveries): every delivery done", complete)
+    summarize(f"{count} contacts ({deliveries} deliveries): one at a time (sum of send times)", sequential)
+
+
+def main():
+    from app.core.config import settings
+
+    parser = argparse.ArgumentParser(description="SOS fan-out latency")
+    parser.add_argument("--contacts", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=80)
+    parser.add_argument("--slow-pct", type=float, default=5)
+    parser.add_argument("--min-acks", type=int, default=settings.SOS_MIN_ACKS)
+    parser.add_argument("--budget", type=float, default=settings.SOS_LATENCY_BUDGET_SECONDS)
+    parser.add_argument("--concurrency", type=int, default=settings.SOS_CONCURRENCY,
+                        help="SOS calls in flight per channel (SOS_CONCURRENCY)")
+    args = parser.parse_args()
+
+    for count in args.contacts:
+        asyncio.run(bench(count, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# backend/tests/conftest.py
+#
+# Runs the tests against a throwaway SQLite database migrated to head.
+# The environment is set before anything imports app.core.config.
+
+import os
+import tempfile
+
+import pytest
+
+_db_dir = tempfile.mkdtemp(prefix="medtrack-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/test.db"
+os.environ["SECRET_KEY"] = "test-secret"
+os.environ["MAIL_USERNAME"] = "test"
+os.environ["MAIL_PASSWORD"] = "test"
+os.environ["MAIL_FROM"] = "test@example.com"
+os.environ["MAIL_SERVER"] = ""
+os.environ["MAIL_PORT"] = "25"
+os.environ["FRONTEND_URL"] = "http://localhost:8501"
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def migrated_database():
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "alembic"))
+    command.upgrade(config, "head")
+
+
+@pytest.fixture
+def db():
+    """A session on the test database; every table is emptied afterwards."""
+    from app.db import models
+    from app.db.database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.rollback()
+        for table in reversed(models.Base.metadata.sorted_tables):
+            session.execute(table.delete())
+        session.commit()
+        session.close()
+
+
+@pytest.fixture
+def user(db):
+    from app.db import models
+
+    db_user = models.User(email="patient@example.com", full_name="Pat", hashed_password="x", timezone="UTC")
+    db.add(db_user)
+    db.commit()
+    return db_user
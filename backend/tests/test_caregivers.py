@@ -0,0 +1,20 @@
+# backend/tests/test_caregivers.py
+
+from app.api.v1.endpoints import caregivers
+from app.core.config import settings
+from app.crud import crud_caregiver
+from app.db import models
+from app.schemas.caregiver import CaregiverLinkCreate
+
+
+def test_reinvite_after_decline_sends_a_new_email(db, user, monkeypatch):
+    # Enables the email channel; nothing is sent, the outbox worker is not running
+    monkeypatch.setattr(settings, "MAIL_SERVER", "smtp.example.com")
+    for _ in range(2):
+        caregivers.add_caregiver(db=db, link_in=CaregiverLinkCreate(caregiver_email="Bob@Example.com"), current_user=user)
+        invite = crud_caregiver.get_pending_invite(db, patient_id=user.id, email="bob@example.com")
+        crud_caregiver.delete_invite(db, invite)
+
+    emails = db.query(models.NotificationOutbox).filter_by(kind="caregiver_invite").all()
+    assert [email.recipient for email in emails] == ["bob@example.com", "bob@example.com"]
+    assert len({email.idempotency_key for email in emails}) == 2
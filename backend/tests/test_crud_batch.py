@@ -0,0 +1,44 @@
+# backend/tests/test_crud_batch.py
+
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.core.config import settings
+from app.crud import crud_batch
+from app.db import models
+from app.db.database import to_async_url
+
+
+def _items(count):
+    return [
+        {"name": f"Medication {i}", "dosage": f"{i} mg", "timing_type": "Morning", "frequency": "Daily"}
+        for i in range(count)
+    ]
+
+
+def _assert_rows_match(rows, items, owner_id):
+    assert len(rows) == len(items)
+    for row, item in zip(rows, items):
+        assert (row.name, row.dosage, row.owner_id) == (item["name"], item["dosage"], owner_id)
+
+
+def test_create_many_returns_each_row_with_its_item(db, user):
+    items = _items(50)
+    rows = crud_batch.create_many(db, models.Medication, user.id, items)
+    _assert_rows_match(rows, items, user.id)
+
+
+def test_create_many_async_returns_each_row_with_its_item(db, user):
+    items = _items(50)
+
+    async def create():
+        engine = create_async_engine(to_async_url(settings.DATABASE_URL))
+        try:
+            async with AsyncSession(engine) as session:
+                return await crud_batch.create_many_async(session, models.Medication, user.id, items)
+        finally:
+            await engine.dispose()
+
+    rows = asyncio.run(create())
+    _assert_rows_match(rows, items, user.id)
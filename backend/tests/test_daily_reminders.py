@@ -0,0 +1,27 @@
+# backend/tests/test_daily_reminders.py
+
+from datetime import datetime, time, timezone
+
+from app.core.config import settings
+from app.db import models
+from app.utils import scheduler
+from app.utils.reminder_slots import compute_reminder_slot
+
+
+def test_catches_up_on_slots_missed_without_a_leader(db, user, monkeypatch):
+    monkeypatch.setattr(settings, "MAIL_SERVER", "smtp.example.com")
+    user.reminder_time = time(8, 0)
+    user.reminder_slot = compute_reminder_slot("UTC", time(8, 0))
+    db.add(models.Medication(name="Metformin", dosage="500 mg", timing_type="Morning", frequency="Daily", owner_id=user.id))
+    # The last leader finished 07:50 and the next run is 08:15, so the 08:00 slot was never run
+    db.add(models.ReminderRun(job="daily-reminders-0/1", slot_start=datetime(2026, 10, 18, 7, 50, tzinfo=timezone.utc)))
+    db.commit()
+    monkeypatch.setattr(scheduler, "slot_start", lambda: datetime(2026, 10, 18, 8, 15, tzinfo=timezone.utc))
+
+    scheduler.send_daily_reminders()
+
+    db.expire_all()
+    digests = db.query(models.NotificationOutbox).filter_by(kind="daily_reminder", channel="email").all()
+    assert [digest.idempotency_key for digest in digests] == [f"daily-reminder:{user.id}:2026-10-18"]
+    run = db.get(models.ReminderRun, "daily-reminders-0/1")
+    assert run.slot_start.replace(tzinfo=timezone.utc) == datetime(2026, 10, 18, 8, 15, tzinfo=timezone.utc)
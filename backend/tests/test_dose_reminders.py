@@ -0,0 +1,58 @@
+# backend/tests/test_dose_reminders.py
+
+from datetime import time
+
+from app.db import models
+from app.db.database import SessionLocal
+from app.utils import dose_reminders
+from app.utils.dose_reminders import DoseReminderEngine
+
+
+def _timed_medication(db, owner_id):
+    med = models.Medication(
+        name="Metformin", dosage="500 mg", timing_type="Specific-Time",
+        specific_time=time(9, 0), frequency="Daily", owner_id=owner_id,
+    )
+    db.add(med)
+    db.commit()
+    return med
+
+
+def _tick_at(engine, monkeypatch, now):
+    monkeypatch.setattr(dose_reminders.time_module, "time", lambda: now)
+    # Pretend the previous tick was a minute ago, so this one refreshes instead of reloading
+    engine._last_tick = now - 60
+    engine.tick()
+
+
+def test_forgets_medication_deleted_by_another_worker(db, user, monkeypatch):
+    kept = _timed_medication(db, user.id)
+    deleted = _timed_medication(db, user.id)
+    engine = DoseReminderEngine()
+    engine.tick()
+    assert {kept.id, deleted.id} <= set(engine._schedule)
+
+    # Deleted straight in the database, as another process would: no engine hook runs
+    other = SessionLocal()
+    other.query(models.Medication).filter(models.Medication.id == deleted.id).delete()
+    other.commit()
+    other.close()
+
+    due_at = max(entry[0] for entry in engine._heap)
+    _tick_at(engine, monkeypatch, due_at + 1)
+
+    assert deleted.id not in engine._schedule
+    assert kept.id in engine._schedule
+    assert db.query(models.NotificationOutbox).filter(models.NotificationOutbox.kind == "dose_reminder").count() >= 1
+
+
+def test_forgets_medication_of_deactivated_user(db, user, monkeypatch):
+    med = _timed_medication(db, user.id)
+    engine = DoseReminderEngine()
+    engine.tick()
+    user.is_active = False
+    db.commit()
+
+    _tick_at(engine, monkeypatch, engine._heap[0][0] + 1)
+
+    assert med.id not in engine._schedule
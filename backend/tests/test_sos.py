@@ -0,0 +1,48 @@
+# backend/tests/test_sos.py
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+from app.utils import sos
+from app.utils.channels import Channel, RateLimiter
+
+
+class BlockingChannel(Channel):
+    """Sends block until `release` is set, except priority sends."""
+    name = "blocking"
+
+    def __init__(self):
+        super().__init__(batch_size=1, concurrency=1, rate_per_second=1)
+        self.release = threading.Event()
+
+    def address(self, recipient):
+        return recipient["email"]
+
+    def send(self, notifications):
+        self.release.wait(5)
+
+    def send_priority(self, notifications):
+        pass
+
+
+def test_priority_acquire_does_not_wait_for_an_empty_bucket():
+    limiter = RateLimiter(rate=0.01)
+    limiter.acquire()
+    limiter.acquire(priority=True)
+    assert limiter._tokens < 0
+
+
+def test_sos_is_not_held_up_by_bulk_deliveries():
+    channel = BlockingChannel()
+    channel.limiter.acquire()
+    bulk = threading.Thread(target=channel.deliver, args=([SimpleNamespace()],))
+    bulk.start()
+    try:
+        contact = SimpleNamespace(id=1, email="c@example.com", phone_number=None)
+        result = asyncio.run(sos.fan_out([contact], "SOS", "help", budget=2, channels=[channel]))
+        assert result["acknowledged"] == 1
+        assert result["elapsed_ms"] < 1000
+    finally:
+        channel.release.set()
+        bulk.join()
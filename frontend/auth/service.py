@@ -35,12 +35,21 @@ def get_dashboard_data(token: str) -> tuple[bool, dict | str]:
         else: return False, response.json().get("detail", "Authentication failed.")
     except: return False, "Server communication error."
 
-def get_medications(token: str) -> tuple[bool, List[Dict[str, Any]] | str]:
+def _get_page(url: str, headers: dict, cursor: str | None) -> tuple[requests.Response, str | None]:
+    """
+    GETs one page of a paginated list endpoint (the first one without a cursor).
+    Returns the response and the cursor of the next page, None on the last page.
+    """
+    params = {"cursor": cursor} if cursor else {}
+    response = requests.get(url, headers=headers, params=params)
+    return response, response.headers.get("X-Next-Cursor")
+
+def get_medications(token: str, cursor: str | None = None) -> tuple[bool, tuple[List[Dict[str, Any]], str | None] | str]:
     url = f"{BASE_URL}/medications/"
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200: return True, response.json()
+        response, next_cursor = _get_page(url, headers, cursor)
+        if response.status_code == 200: return True, (response.json(), next_cursor)
         else: return False, response.json().get("detail", "Failed to fetch medications.")
     except: return False, "Server communication error."
 
@@ -73,12 +82,12 @@ def mark_medication_as_taken(token: str, med_id: int) -> tuple[bool, str]:
         else: return False, response.json().get("detail", "Failed to mark as taken.")
     except: return False, "Server communication error."
 
-def get_appointments(token: str) -> tuple[bool, List[Dict[str, Any]] | str]:
+def get_appointments(token: str, cursor: str | None = None) -> tuple[bool, tuple[List[Dict[str, Any]], str | None] | str]:
     url = f"{BASE_URL}/appointments/"
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200: return True, response.json()
+        response, next_cursor = _get_page(url, headers, cursor)
+        if response.status_code == 200: return True, (response.json(), next_cursor)
         else: return False, response.json().get("detail", "Failed to fetch appointments.")
     except: return False, "Server communication error."
 
@@ -103,12 +112,12 @@ def delete_appointment(token: str, appt_id: int) -> tuple[bool, str]:
         else: return False, response.json().get("detail", "Failed to delete appointment.")
     except: return False, "Server communication error."
 
-def get_contacts(token: str) -> tuple[bool, List[Dict[str, Any]] | str]:
+def get_contacts(token: str, cursor: str | None = None) -> tuple[bool, tuple[List[Dict[str, Any]], str | None] | str]:
     url = f"{BASE_URL}/contacts/"
     headers = {"Authorization": f"Bearer {token}"}
     try:
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200: return True, response.json()
+        response, next_cursor = _get_page(url, headers, cursor)
+        if response.status_code == 200: return True, (response.json(), next_cursor)
         else: return False, response.json().get("detail", "Failed to fetch contacts.")
     except: return False, "Server communication error."
 
@@ -0,0 +1,36 @@
+# frontend/components/pager.py
+
+import streamlit as st
+
+def _cursors(key: str) -> list:
+    # Cursor of every page from the first (None) to the one being shown
+    return st.session_state.setdefault(f"{key}_page_cursors", [None])
+
+def current_cursor(key: str) -> str | None:
+    """Cursor of the page of list `key` being shown (None for the first page)."""
+    return _cursors(key)[-1]
+
+def page_controls(key: str, rows: list, next_cursor: str | None):
+    """
+    Previous / Next buttons for a cursor-paginated list. Only the page being
+    shown is fetched; Next moves to `next_cursor`, Previous back to the page
+    before. A page left empty (e.g. its last row was deleted) steps back.
+    """
+    cursors = _cursors(key)
+    if not rows and len(cursors) > 1:
+        cursors.pop()
+        st.rerun()
+    if len(cursors) == 1 and not next_cursor:
+        return
+
+    col_prev, col_page, col_next = st.columns([1, 2, 1])
+    with col_prev:
+        if st.button("← Previous", key=f"{key}_prev_page", disabled=len(cursors) == 1, use_container_width=True):
+            cursors.pop()
+            st.rerun()
+    with col_page:
+        st.caption(f"Page {len(cursors)}")
+    with col_next:
+        if st.button("Next →", key=f"{key}_next_page", disabled=not next_cursor, use_container_width=True):
+            cursors.append(next_cursor)
+            st.rerun()
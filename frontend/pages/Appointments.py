@@ -8,6 +8,7 @@ from datetime import datetime, time, date
 # Import ALL necessary functions, including delete_appointment
 from auth.service import TOKEN_COOKIE_NAME, get_appointments, add_appointment, delete_appointment
 from components.sidebar import authenticated_sidebar
+from components.pager import current_cursor, page_controls
 
 # --- PAGE CONFIGURATION ---
 st.set_page_config(page_title="My Appointments", page_icon="🗓️", layout="wide")
@@ -70,11 +71,13 @@ st.markdown("---")
 # --- DISPLAY EXISTING APPOINTMENTS ---
 st.header("Your Upcoming Appointments")
 
-is_success, data = get_appointments(token)
+is_success, data = get_appointments(token, current_cursor("appointments"))
 
 if not is_success:
     st.error(f"Could not load appointments: {data}")
 else:
+    data, next_cursor = data
+    page_controls("appointments", data, next_cursor)
     if not data:
         st.info("You have not added any appointments yet. Use the form above to add one.")
     else:
@@ -5,6 +5,7 @@ from streamlit_cookies_manager import CookieManager
 
 from auth.service import TOKEN_COOKIE_NAME, get_contacts, add_contact, delete_contact
 from components.sidebar import authenticated_sidebar
+from components.pager import current_cursor, page_controls
 
 # --- PAGE CONFIGURATION ---
 st.set_page_config(page_title="Emergency Contacts", page_icon="📞", layout="wide")
@@ -56,11 +57,13 @@ st.markdown("---")
 # --- DISPLAY EXISTING CONTACTS ---
 st.header("Your Contact List")
 
-is_success, data = get_contacts(token)
+is_success, data = get_contacts(token, current_cursor("contacts"))
 
 if not is_success:
     st.error(f"Could not load contacts: {data}")
 else:
+    data, next_cursor = data
+    page_controls("contacts", data, next_cursor)
     if not data:
         st.info("You have not added any contacts yet. Use the form above to add one.")
     else:
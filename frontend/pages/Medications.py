@@ -10,6 +10,7 @@ from auth.service import (
     delete_medication, mark_medication_as_taken
 )
 from components.sidebar import authenticated_sidebar
+from components.pager import current_cursor, page_controls
 
 # --- PAGE CONFIGURATION ---
 st.set_page_config(page_title="My Medications", page_icon="💊", layout="wide")
@@ -70,11 +71,13 @@ st.markdown("---")
 # --- DISPLAY EXISTING MEDICATIONS ---
 st.header("Your Medication List")
 
-is_success, data = get_medications(token)
+is_success, data = get_medications(token, current_cursor("medications"))
 
 if not is_success:
     st.error(f"Could not load medications: {data}")
 else:
+    data, next_cursor = data
+    page_controls("medications", data, next_cursor)
     if not data:
         st.info("You haven't added any medications yet.")
     else: